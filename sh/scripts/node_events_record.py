@@ -0,0 +1,72 @@
+import argparse
+
+from stests.chain import stream_events_replay
+from stests.core.utils import args_validator
+from stests.core.utils import env
+from arg_utils import get_network_node
+
+
+
+# CLI argument parser.
+ARGS = argparse.ArgumentParser("Records a node's event stream to a gzipped file of JSON lines for subsequent replay.")
+
+# CLI argument: network name.
+ARGS.add_argument(
+    "--net",
+    default=env.get_network_name(),
+    dest="network",
+    help="Network name {type}{id}, e.g. nctl1.",
+    type=args_validator.validate_network,
+    )
+
+# CLI argument: node index.
+ARGS.add_argument(
+    "--node",
+    default=1,
+    dest="node",
+    help="Node index, e.g. 1.",
+    type=args_validator.validate_node_index
+    )
+
+# CLI argument: output file.
+ARGS.add_argument(
+    "--out",
+    dest="fpath",
+    help="Path to file to which events will be recorded, e.g. events.jsonl.gz.",
+    type=str,
+    required=True,
+    )
+
+# CLI argument: max events.
+ARGS.add_argument(
+    "--count",
+    default=None,
+    dest="max_events",
+    help="Number of events after which to stop recording.",
+    type=int
+    )
+
+# CLI argument: max duration.
+ARGS.add_argument(
+    "--seconds",
+    default=None,
+    dest="max_seconds",
+    help="Duration (seconds) after which to stop recording.",
+    type=float
+    )
+
+
+def main(args):
+    """Entry point.
+
+    :param args: Parsed CLI arguments.
+
+    """
+    _, node = get_network_node(args)
+    count = stream_events_replay.record(node, args.fpath, max_events=args.max_events, max_seconds=args.max_seconds)
+    print(f"{count} events recorded to {args.fpath}")
+
+
+# Entry point.
+if __name__ == '__main__':
+    main(ARGS.parse_args())
@@ -0,0 +1,56 @@
+import argparse
+import threading
+
+from stests.chain import stream_events_replay
+
+
+
+# CLI argument parser.
+ARGS = argparse.ArgumentParser("Replays a recorded node event stream over a local HTTP/SSE server.")
+
+# CLI argument: input file.
+ARGS.add_argument(
+    "--in",
+    dest="fpath",
+    help="Path to file to which events were recorded, e.g. events.jsonl.gz.",
+    type=str,
+    required=True,
+    )
+
+# CLI argument: port.
+ARGS.add_argument(
+    "--port",
+    default=18101,
+    dest="port",
+    help="Port upon which to serve events (/events) & JSON-RPC queries (/rpc).",
+    type=int
+    )
+
+# CLI argument: replay speed.
+ARGS.add_argument(
+    "--speed",
+    default=1.0,
+    dest="speed",
+    help="Replay speed multiplier, e.g. 1 | 10 - 0 replays at maximum speed.",
+    type=float
+    )
+
+
+def main(args):
+    """Entry point.
+
+    :param args: Parsed CLI arguments.
+
+    """
+    server = stream_events_replay.ReplayServer(stream_events_replay.read(args.fpath), args.speed)
+    port = server.start(port=args.port)
+    print(f"replaying {len(server.events)} events :: http://127.0.0.1:{port}/events")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.stop()
+
+
+# Entry point.
+if __name__ == '__main__':
+    main(ARGS.parse_args())
@@ -8,7 +8,13 @@ from stests.core.utils import args_validator
 from stests.core.utils import cli as utils
 from stests.core.utils import env
 from stests.core.types.infra import Node
-from sh.scripts.arg_utils import get_network_node
+from sh.scripts.arg_utils import get_network
+from sh.scripts.svc_utils import add_fan_out_args
+from sh.scripts.svc_utils import get_target_nodes
+from sh.scripts.svc_utils import is_node_healthy
+from sh.scripts.svc_utils import log_results
+from sh.scripts.svc_utils import run_on_nodes
+from sh.scripts.svc_utils import yield_ssh_mux_args
 
 # CLI argument parser.
 ARGS = argparse.ArgumentParser("Executes a systemctl command to the casper-node service on a node.")
@@ -27,8 +33,8 @@ ARGS.add_argument(
     "--node",
     default=1,
     dest="node",
-    help="Node index, e.g. 1.",
-    type=args_validator.validate_node_index
+    help="Node index, e.g. 1 - 0 targets all nodes.",
+    type=args_validator.validate_node_index_optional
     )
 
 # CLI argument: systemctl command.
@@ -59,6 +65,9 @@ ARGS.add_argument(
     type=Path,
     )
 
+# CLI arguments: parallelism, rolling batch size & health check timeout.
+add_fan_out_args(ARGS)
+
 def remote_node_systemctl(
     node: Node,
     ssh_user: str,
@@ -86,6 +95,7 @@ def remote_node_systemctl(
 
     def yield_args():
         yield 'ssh'
+        yield from yield_ssh_mux_args()
         yield f'{ssh_user}@{node.host}'
 
         if ssh_key_path:
@@ -104,15 +114,23 @@ def main(args):
     """
     utils.log(f"Executing `systemctl {args.command}`:")
 
-    _, node = get_network_node(args)
-
-    remote_node_systemctl(
-        node=node,
-        ssh_user=args.ssh_user,
-        command=args.command,
-        ssh_key_path=args.ssh_key_path,
-        check_rc=False,
+    network = get_network(args)
+
+    results = run_on_nodes(
+        get_target_nodes(args),
+        lambda node: remote_node_systemctl(
+            node=node,
+            ssh_user=args.ssh_user,
+            command=args.command,
+            ssh_key_path=args.ssh_key_path,
+            check_rc=False,
+        ),
+        parallelism=args.parallelism,
+        batch_size=args.batch_size,
+        health_check=lambda node: is_node_healthy(network, node) if args.command in ('restart', 'start') else True,
+        health_timeout=args.health_timeout,
     )
+    log_results(results)
 
 # TODO: Just for testing, remove.
 if __name__ == '__main__':
@@ -9,7 +9,12 @@ from stests.core.utils import env
 from stests.core.utils import cli as utils
 from sh.scripts.svc_utils import remote_node_ssh_copy, remote_node_ssh_invoke
 from sh.scripts.svc_utils import remote_node_ssh_rsync
-from sh.scripts.arg_utils import get_network_node
+from sh.scripts.svc_utils import add_fan_out_args
+from sh.scripts.svc_utils import get_target_nodes
+from sh.scripts.svc_utils import is_node_healthy
+from sh.scripts.svc_utils import log_results
+from sh.scripts.svc_utils import run_on_nodes
+from sh.scripts.arg_utils import get_network
 
 class Semver(tp.NamedTuple):
     major: int
@@ -181,8 +186,8 @@ def get_arg_parser() -> argparse.ArgumentParser:
         "--node",
         default=1,
         dest="node",
-        help="Node index, e.g. 1.",
-        type=args_validator.validate_node_index
+        help="Node index, e.g. 1 - 0 targets all nodes.",
+        type=args_validator.validate_node_index_optional
     )
 
     parser.add_argument(
@@ -253,6 +258,8 @@ def get_arg_parser() -> argparse.ArgumentParser:
         type=int,
     )
 
+    add_fan_out_args(parser)
+
     return parser
 
 if __name__ == '__main__':
@@ -260,7 +267,7 @@ if __name__ == '__main__':
 
     args = parser.parse_args()
 
-    _, node = get_network_node(args)
+    network = get_network(args)
 
     # # TODO: For testing, remove once smoke tested.
     # push_update_to_node(
@@ -279,16 +286,24 @@ if __name__ == '__main__':
     #     remote_cfg_repo_dir=pl.Path('/tmp/cfg_tmp'),
     # )
 
-    push_update_to_node(
-        ssh_user=args.ssh_user,
-        ssh_host=node.host,
-        ssh_key_path=args.ssh_key_path,
-        semver=args.semver,
-        local_bin_repo_dir=args.local_bin_repo,
-        local_cfg_repo_dir=args.local_cfg_repo,
-        activation_era=args.activation_era,
-        public_address=None,
-        public_port=35000,
-        remote_bin_repo_dir=pl.Path('/var/lib/casper/bin'),
-        remote_cfg_repo_dir=pl.Path('/etc/casper'),
+    results = run_on_nodes(
+        get_target_nodes(args),
+        lambda node: push_update_to_node(
+            ssh_user=args.ssh_user,
+            ssh_host=node.host,
+            ssh_key_path=args.ssh_key_path,
+            semver=args.semver,
+            local_bin_repo_dir=args.local_bin_repo,
+            local_cfg_repo_dir=args.local_cfg_repo,
+            activation_era=args.activation_era,
+            public_address=None,
+            public_port=35000,
+            remote_bin_repo_dir=args.remote_bin_repo,
+            remote_cfg_repo_dir=args.remote_cfg_repo,
+        ),
+        parallelism=args.parallelism,
+        batch_size=args.batch_size,
+        health_check=lambda node: is_node_healthy(network, node),
+        health_timeout=args.health_timeout,
     )
+    log_results(results)
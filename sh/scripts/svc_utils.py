@@ -1,21 +1,36 @@
 import argparse
 import enum
 import subprocess
+import time
 import typing as tp
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+from stests import chain
 from stests.core.cache.ops import infra
 from stests.core.utils import args_validator
 from stests.core.utils import cli as utils
 from stests.core.utils import env
+from stests.core.types.infra import Network
 from stests.core.types.infra import Node
 from stests.core.types.infra.enums import NodeStatus
+from sh.scripts.arg_utils import get_network
 from sh.scripts.arg_utils import get_network_node
 
+# SSH connection multiplexing - subsequent commands to a host reuse a single authenticated connection.
+SSH_CONTROL_PATH = '~/.ssh/stests-%C'
+SSH_CONTROL_PERSIST = '60s'
+
 class SvcCommand(str, enum.Enum):
     STOP = 'stop'
     START = 'start'
 
+class NodeResult(tp.NamedTuple):
+    node: Node
+    ok: bool
+    elapsed: float
+    error: tp.Optional[str]=None
+
 def get_healthy_and_down_nodes(network) -> tp.Tuple[tp.List[Node], tp.List[Node]]:
     utils.log(f'Fetching all nodes')
     nodes = infra.get_nodes(network)
@@ -52,8 +67,8 @@ def get_arg_parser(command: SvcCommand) -> argparse.ArgumentParser:
         "--node",
         default=1,
         dest="node",
-        help="Node index, e.g. 1.",
-        type=args_validator.validate_node_index
+        help="Node index, e.g. 1 - 0 targets all nodes.",
+        type=args_validator.validate_node_index_optional
     )
 
     # # CLI argument: systemctl command.
@@ -92,8 +107,174 @@ def get_arg_parser(command: SvcCommand) -> argparse.ArgumentParser:
         help="Run command despite the current status of the node.",
     )
 
+    add_fan_out_args(parser)
+
     return parser
 
+def add_fan_out_args(parser: argparse.ArgumentParser):
+    """Adds CLI arguments controlling execution across a set of nodes.
+
+    :param parser: CLI argument parser.
+
+    """
+    # CLI argument: parallelism.
+    parser.add_argument(
+        "--parallelism",
+        default=8,
+        dest="parallelism",
+        help="Maximum number of nodes upon which to execute concurrently.",
+        type=int,
+    )
+
+    # CLI argument: rolling batch size.
+    parser.add_argument(
+        "--batch-size",
+        default=0,
+        dest="batch_size",
+        help="Rolling mode: number of nodes per batch, each batch must pass health check before the next starts (0 = all at once).",
+        type=int,
+    )
+
+    # CLI argument: health check timeout.
+    parser.add_argument(
+        "--health-timeout",
+        default=120.0,
+        dest="health_timeout",
+        help="Rolling mode: time (seconds) within which a batch's nodes must report healthy.",
+        type=float,
+    )
+
+def get_target_nodes(args) -> tp.List[Node]:
+    """Maps input args to target nodes - node index 0 targets all registered nodes.
+
+    """
+    if args.node == 0:
+        return sorted(infra.get_nodes(get_network(args)), key=lambda i: i.index)
+
+    _, node = get_network_node(args)
+
+    return [node]
+
+def is_node_healthy(network: Network, node: Node) -> bool:
+    """Returns flag indicating whether a node responds to a status query.
+
+    """
+    try:
+        chain.get_node_status(network, node)
+    except Exception:
+        return False
+    else:
+        return True
+
+def yield_ssh_mux_args() -> tp.Iterator[str]:
+    """Yields ssh options multiplexing commands to a host over a single persistent connection.
+
+    """
+    yield '-o'
+    yield 'ControlMaster=auto'
+    yield '-o'
+    yield f'ControlPath={SSH_CONTROL_PATH}'
+    yield '-o'
+    yield f'ControlPersist={SSH_CONTROL_PERSIST}'
+
+def run_on_nodes(
+    nodes: tp.List[Node],
+    action: tp.Callable[[Node], tp.Any],
+    parallelism: int=8,
+    batch_size: int=0,
+    health_check: tp.Callable[[Node], bool]=None,
+    health_timeout: float=120.0,
+    health_interval: float=5.0,
+) -> tp.List[NodeResult]:
+    """Executes an action concurrently across a set of nodes, collecting per node outcome & timing.
+
+    In rolling mode (batch_size > 0) nodes are processed batch by batch: a batch
+    must both succeed and pass the health check before the next batch starts,
+    otherwise remaining nodes are skipped.
+
+    :param nodes: Nodes upon which to execute action.
+    :param action: Callable executed per node - raising an exception signals failure.
+    :param parallelism: Maximum number of nodes upon which to execute concurrently.
+    :param batch_size: Rolling mode: number of nodes per batch (0 = all at once).
+    :param health_check: Rolling mode: callable returning flag indicating whether a node is healthy.
+    :param health_timeout: Rolling mode: time (seconds) within which a batch's nodes must report healthy.
+    :param health_interval: Rolling mode: time (seconds) between health checks.
+
+    :returns: Per node results, in node order.
+
+    """
+    def execute(node: Node) -> NodeResult:
+        started = time.monotonic()
+        try:
+            action(node)
+        except Exception as err:
+            return NodeResult(node, False, time.monotonic() - started, f'{err.__class__.__name__}: {err}')
+        else:
+            return NodeResult(node, True, time.monotonic() - started)
+
+    batch_size = batch_size if batch_size > 0 else max(1, len(nodes))
+    batches = [nodes[i:i + batch_size] for i in range(0, len(nodes), batch_size)]
+
+    results = []
+    with ThreadPoolExecutor(max_workers=max(1, parallelism)) as executor:
+        for idx, batch in enumerate(batches):
+            if len(batches) > 1:
+                utils.log(f'Processing batch {idx + 1} of {len(batches)} :: nodes {[i.index for i in batch]}')
+            batch_results = list(executor.map(execute, batch))
+            if health_check is not None and len(batches) > 1:
+                batch_results = _await_healthy(batch_results, health_check, health_timeout, health_interval)
+            results += batch_results
+
+            # Rolling mode: halt upon batch failure.
+            if idx < len(batches) - 1 and not all(i.ok for i in batch_results):
+                utils.log_warning(f'Batch {idx + 1} failed - skipping remaining batches')
+                results += [NodeResult(i, False, 0.0, 'skipped') for j in batches[idx + 1:] for i in j]
+                break
+
+    return results
+
+def _await_healthy(
+    results: tp.List[NodeResult],
+    health_check: tp.Callable[[Node], bool],
+    timeout: float,
+    interval: float,
+) -> tp.List[NodeResult]:
+    """Awaits nodes reporting healthy, marking those not doing so within timeout as failed.
+
+    """
+    pending = {i.node.index for i in results if i.ok}
+    started = time.monotonic()
+    while pending:
+        with ThreadPoolExecutor(max_workers=len(pending)) as executor:
+            nodes = [i.node for i in results if i.node.index in pending]
+            pending -= {node.index for node, ok in zip(nodes, executor.map(health_check, nodes)) if ok}
+        if not pending or time.monotonic() - started >= timeout:
+            break
+        time.sleep(interval)
+
+    return [
+        i._replace(ok=False, error=f'unhealthy after {timeout}s') if i.node.index in pending else i
+        for i in results
+    ]
+
+def log_results(results: tp.List[NodeResult]):
+    """Renders per node results.
+
+    """
+    cols = ["Node", "Host", "Status", "Elapsed (s)", "Error"]
+    rows = [
+        (
+            i.node.index,
+            i.node.host,
+            'OK' if i.ok else 'SKIPPED' if i.error == 'skipped' else 'FAILED',
+            format(i.elapsed, '.2f'),
+            i.error or '--',
+        )
+        for i in results
+    ]
+    print(utils.get_table(cols, rows))
+    utils.log(f'{len([i for i in results if i.ok])} of {len(results)} node(s) succeeded')
+
 def remote_node_ssh_invoke(
     ssh_user: str,
     ssh_host: str,
@@ -106,6 +287,7 @@ def remote_node_ssh_invoke(
         utils.log(f'Making SSH connection as identity: {identity}')
 
         yield 'ssh'
+        yield from yield_ssh_mux_args()
         yield identity
 
         if ssh_key_path:
@@ -142,12 +324,13 @@ def remote_node_ssh_rsync(
             utils.log('Using `sudo` on remote target')
             yield '--rsync-path="sudo rsync"'
 
+        # With `rsync`, ssh options need to be passed in as a suboption to `ssh`.
+        yield '-e'
         if ssh_key_path:
             utils.log(f'Using SSH key file: {ssh_key_path}')
-
-            # With `rsync`, this needs to be passed in as a suboption to `ssh`.
-            yield '-e'
-            yield f'ssh -i {ssh_key_path}'
+            yield ' '.join(['ssh', *yield_ssh_mux_args(), '-i', str(ssh_key_path)])
+        else:
+            yield ' '.join(['ssh', *yield_ssh_mux_args()])
 
         yield source_path
 
@@ -172,6 +355,7 @@ def remote_node_ssh_copy(
         utils.log(f'Making SSH connection as identity: {identity}')
 
         yield 'scp'
+        yield from yield_ssh_mux_args()
         yield '-r'
         # yield '-q'
 
@@ -284,12 +468,20 @@ def common_main(svc_command: SvcCommand):
     parser = get_arg_parser(svc_command)
     args = parser.parse_args()
 
-    _, node = get_network_node(args)
-
-    remote_node_systemctl(
-        node=node,
-        ssh_user=args.ssh_user,
-        command=svc_command,
-        ssh_key_path=args.ssh_key_path,
-        force=args.force,
+    network = get_network(args)
+
+    results = run_on_nodes(
+        get_target_nodes(args),
+        lambda node: remote_node_systemctl(
+            node=node,
+            ssh_user=args.ssh_user,
+            command=svc_command,
+            ssh_key_path=args.ssh_key_path,
+            force=args.force,
+        ),
+        parallelism=args.parallelism,
+        batch_size=args.batch_size,
+        health_check=lambda node: is_node_healthy(network, node) if svc_command is SvcCommand.START else True,
+        health_timeout=args.health_timeout,
     )
+    log_results(results)
@@ -8,6 +8,8 @@ from stests.core.types.orchestration import ExecutionAspect
 from stests.core.utils import args_validator
 from stests.core.utils import cli as utils
 from stests.core.utils import env
+from stests.core.utils import histogram
+from stests.core.utils import timeline
 
 
 
@@ -47,6 +49,8 @@ COLS = [
     ("Phase / Step", BeautifulTable.ALIGN_LEFT),
     ("Deploys", BeautifulTable.ALIGN_RIGHT),
     ("Duration (s)", BeautifulTable.ALIGN_RIGHT),
+    ("Dispatch Rate (/s)", BeautifulTable.ALIGN_RIGHT),
+    ("Finality p50/p90/p99 (s)", BeautifulTable.ALIGN_RIGHT),
     ("Execution Start Time", BeautifulTable.ALIGN_RIGHT),
     ("Execution End Time", BeautifulTable.ALIGN_RIGHT),
     ("Action", BeautifulTable.ALIGN_RIGHT),
@@ -76,10 +80,22 @@ def main(args):
     keys = [f"{i[3]}.{i[5]}" if i[5] != "-" else i[3] for i in keys]
     counts = dict(zip(keys, counts))
 
+    # Set finalisation latency histograms.
+    keys, histograms = cache.orchestration.get_finalization_histogram_list(network_id, args.run_type, args.run_index)
+    keys = [i.split(":") for i in keys]
+    keys = [f"{i[3]}.{i[5]}" if i[5] != "-" else i[3] for i in keys]
+    histograms = dict(zip(keys, histograms))
+
+    # Set dispatch timelines.
+    keys, timelines = cache.orchestration.get_dispatch_timeline_list(network_id, args.run_type, args.run_index)
+    keys = [i.split(":") for i in keys]
+    keys = [f"{i[3]}.{i[5]}" if i[5] != "-" else i[3] for i in keys]
+    timelines = dict(zip(keys, timelines))
+
     # Set table.
     t = utils.get_table(
         [i for i, _ in COLS], 
-        map(lambda i: _get_row(i, counts), data),
+        map(lambda i: _get_row(i, counts, histograms, timelines), data),
         )
     for key, aligmnent in COLS:
         t.column_alignments[key] = aligmnent    
@@ -91,7 +107,27 @@ def main(args):
     print("--------------------------------------------------------------------------------------------------------------------")
 
 
-def _get_row(i, counts):
+def _get_dispatch_rate(slots) -> str:
+    """Returns achieved deploy dispatch rate formatted for display purposes.
+    
+    """
+    if not slots:
+        return "--"
+
+    return format(timeline.get_rate(slots), '.1f')
+
+
+def _get_finality(buckets) -> str:
+    """Returns finalisation latency percentiles formatted for display purposes.
+    
+    """
+    if not buckets:
+        return "--"
+
+    return "/".join(format(i, '.1f') for i in histogram.get_percentiles(buckets).values())
+
+
+def _get_row(i, counts, histograms, timelines):
     """Returns table row data.
     
     """
@@ -99,6 +135,8 @@ def _get_row(i, counts):
         i.label_index,
         counts.get(i.label_index.strip(), 0),
         i.label_tp_elapsed,
+        _get_dispatch_rate(timelines.get(i.label_index.strip())),
+        _get_finality(histograms.get(i.label_index.strip())),
         str(i.ts_start).split(" ")[1],
         "--" if not i.ts_end else str(i.ts_end).split(" ")[1],
         i.step_label if i.step_label else '--',      
@@ -10,6 +10,7 @@ from stests.core.types.orchestration import ExecutionStatus
 from stests.core.utils import args_validator
 from stests.core.utils import cli as utils
 from stests.core.utils import env
+from stests.core.utils import histogram
 
 
 
@@ -50,6 +51,7 @@ COLS = [
     ("Execution End Time", BeautifulTable.ALIGN_LEFT),
     ("Duration (s)", BeautifulTable.ALIGN_RIGHT),
     ("Deploys", BeautifulTable.ALIGN_RIGHT),
+    ("Finality p50/p90/p99 (s)", BeautifulTable.ALIGN_RIGHT),
     ("Status", BeautifulTable.ALIGN_RIGHT),
     ("Current Step", BeautifulTable.ALIGN_RIGHT),
 ]
@@ -87,6 +89,12 @@ def main(args):
     for i in data:
         i.deploy_count = _get_deploy_count(i, counts)
 
+    # Associate info with finalisation latency percentiles.
+    keys, histograms = cache.orchestration.get_finalization_histogram_list(network_id, args.run_type)
+    histograms = dict(zip(keys, histograms))
+    for i in data:
+        i.finality = _get_finality(i, histograms)
+
     # Sort data.
     data = sorted(data, key=lambda i: f"{i.run_type}.{i.label_index}")
 
@@ -129,6 +137,18 @@ def _get_deploy_count(i: ExecutionInfo, counts):
     return "--"
 
 
+def _get_finality(i: ExecutionInfo, histograms):
+    """Returns finalisation latency percentiles of deploys dispatched during course of a run.
+    
+    """
+    key = f"{i.network}:{i.run_type}:{i.label_run_index}:finalization-histogram:-"
+    for histogram_key in histograms:
+        if histogram_key.endswith(key):
+            return "/".join(format(j, '.1f') for j in histogram.get_percentiles(histograms[histogram_key]).values())
+
+    return "--"
+
+
 def _get_row(i, counts):
     """Returns table row data.
     
@@ -142,6 +162,7 @@ def _get_row(i, counts):
         i.ts_end.isoformat()[:-3] if i.ts_end else "--",
         i.label_tp_elapsed,
         i.deploy_count,
+        i.finality,
         i.label_status.strip(),
         "--".rjust(20) if (i.ctx is None or i.ctx.status == ExecutionStatus.COMPLETE) else f"{i.ctx.step_label.rjust(20)}",
     ]
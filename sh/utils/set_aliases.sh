@@ -45,6 +45,8 @@ alias stests-workers-stop=$STESTS_PATH_SH/workers/stop.sh
 # ALIASES: Nodes
 # ###############################################################
 
+alias stests-node-events-record='_exec_cmd $STESTS_PATH_SH_SCRIPTS/node_events_record.py'
+alias stests-node-events-replay='_exec_cmd $STESTS_PATH_SH_SCRIPTS/node_events_replay.py'
 alias stests-node-start='_exec_cmd $STESTS_PATH_SH_SCRIPTS/node_start.py'
 alias stests-node-stop='_exec_cmd $STESTS_PATH_SH_SCRIPTS/node_stop.py'
 alias stests-node-toggle='_exec_cmd $STESTS_PATH_SH_SCRIPTS/node_toggle.py'
@@ -11,6 +11,7 @@ from stests.chain.get_account_main_purse_uref import execute as get_account_main
 from stests.chain.get_auction_info import execute as get_auction_info
 from stests.chain.get_block import execute as get_block
 from stests.chain.get_deploy import execute as get_deploy
+from stests.chain.get_deploys import execute as get_deploys
 from stests.chain.get_state_root_hash import execute as get_state_root_hash
 
 # Node queries.
@@ -28,6 +29,7 @@ from stests.chain.set_transfer_wasm import execute as set_transfer_wasm
 
 # Node events.
 from stests.chain.stream_events import execute as stream_events
+from stests.chain.stream_events_multiplexed import execute as stream_events_multiplexed
 
 # Misc.
 from stests.chain.utils import DeployDispatchInfo
@@ -0,0 +1,225 @@
+import collections
+import datetime
+import re
+import threading
+import time
+import typing
+
+from stests.chain import serialisation
+from stests.chain.serialisation import CLValue
+from stests.chain.utils import DeployDispatchInfo
+from stests.core import crypto
+from stests.core.types.chain import Account
+from stests.core.types.infra import Network
+from stests.core.utils import paths
+
+
+
+# Executable deploy item tag - module bytes.
+_ITEM_TAG_MODULE_BYTES = 0
+
+# Executable deploy item tag - native transfer.
+_ITEM_TAG_TRANSFER = 5
+
+# Map: time to live unit -> milliseconds.
+_TTL_UNITS = {
+    "ms": 1,
+    "s": 1000,
+    "m": 60 * 1000,
+    "h": 60 * 60 * 1000,
+    "d": 24 * 60 * 60 * 1000,
+}
+
+# Regex to parse a time to live, e.g. 3600000ms | 1h.
+_TTL_REGEX = re.compile(r"^(\d+)(ms|s|m|h|d)$")
+
+# Maximum number of wasm blobs held in memory per worker.
+_WASM_CACHE_SIZE = 16
+
+# Map: (network, contract file name) -> wasm blob, in least recently used order.
+_WASM_CACHE = collections.OrderedDict()
+
+# Guards access to wasm cache across worker threads.
+_WASM_CACHE_LOCK = threading.Lock()
+
+
+def create_transfer(info: DeployDispatchInfo, amount: int, target: Account, transfer_id: int) -> dict:
+    """Returns a signed native transfer deploy ready for dispatch.
+
+    :param info: Standard information required to dispatch deploy.
+    :param amount: Amount (in motes) to be transferred.
+    :param target: Account information of counter party 2.
+    :param transfer_id: Transfer identifier.
+
+    :returns: A signed deploy in JSON form.
+
+    """
+    session_args = [
+        ("amount", serialisation.cl_u512(amount)),
+        ("target", serialisation.cl_account_hash(target.account_hash)),
+        ("id", serialisation.cl_option_u64(transfer_id)),
+    ]
+
+    return create_deploy(
+        info,
+        _get_item_module_bytes(b"", [("amount", serialisation.cl_u512(int(info.fee)))]),
+        _get_item_transfer(session_args),
+        )
+
+
+def create_module_bytes(info: DeployDispatchInfo, contract_fname: str, args: typing.List[typing.Tuple[str, CLValue]]) -> dict:
+    """Returns a signed session code deploy ready for dispatch.
+
+    :param info: Standard information required to dispatch deploy.
+    :param contract_fname: Smart contract file name being dispatched.
+    :param args: Session runtime args.
+
+    :returns: A signed deploy in JSON form.
+
+    """
+    return create_deploy(
+        info,
+        _get_item_module_bytes(b"", [("amount", serialisation.cl_u512(int(info.fee)))]),
+        _get_item_module_bytes(get_module_bytes(info.network, contract_fname), args),
+        )
+
+
+def create_deploy(info: DeployDispatchInfo, payment: typing.Tuple[bytes, dict], session: typing.Tuple[bytes, dict]) -> dict:
+    """Returns a signed deploy ready for dispatch.
+
+    :param info: Standard information required to dispatch deploy.
+    :param payment: Serialised payment item & it's JSON representation.
+    :param session: Serialised session item & it's JSON representation.
+
+    :returns: A signed deploy in JSON form.
+
+    """
+    dispatcher = info.dispatcher
+    timestamp_ms = int(time.time() * 1000)
+    timestamp = datetime.datetime.fromtimestamp(timestamp_ms // 1000, tz=datetime.timezone.utc)
+    timestamp = timestamp.replace(microsecond=(timestamp_ms % 1000) * 1000)
+
+    # Set body hash.
+    payment_bytes, payment_json = payment
+    session_bytes, session_json = session
+    body_hash = crypto.get_hash(payment_bytes + session_bytes)
+
+    # Set deploy hash.
+    header_bytes = \
+        serialisation.to_public_key(dispatcher.account_key) + \
+        serialisation.to_u64(timestamp_ms) + \
+        serialisation.to_u64(get_ttl_ms(info.time_to_live)) + \
+        serialisation.to_u64(int(info.gas_price)) + \
+        body_hash + \
+        serialisation.to_list([]) + \
+        serialisation.to_string(info.network.chain_name)
+    deploy_hash = crypto.get_hash(header_bytes)
+
+    # Set approval.
+    signature = dispatcher.get_signature(deploy_hash)
+
+    return {
+        "hash": deploy_hash.hex(),
+        "header": {
+            "account": dispatcher.account_key,
+            "timestamp": f"{timestamp.isoformat(timespec='milliseconds')[:-6]}Z",
+            "ttl": info.time_to_live,
+            "gas_price": int(info.gas_price),
+            "body_hash": body_hash.hex(),
+            "dependencies": [],
+            "chain_name": info.network.chain_name,
+        },
+        "payment": payment_json,
+        "session": session_json,
+        "approvals": [{
+            "signer": dispatcher.account_key,
+            "signature": f"{dispatcher.account_key[:2]}{signature.hex()}",
+        }],
+    }
+
+
+def get_ttl_ms(ttl: str) -> int:
+    """Returns a deploy time to live in milliseconds.
+
+    :param ttl: Time to live, e.g. 3600000ms | 1h.
+
+    :returns: Time to live in milliseconds.
+
+    """
+    match = _TTL_REGEX.match(str(ttl).strip())
+    if match is None:
+        raise ValueError(f"Unsupported deploy time to live: {ttl}")
+
+    return int(match.group(1)) * _TTL_UNITS[match.group(2)]
+
+
+def get_module_bytes(network: Network, contract_fname: str) -> bytes:
+    """Returns a smart contract wasm blob, reading it from disk only upon first use.
+
+    :param network: Target network being tested.
+    :param contract_fname: Smart contract file name.
+
+    :returns: Smart contract wasm blob.
+
+    """
+    key = (network.name_raw, contract_fname)
+    with _WASM_CACHE_LOCK:
+        try:
+            _WASM_CACHE.move_to_end(key)
+            return _WASM_CACHE[key]
+        except KeyError:
+            pass
+
+    with open(paths.get_path_to_contract(network, contract_fname), "rb") as fstream:
+        module_bytes = fstream.read()
+
+    with _WASM_CACHE_LOCK:
+        _WASM_CACHE[key] = module_bytes
+        if len(_WASM_CACHE) > _WASM_CACHE_SIZE:
+            _WASM_CACHE.popitem(last=False)
+
+    return module_bytes
+
+
+def _get_args(args: typing.List[typing.Tuple[str, CLValue]]) -> typing.Tuple[bytes, list]:
+    """Returns serialised runtime args & their JSON representation.
+
+    """
+    as_bytes = serialisation.to_list([serialisation.to_string(k) + v.to_bytes() for k, v in args])
+    as_json = [[k, v.to_json()] for k, v in args]
+
+    return as_bytes, as_json
+
+
+def _get_item_module_bytes(module_bytes: bytes, args: typing.List[typing.Tuple[str, CLValue]]) -> typing.Tuple[bytes, dict]:
+    """Returns a serialised module bytes deploy item & it's JSON representation.
+
+    """
+    args_bytes, args_json = _get_args(args)
+    as_bytes = \
+        serialisation.to_u8(_ITEM_TAG_MODULE_BYTES) + \
+        serialisation.to_bytes(module_bytes) + \
+        args_bytes
+
+    return as_bytes, {
+        "ModuleBytes": {
+            "module_bytes": module_bytes.hex(),
+            "args": args_json,
+        }
+    }
+
+
+def _get_item_transfer(args: typing.List[typing.Tuple[str, CLValue]]) -> typing.Tuple[bytes, dict]:
+    """Returns a serialised native transfer deploy item & it's JSON representation.
+
+    """
+    args_bytes, args_json = _get_args(args)
+    as_bytes = \
+        serialisation.to_u8(_ITEM_TAG_TRANSFER) + \
+        args_bytes
+
+    return as_bytes, {
+        "Transfer": {
+            "args": args_json,
+        }
+    }
@@ -1,7 +1,9 @@
 import json
 import subprocess
 
+from stests.chain import rpc
 from stests.chain.get_state_root_hash import execute as get_state_root_hash
+from stests.core import crypto
 from stests.core.types.infra import Network
 from stests.core.types.infra import Node
 from stests.core.utils import paths
@@ -11,6 +13,9 @@ from stests.core.utils import paths
 # Method upon client to be invoked.
 _CLIENT_METHOD = "query-state"
 
+# Method upon node JSON-RPC API to be invoked.
+_RPC_METHOD = "state_get_item"
+
 
 def execute(
     network: Network,
@@ -28,8 +33,22 @@ def execute(
     :returns: JSON representation of an on-chain account.
 
     """
-    binary_path = paths.get_path_to_client(network)
     state_root_hash = state_root_hash or get_state_root_hash(network, node)
+    if rpc.is_cli_client():
+        return _execute_cli(network, node, account_key, state_root_hash)
+
+    return rpc.invoke(node, _RPC_METHOD, {
+        "state_root_hash": state_root_hash,
+        "key": f"account-hash-{crypto.get_account_hash(account_key)}",
+        "path": [],
+    })
+
+
+def _execute_cli(network: Network, node: Node, account_key: str, state_root_hash: str) -> dict:
+    """Queries a node for an account via the client binary.
+
+    """
+    binary_path = paths.get_path_to_client(network)
 
     cli_response = subprocess.run([
         binary_path, _CLIENT_METHOD,
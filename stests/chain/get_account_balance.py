@@ -1,6 +1,7 @@
 import json
 import subprocess
 
+from stests.chain import rpc
 from stests.chain.get_state_root_hash import execute as get_state_root_hash
 from stests.core.types.infra import Network
 from stests.core.types.infra import Node
@@ -11,6 +12,9 @@ from stests.core.utils import paths
 # Method upon client to be invoked.
 _CLIENT_METHOD = "get-balance"
 
+# Method upon node JSON-RPC API to be invoked.
+_RPC_METHOD = "state_get_balance"
+
 
 def execute(
     network: Network,
@@ -28,8 +32,26 @@ def execute(
     :returns: Account balance.
 
     """
-    binary_path = paths.get_path_to_client(network)
     state_root_hash = state_root_hash or get_state_root_hash(network, node)
+    if rpc.is_cli_client():
+        return _execute_cli(network, node, purse_uref, state_root_hash)
+
+    try:
+        result = rpc.invoke(node, _RPC_METHOD, {
+            "state_root_hash": state_root_hash,
+            "purse_uref": purse_uref,
+        })
+    except rpc.RPC_Exception:
+        return None
+
+    return int(result['balance_value'])
+
+
+def _execute_cli(network: Network, node: Node, purse_uref: str, state_root_hash: str) -> int:
+    """Queries account balance via the client binary.
+
+    """
+    binary_path = paths.get_path_to_client(network)
 
     cli_response = subprocess.run([
         binary_path, _CLIENT_METHOD,
@@ -1,6 +1,7 @@
 import json
 import subprocess
 
+from stests.chain import rpc
 from stests.core.types.infra import Network
 from stests.core.types.infra import Node
 from stests.core.utils import paths
@@ -10,6 +11,9 @@ from stests.core.utils import paths
 # Method upon client to be invoked.
 _CLIENT_METHOD = "get-auction-info"
 
+# Method upon node JSON-RPC API to be invoked.
+_RPC_METHOD = "state_get_auction_info"
+
 
 def execute(
     network: Network,
@@ -22,6 +26,16 @@ def execute(
 
     :returns: On-chain auction information.
 
+    """
+    if rpc.is_cli_client():
+        return _execute_cli(network, node)
+
+    return rpc.invoke(node, _RPC_METHOD)
+
+
+def _execute_cli(network: Network, node: Node) -> dict:
+    """Queries on-chain auction information via the client binary.
+
     """
     binary_path = paths.get_path_to_client(network)
 
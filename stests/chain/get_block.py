@@ -1,6 +1,8 @@
 import json
 import subprocess
 
+from stests.chain import query_cache
+from stests.chain import rpc
 from stests.core.types.infra import Network
 from stests.core.types.infra import Node
 from stests.core.utils import paths
@@ -10,6 +12,9 @@ from stests.core.utils import paths
 # Method upon client to be invoked.
 _CLIENT_METHOD = "get-block"
 
+# Method upon node JSON-RPC API to be invoked.
+_RPC_METHOD = "chain_get_block"
+
 
 def execute(
     network: Network,
@@ -24,6 +29,32 @@ def execute(
 
     :returns: Representation of a block within a node's state.
 
+    """
+    # Latest block is a moving target whilst a block by hash is immutable.
+    if not block_hash:
+        return _execute(network, node, block_hash)
+
+    return query_cache.get_or_fetch(
+        (network.name, "block", block_hash),
+        lambda: _execute(network, node, block_hash),
+        )
+
+
+def _execute(network: Network, node: Node, block_hash: str = None) -> str:
+    """Queries a node for a block.
+
+    """
+    if rpc.is_cli_client():
+        return _execute_cli(network, node, block_hash)
+
+    params = {"block_identifier": {"Hash": block_hash}} if block_hash else None
+
+    return rpc.invoke(node, _RPC_METHOD, params)['block']
+
+
+def _execute_cli(network: Network, node: Node, block_hash: str = None) -> str:
+    """Queries a node for a block via the client binary.
+
     """
     binary_path = paths.get_path_to_client(network)
 
@@ -1,6 +1,8 @@
 import json
 import subprocess
 
+from stests.chain import query_cache
+from stests.chain import rpc
 from stests.core.types.infra import Network
 from stests.core.types.infra import Node
 from stests.core.utils import paths
@@ -10,6 +12,9 @@ from stests.core.utils import paths
 # Method upon client to be invoked.
 _CLIENT_METHOD = "get-deploy"
 
+# Method upon node JSON-RPC API to be invoked.
+_RPC_METHOD = "info_get_deploy"
+
 
 def execute(
     network: Network,
@@ -24,6 +29,37 @@ def execute(
 
     :returns: Representation of a deploy within a node's state.
 
+    """
+    return query_cache.get_or_fetch(
+        (network.name, "deploy", deploy_hash),
+        lambda: _execute(network, node, deploy_hash),
+        _is_executed,
+        )
+
+
+def _execute(network: Network, node: Node, deploy_hash: str) -> str:
+    """Queries a node for a deploy.
+
+    """
+    if rpc.is_cli_client():
+        return _execute_cli(network, node, deploy_hash)
+
+    return rpc.invoke(node, _RPC_METHOD, {"deploy_hash": deploy_hash})
+
+
+def _is_executed(on_chain_deploy: dict) -> bool:
+    """Returns flag indicating whether a deploy has been executed - i.e. it's representation is immutable.
+
+    """
+    try:
+        return bool(on_chain_deploy["execution_results"])
+    except (TypeError, KeyError):
+        return False
+
+
+def _execute_cli(network: Network, node: Node, deploy_hash: str) -> str:
+    """Queries a node for a deploy via the client binary.
+
     """
     binary_path = paths.get_path_to_client(network)
 
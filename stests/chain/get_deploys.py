@@ -0,0 +1,43 @@
+import concurrent.futures
+import typing
+
+from stests.chain.get_deploy import execute as get_deploy
+from stests.core.types.infra import Network
+from stests.core.types.infra import Node
+from stests.core.utils import env
+
+
+
+# Environment variables required by this module.
+class EnvVars:
+    # Maximum number of deploys concurrently pulled from a node.
+    CONCURRENCY = env.get_var("CHAIN_QUERY_DEPLOYS_CONCURRENCY", 16, int)
+
+
+def execute(
+    network: Network,
+    node: Node,
+    deploy_hashes: typing.List[str],
+    ) -> typing.Dict[str, dict]:
+    """Queries a node for a set of deploys concurrently.
+
+    :param network: Target network being tested.
+    :param node: Target node being tested.
+    :param deploy_hashes: Hashes of deploys being pulled.
+
+    :returns: Map: deploy hash -> representation of a deploy within a node's state - deploys that could not be pulled are omitted.
+
+    """
+    if not deploy_hashes:
+        return dict()
+
+    result = dict()
+    with concurrent.futures.ThreadPoolExecutor(min(EnvVars.CONCURRENCY, len(deploy_hashes))) as executor:
+        futures = {executor.submit(get_deploy, network, node, i): i for i in deploy_hashes}
+        for future in concurrent.futures.as_completed(futures):
+            try:
+                result[futures[future]] = future.result()
+            except Exception:
+                pass
+
+    return result
@@ -1,5 +1,4 @@
-from jsonrpcclient import request
-
+from stests.chain import rpc
 from stests.core.types.infra import Network
 from stests.core.types.infra import Node
 
@@ -21,7 +20,5 @@ def execute(
     :returns: Representation of a node's status.
 
     """
-    response = request(node.url_rpc, _RPC_METHOD)
-
-    return response.data.result
+    return rpc.invoke(node, _RPC_METHOD)
 
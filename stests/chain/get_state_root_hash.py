@@ -1,6 +1,7 @@
 import json
 import subprocess
 
+from stests.chain import rpc
 from stests.core.types.infra import Network
 from stests.core.types.infra import Node
 from stests.core.utils import paths
@@ -10,6 +11,9 @@ from stests.core.utils import paths
 # Method upon client to be invoked.
 _CLIENT_METHOD = "get-state-root-hash"
 
+# Method upon node JSON-RPC API to be invoked.
+_RPC_METHOD = "chain_get_state_root_hash"
+
 
 def execute(
     network: Network,
@@ -24,6 +28,18 @@ def execute(
 
     :returns: Current root state hash at a network node.
 
+    """
+    if rpc.is_cli_client():
+        return _execute_cli(network, node, block_hash)
+
+    params = {"block_identifier": {"Hash": block_hash}} if block_hash else None
+
+    return rpc.invoke(node, _RPC_METHOD, params)['state_root_hash']
+
+
+def _execute_cli(network: Network, node: Node, block_hash: str = None) -> str:
+    """Queries a node for it's current state root hash via the client binary.
+
     """
     binary_path = paths.get_path_to_client(network)
 
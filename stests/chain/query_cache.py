@@ -0,0 +1,60 @@
+import collections
+import threading
+import time
+import typing
+
+from stests.core.utils import env
+
+
+
+# Environment variables required by this module.
+class EnvVars:
+    # Maximum number of query results held in memory per process.
+    SIZE = env.get_var("CHAIN_QUERY_CACHE_SIZE", 10000, int)
+
+    # Time (seconds) for which a query result is held in memory.
+    TTL = env.get_var("CHAIN_QUERY_CACHE_TTL", 300.0, float)
+
+
+# Map: query key -> (expiry timestamp, query result), in least recently used order.
+_RESULTS = collections.OrderedDict()
+
+# Guards access to cached results across worker threads.
+_LOCK = threading.Lock()
+
+
+def get_or_fetch(
+    key: typing.Tuple,
+    fetch: typing.Callable[[], typing.Any],
+    is_cacheable: typing.Callable[[typing.Any], bool] = None,
+    ) -> typing.Any:
+    """Returns a chain query result, only querying the chain if an unexpired result is not held in memory.
+
+    :param key: Key uniquely identifying query, e.g. (network, entity type, hash).
+    :param fetch: Function invoked to query chain.
+    :param is_cacheable: Predicate determining whether a result is immutable & thus may be cached.
+
+    :returns: Query result.
+
+    """
+    now = time.monotonic()
+    with _LOCK:
+        try:
+            expiry, result = _RESULTS[key]
+        except KeyError:
+            pass
+        else:
+            if expiry > now:
+                _RESULTS.move_to_end(key)
+                return result
+            del _RESULTS[key]
+
+    result = fetch()
+    if is_cacheable is None or is_cacheable(result):
+        with _LOCK:
+            _RESULTS[key] = (now + EnvVars.TTL, result)
+            _RESULTS.move_to_end(key)
+            if len(_RESULTS) > EnvVars.SIZE:
+                _RESULTS.popitem(last=False)
+
+    return result
@@ -0,0 +1,125 @@
+import itertools
+import os
+import typing
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from stests.core.types.infra import Node
+from stests.core.utils import env
+from stests.core.utils.exceptions import InvalidEnvironmentVariable
+
+
+
+# Environment variables required by this module.
+class EnvVars:
+    # Chain client type - RPC (in-process) | CLI (casper-client binary).
+    CLIENT_TYPE = env.get_var("CHAIN_CLIENT_TYPE", "RPC")
+
+    # Maximum number of pooled connections per node.
+    POOL_SIZE = env.get_var("CHAIN_RPC_POOL_SIZE", 32, int)
+
+    # Request timeout (seconds).
+    TIMEOUT = env.get_var("CHAIN_RPC_TIMEOUT", 30.0, float)
+
+
+# Set of supported chain client types.
+CLIENT_TYPES = {
+    "CLI",
+    "RPC",
+}
+
+# JSON-RPC protocol version.
+_JSONRPC_VERSION = "2.0"
+
+# Map: process id -> pooled http session.
+_SESSIONS = {}
+
+# Request identifier sequence.
+_REQUEST_ID = itertools.count(1)
+
+
+class RPC_Exception(Exception):
+    """Node JSON-RPC API exception class.
+
+    """
+
+    def __init__(self, method: str, err: typing.Any):
+        """Constructor.
+
+        :param method: JSON-RPC method that was invoked.
+        :param err: Error returned by remote node.
+
+        """
+        self.method = method
+        self.err = err
+        self.message = f"{method} failed :: {err}"
+
+
+    def __str__(self):
+        """Returns a string representation.
+
+        """
+        return u"STESTS RPC EXCEPTION : {0}".format(repr(self.message))
+
+
+def is_cli_client() -> bool:
+    """Returns flag indicating whether chain interaction falls back to the casper-client binary.
+
+    """
+    if EnvVars.CLIENT_TYPE not in CLIENT_TYPES:
+        raise InvalidEnvironmentVariable("CHAIN_CLIENT_TYPE", EnvVars.CLIENT_TYPE, " | ".join(sorted(CLIENT_TYPES)))
+
+    return EnvVars.CLIENT_TYPE == "CLI"
+
+
+def get_session() -> requests.Session:
+    """Returns a pooled http session scoped to the current process.
+
+    :returns: An http session whose connections are reused across calls.
+
+    """
+    # Sessions are keyed by pid so that forked workers do not share sockets.
+    pid = os.getpid()
+    try:
+        return _SESSIONS[pid]
+    except KeyError:
+        pass
+
+    adapter = HTTPAdapter(
+        pool_connections=EnvVars.POOL_SIZE,
+        pool_maxsize=EnvVars.POOL_SIZE,
+        )
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    _SESSIONS[pid] = session
+
+    return session
+
+
+def invoke(node: Node, method: str, params: typing.Union[dict, list] = None) -> dict:
+    """Invokes a JSON-RPC method upon a node & returns the result.
+
+    :param node: Target node being invoked.
+    :param method: JSON-RPC method name.
+    :param params: JSON-RPC method parameters.
+
+    :returns: JSON-RPC result payload.
+
+    """
+    payload = {
+        "jsonrpc": _JSONRPC_VERSION,
+        "id": next(_REQUEST_ID),
+        "method": method,
+    }
+    if params is not None:
+        payload["params"] = params
+
+    response = get_session().post(node.url_rpc, json=payload, timeout=EnvVars.TIMEOUT)
+    response.raise_for_status()
+    response = response.json()
+    if "error" in response:
+        raise RPC_Exception(method, response["error"])
+
+    return response["result"]
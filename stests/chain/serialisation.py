@@ -0,0 +1,185 @@
+import dataclasses
+import typing
+
+
+
+# Map: CL type name -> CL type tag.
+CL_TYPE_TAGS = {
+    "Bool": 0,
+    "I32": 1,
+    "I64": 2,
+    "U8": 3,
+    "U32": 4,
+    "U64": 5,
+    "U128": 6,
+    "U256": 7,
+    "U512": 8,
+    "Unit": 9,
+    "String": 10,
+    "Key": 11,
+    "URef": 12,
+    "Option": 13,
+    "List": 14,
+    "ByteArray": 15,
+    "PublicKey": 22,
+}
+
+
+@dataclasses.dataclass
+class CLValue():
+    """A value serialised in accordance with the chain's binary encoding scheme.
+
+    """
+    # Serialised value.
+    as_bytes: bytes
+
+    # Serialised CL type.
+    cl_type: bytes
+
+    # JSON representation of CL type.
+    cl_type_json: typing.Any
+
+    # Human readable value.
+    parsed: typing.Any
+
+
+    def to_bytes(self) -> bytes:
+        """Returns value serialised as a length prefixed byte array followed by it's type.
+
+        """
+        return to_bytes(self.as_bytes) + self.cl_type
+
+
+    def to_json(self) -> dict:
+        """Returns value in JSON form as expected by a node's JSON-RPC API.
+
+        """
+        return {
+            "cl_type": self.cl_type_json,
+            "bytes": self.as_bytes.hex(),
+            "parsed": self.parsed,
+        }
+
+
+def to_u8(value: int) -> bytes:
+    """Returns an unsigned 8 bit integer serialised as bytes.
+
+    """
+    return value.to_bytes(1, "little")
+
+
+def to_u32(value: int) -> bytes:
+    """Returns an unsigned 32 bit integer serialised as bytes.
+
+    """
+    return value.to_bytes(4, "little")
+
+
+def to_u64(value: int) -> bytes:
+    """Returns an unsigned 64 bit integer serialised as bytes.
+
+    """
+    return value.to_bytes(8, "little")
+
+
+def to_u512(value: int) -> bytes:
+    """Returns an unsigned 512 bit integer serialised as a length prefixed little endian byte array.
+
+    """
+    length = (value.bit_length() + 7) // 8
+
+    return to_u8(length) + value.to_bytes(length, "little")
+
+
+def to_bytes(value: bytes) -> bytes:
+    """Returns a byte array serialised with a length prefix.
+
+    """
+    return to_u32(len(value)) + value
+
+
+def to_string(value: str) -> bytes:
+    """Returns a string serialised as length prefixed utf-8 bytes.
+
+    """
+    return to_bytes(value.encode("utf-8"))
+
+
+def to_public_key(account_key: str) -> bytes:
+    """Returns a public key serialised as bytes.
+
+    :param account_key: Hexadecimal on-chain account identifier, i.e. algo prefix + public key.
+
+    """
+    # N.B. account key prefix (01 | 02) is the public key algo tag.
+    return bytes.fromhex(account_key)
+
+
+def to_list(items: typing.List[bytes]) -> bytes:
+    """Returns a list of pre-serialised items serialised with a length prefix.
+
+    """
+    return to_u32(len(items)) + b"".join(items)
+
+
+def cl_account_hash(account_hash: str) -> CLValue:
+    """Returns an account hash as a CL value.
+
+    :param account_hash: Hexadecimal account hash.
+
+    """
+    value = bytes.fromhex(account_hash)
+
+    return CLValue(
+        value,
+        to_u8(CL_TYPE_TAGS["ByteArray"]) + to_u32(len(value)),
+        {"ByteArray": len(value)},
+        f"account-hash-{account_hash}",
+        )
+
+
+def cl_option_u64(value: typing.Optional[int]) -> CLValue:
+    """Returns an optional unsigned 64 bit integer as a CL value.
+
+    """
+    return CLValue(
+        to_u8(0) if value is None else to_u8(1) + to_u64(value),
+        to_u8(CL_TYPE_TAGS["Option"]) + to_u8(CL_TYPE_TAGS["U64"]),
+        {"Option": "U64"},
+        value,
+        )
+
+
+def cl_public_key(account_key: str) -> CLValue:
+    """Returns a public key as a CL value.
+
+    :param account_key: Hexadecimal on-chain account identifier.
+
+    """
+    return CLValue(
+        to_public_key(account_key),
+        to_u8(CL_TYPE_TAGS["PublicKey"]),
+        "PublicKey",
+        account_key,
+        )
+
+
+def cl_u8(value: int) -> CLValue:
+    """Returns an unsigned 8 bit integer as a CL value.
+
+    """
+    return CLValue(to_u8(value), to_u8(CL_TYPE_TAGS["U8"]), "U8", value)
+
+
+def cl_u64(value: int) -> CLValue:
+    """Returns an unsigned 64 bit integer as a CL value.
+
+    """
+    return CLValue(to_u64(value), to_u8(CL_TYPE_TAGS["U64"]), "U64", value)
+
+
+def cl_u512(value: int) -> CLValue:
+    """Returns an unsigned 512 bit integer as a CL value.
+
+    """
+    return CLValue(to_u512(value), to_u8(CL_TYPE_TAGS["U512"]), "U512", str(value))
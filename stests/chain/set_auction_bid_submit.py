@@ -1,3 +1,4 @@
+from stests.chain import serialisation
 from stests.chain import set_deploy
 from stests.chain.utils import execute_cli
 from stests.chain.utils import DeployDispatchInfo
@@ -31,9 +32,9 @@ def execute(info: DeployDispatchInfo, amount: int, delegation_rate: int, verbose
         info.dispatcher,
         _CONTRACT_FNAME,
         [
-            "--session-arg", f"amount:u512='{amount}'",
-            "--session-arg", f"delegation_rate:u8='{delegation_rate}'",
-            "--session-arg", f"public_key:public_key='{info.dispatcher.account_key}'",
+            ("amount", serialisation.cl_u512(amount)),
+            ("delegation_rate", serialisation.cl_u8(delegation_rate)),
+            ("public_key", serialisation.cl_public_key(info.dispatcher.account_key)),
         ]
     )
     
@@ -1,3 +1,4 @@
+from stests.chain import serialisation
 from stests.chain import set_deploy
 from stests.chain.utils import execute_cli
 from stests.chain.utils import DeployDispatchInfo
@@ -30,8 +31,8 @@ def execute(info: DeployDispatchInfo, amount: int, verbose: bool = True) -> str:
         info.dispatcher,
         _CONTRACT_FNAME,
         [
-            "--session-arg", f"amount:u512='{amount}'",
-            "--session-arg", f"public_key:public_key='{info.dispatcher.account_key}'",
+            ("amount", serialisation.cl_u512(amount)),
+            ("public_key", serialisation.cl_public_key(info.dispatcher.account_key)),
         ]
     )
 
@@ -1,3 +1,4 @@
+from stests.chain import serialisation
 from stests.chain import set_deploy
 from stests.chain.utils import execute_cli
 from stests.chain.utils import DeployDispatchInfo
@@ -34,9 +35,9 @@ def execute(info: DeployDispatchInfo, validator: Account, amount: int, verbose:
         info.dispatcher,
         _CONTRACT_FNAME,
         [
-            "--session-arg", f"amount:u512='{amount}'",
-            "--session-arg", f"delegator:public_key='{delegator.account_key}'",
-            "--session-arg", f"validator:public_key='{validator.account_key}'",
+            ("amount", serialisation.cl_u512(amount)),
+            ("delegator", serialisation.cl_public_key(delegator.account_key)),
+            ("validator", serialisation.cl_public_key(validator.account_key)),
         ]
     )
 
@@ -1,3 +1,4 @@
+from stests.chain import serialisation
 from stests.chain import set_deploy
 from stests.chain.utils import execute_cli
 from stests.chain.utils import DeployDispatchInfo
@@ -32,7 +33,7 @@ def execute(info: DeployDispatchInfo, validator: Account, amount: int) -> str:
         info.dispatcher,
         _CONTRACT_FNAME,
         [
-            "--session-arg", f"amount:u512='{amount}'",
-            "--session-arg", f"validator:public_key='{validator.account_key}'",
+            ("amount", serialisation.cl_u512(amount)),
+            ("validator", serialisation.cl_public_key(validator.account_key)),
         ]
     )
@@ -1,8 +1,12 @@
 import json
 import subprocess
+import typing
 
 from stests.chain import constants
+from stests.chain import deploy
+from stests.chain import rpc
 from stests.chain import utils
+from stests.chain.serialisation import CLValue
 from stests.core.types.chain import Account
 from stests.core.types.infra import Network
 from stests.core.types.infra import Node
@@ -14,13 +18,24 @@ from stests.events import EventType
 # Method upon client to be invoked.
 _CLIENT_METHOD = "put-deploy"
 
+# Method upon node JSON-RPC API to be invoked.
+_RPC_METHOD = "account_put_deploy"
+
+# Map: CL type -> client session arg type.
+_CLIENT_ARG_TYPES = {
+    "ByteArray": "account_hash",
+    "PublicKey": "public_key",
+    "U8": "u8",
+    "U512": "u512",
+}
+
 
 def execute(
     network: Network,
     node: Node,
     dispatcher: Account,
     contract_fname: str,
-    session_args: list=[],
+    session_args: typing.List[typing.Tuple[str, CLValue]]=[],
     tx_ttl=constants.DEFAULT_TX_TIME_TO_LIVE,
     tx_fee=constants.DEFAULT_TX_FEE,
     tx_gas_price=constants.DEFAULT_TX_GAS_PRICE,
@@ -29,6 +44,7 @@ def execute(
 
     :param dispatcher: Account information of entity dispatching a deploy.
     :param contract_fname: Smart contract file name being dispatched.
+    :param session_args: Session runtime args, i.e. (name, CL value) pairs.
 
     :param network: Network to which transfer is being dispatched.
     :param node: Node to which transfer is being dispatched.
@@ -39,20 +55,39 @@ def execute(
     :returns: Deploy hash.
 
     """
-    binary_path = paths.get_path_to_client(network)
-    session_path = paths.get_path_to_contract(network, contract_fname)
-
-    cli_response = subprocess.run([
-        binary_path, _CLIENT_METHOD,
-        "--chain-name", network.chain_name,
-        "--gas-price", str(tx_gas_price),
-        "--node-address", node.url_rpc,
-        "--payment-amount", str(tx_fee),
-        "--secret-key", dispatcher.get_private_key_pem_filepath(),
-        "--session-path", session_path,
-        "--ttl", str(tx_ttl),
-        ] + session_args,
-        stdout=subprocess.PIPE,
-        )
+    info = utils.DeployDispatchInfo(dispatcher, network, node, tx_ttl, tx_fee, tx_gas_price)
+    if rpc.is_cli_client():
+        return _execute_cli(info, contract_fname, session_args)
+
+    return rpc.invoke(node, _RPC_METHOD, {
+        "deploy": deploy.create_module_bytes(info, contract_fname, session_args)
+    })['deploy_hash']
+
+
+def _execute_cli(info: utils.DeployDispatchInfo, contract_fname: str, session_args: typing.List[typing.Tuple[str, CLValue]]) -> str:
+    """Dispatches a signed deploy via the client binary.
+
+    """
+    binary_path = paths.get_path_to_client(info.network)
+    session_path = paths.get_path_to_contract(info.network, contract_fname)
+
+    cli_args = []
+    for name, value in session_args:
+        cl_type = value.cl_type_json if isinstance(value.cl_type_json, str) else list(value.cl_type_json)[0]
+        cli_args += ["--session-arg", f"{name}:{_CLIENT_ARG_TYPES[cl_type]}='{value.parsed}'"]
+
+    with info.dispatcher.get_private_key_pem_file() as pvk_fpath:
+        cli_response = subprocess.run([
+            binary_path, _CLIENT_METHOD,
+            "--chain-name", info.network.chain_name,
+            "--gas-price", str(info.gas_price),
+            "--node-address", info.node_address,
+            "--payment-amount", str(info.fee),
+            "--secret-key", pvk_fpath,
+            "--session-path", session_path,
+            "--ttl", str(info.time_to_live),
+            ] + cli_args,
+            stdout=subprocess.PIPE,
+            )
 
     return json.loads(cli_response.stdout)['result']['deploy_hash']
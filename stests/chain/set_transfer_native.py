@@ -3,6 +3,8 @@ import random
 import subprocess
 
 from stests.core.logging import log_event
+from stests.chain import deploy
+from stests.chain import rpc
 from stests.chain.utils import execute_cli
 from stests.chain.utils import DeployDispatchInfo
 from stests.core.types.chain import Account
@@ -15,6 +17,9 @@ from stests.events import EventType
 # Method upon client to be invoked.
 _CLIENT_METHOD = "transfer"
 
+# Method upon node JSON-RPC API to be invoked.
+_RPC_METHOD = "account_put_deploy"
+
 # Maximum value of a transfer ID.
 _MAX_TRANSFER_ID = (2 ** 63) - 1
 
@@ -30,24 +35,15 @@ def execute(info: DeployDispatchInfo, cp2: Account, amount: int, verbose: bool =
     :returns: Dispatched deploy hash.
 
     """
-    binary_path = paths.get_path_to_client(info.network)
     cp1 = info.dispatcher
+    transfer_id = random.randint(1, _MAX_TRANSFER_ID)
 
-    cli_response = subprocess.run([
-        binary_path, _CLIENT_METHOD,
-        "--target-account", cp2.account_key,
-        "--amount", str(amount),
-        "--chain-name", info.network.chain_name,
-        "--gas-price", str(info.gas_price),
-        "--node-address", info.node_address,
-        "--payment-amount", str(info.fee),
-        "--secret-key", info.dispatcher.get_private_key_pem_filepath(),
-        "--transfer-id", str(random.randint(1, _MAX_TRANSFER_ID)),
-        "--ttl", str(info.time_to_live),
-        ],
-        stdout=subprocess.PIPE,
-        )
-    deploy_hash = json.loads(cli_response.stdout)['result']['deploy_hash']
+    if rpc.is_cli_client():
+        deploy_hash = _execute_cli(info, cp2, amount, transfer_id)
+    else:
+        deploy_hash = rpc.invoke(info.node, _RPC_METHOD, {
+            "deploy": deploy.create_transfer(info, amount, cp2, transfer_id)
+        })['deploy_hash']
     
     if verbose:
         log_event(
@@ -58,3 +54,28 @@ def execute(info: DeployDispatchInfo, cp2: Account, amount: int, verbose: bool =
             )
 
     return deploy_hash
+
+
+def _execute_cli(info: DeployDispatchInfo, cp2: Account, amount: int, transfer_id: int) -> str:
+    """Executes a transfer via the client binary.
+
+    """
+    binary_path = paths.get_path_to_client(info.network)
+
+    with info.dispatcher.get_private_key_pem_file() as pvk_fpath:
+        cli_response = subprocess.run([
+            binary_path, _CLIENT_METHOD,
+            "--target-account", cp2.account_key,
+            "--amount", str(amount),
+            "--chain-name", info.network.chain_name,
+            "--gas-price", str(info.gas_price),
+            "--node-address", info.node_address,
+            "--payment-amount", str(info.fee),
+            "--secret-key", pvk_fpath,
+            "--transfer-id", str(transfer_id),
+            "--ttl", str(info.time_to_live),
+            ],
+            stdout=subprocess.PIPE,
+            )
+
+    return json.loads(cli_response.stdout)['result']['deploy_hash']
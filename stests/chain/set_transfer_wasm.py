@@ -1,3 +1,4 @@
+from stests.chain import serialisation
 from stests.chain import set_deploy
 from stests.chain.utils import execute_cli
 from stests.chain.utils import DeployDispatchInfo
@@ -35,8 +36,8 @@ def execute(info: DeployDispatchInfo, cp2: Account, amount: int, verbose: bool =
         info.dispatcher,
         _CONTRACT_FNAME,
         [
-            "--session-arg", f"amount:u512='{amount}'",
-            "--session-arg", f"target:account_hash='account-hash-{cp2.account_hash}'",
+            ("amount", serialisation.cl_u512(amount)),
+            ("target", serialisation.cl_account_hash(cp2.account_hash)),
         ]
     )
 
@@ -35,6 +35,16 @@ def execute(node: Node, event_callback: typing.Callable, event_id: int = 0):
 def _yield_events(node: Node, event_id: int):
     """Yields events streaming from node.
 
+    """
+    for raw_event_id, data in _yield_raw_events(node, event_id):
+        parsed = _parse_event(node, int(raw_event_id) if raw_event_id else 0, json.loads(data))
+        if parsed:
+            yield parsed
+
+
+def _yield_raw_events(node: Node, event_id: int) -> typing.Iterator[typing.Tuple[str, str]]:
+    """Yields raw (event id, event data) pairs streaming from node.
+
     """
     # Set url.
     url = node.url_event
@@ -45,12 +55,10 @@ def _yield_events(node: Node, event_id: int):
     stream = requests.get(url, stream=True)
     client = sseclient.SSEClient(stream)
 
-    # Bind to stream & yield parsed events.
+    # Bind to stream & yield raw events.
     try:
         for event in client.events():
-            parsed = _parse_event(node, event.id, json.loads(event.data))
-            if parsed:
-                yield parsed
+            yield event.id, event.data
 
     # On stream error close & re-raise.
     except Exception as err:
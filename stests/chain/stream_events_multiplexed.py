@@ -0,0 +1,367 @@
+import asyncio
+import collections
+import concurrent.futures
+import json
+import typing
+import urllib.parse
+
+from stests.chain.stream_events import _parse_event
+from stests.core import factory
+from stests.core.logging import log_event
+from stests.core.types.infra import Node
+from stests.core.types.infra import NodeEventInfo
+from stests.core.utils import env
+from stests.events import EventType
+
+
+
+# Environment variables required by this module.
+class EnvVars:
+    # Maximum number of event callbacks in flight prior to pausing stream reads.
+    CALLBACK_BACKLOG = env.get_var("CHAIN_STREAM_CALLBACK_BACKLOG", 1000, int)
+
+    # Number of threads over which event callbacks are dispatched.
+    CALLBACK_THREADS = env.get_var("CHAIN_STREAM_CALLBACK_THREADS", 8, int)
+
+    # Maximum delay (seconds) between successive attempts to reconnect to a node's event stream.
+    RECONNECT_DELAY_MAX = env.get_var("CHAIN_STREAM_RECONNECT_DELAY_MAX", 30.0, float)
+
+    # Time (seconds) without data after which a node's event stream is deemed dead & reconnected.
+    READ_TIMEOUT = env.get_var("CHAIN_STREAM_READ_TIMEOUT", 120.0, float)
+
+    # Interval (seconds) between successive refreshes of set of nodes being streamed.
+    REFRESH_INTERVAL = env.get_var("CHAIN_STREAM_REFRESH_INTERVAL", 10.0, float)
+
+
+# Initial delay (seconds) prior to reconnecting to a node's event stream.
+_RECONNECT_DELAY = 1.0
+
+# Number of bytes read from a stream per socket read.
+_READ_SIZE = 65536
+
+
+class EventStreamParser():
+    """Incremental parser of a server sent event stream.
+
+    """
+
+    def __init__(self):
+        """Constructor.
+
+        """
+        self._buffer = b""
+        self._data = []
+        self._event_id = None
+
+
+    def feed(self, chunk: bytes) -> typing.List[typing.Tuple[typing.Optional[str], str]]:
+        """Parses a chunk of streamed bytes.
+
+        :param chunk: Bytes read from stream - may terminate mid line.
+
+        :returns: Set of (event id, event data) tuples completed by chunk.
+
+        """
+        events = []
+        self._buffer += chunk
+        *lines, self._buffer = self._buffer.split(b"\n")
+        for line in lines:
+            line = line.rstrip(b"\r").decode("utf-8")
+
+            # Blank line: dispatch event.
+            if not line:
+                if self._data:
+                    events.append((self._event_id, "\n".join(self._data)))
+                self._data = []
+                self._event_id = None
+                continue
+
+            # Comment line: ignore.
+            if line.startswith(":"):
+                continue
+
+            field, _, value = line.partition(":")
+            if value.startswith(" "):
+                value = value[1:]
+            if field == "data":
+                self._data.append(value)
+            elif field == "id":
+                self._event_id = value
+
+        return events
+
+
+class EventWatermark():
+    """Tracks low-water mark of a node's event stream, i.e. latest event prior to which every dispatched event was processed.
+
+    Callbacks complete out of order across threads, hence an event is only passed to checkpoint callback once all
+    events dispatched before it have been processed.  Should an event fail then mark stalls at event prior to it &
+    failed event is exposed so that stream can be resumed from it under a fresh mark.
+
+    """
+
+    def __init__(self, checkpoint: typing.Callable[[NodeEventInfo], None]):
+        """Constructor.
+
+        :param checkpoint: Callback to invoke whenever mark advances.
+
+        """
+        self._checkpoint = checkpoint
+        self._pending = collections.deque()
+        self.failed = None
+
+
+    def on_dispatched(self, event_info: NodeEventInfo, future: asyncio.Future):
+        """Tracks a dispatched event.
+
+        :param event_info: Information pertaining to a dispatched event.
+        :param future: Future resolved upon processing of event - to a flag indicating whether event was processed.
+
+        """
+        if event_info.event_id and self.failed is None:
+            self._pending.append((event_info, future))
+            future.add_done_callback(self._on_processed)
+
+
+    def _on_processed(self, _: asyncio.Future):
+        """Advances mark over those events processed in dispatch order.
+
+        """
+        mark = None
+        while self._pending and self._pending[0][1].done():
+            event_info, future = self._pending.popleft()
+            if future.cancelled() or not future.result():
+                self.failed = event_info
+                self._pending.clear()
+                break
+            mark = event_info
+
+        if mark is not None:
+            self._checkpoint(mark)
+
+
+def execute(
+    nodes: typing.List[Node],
+    event_callback: typing.Callable,
+    event_ids: typing.Dict[int, int] = None,
+    refresh: typing.Callable[[], typing.Tuple[typing.List[Node], typing.Dict[int, int]]] = None,
+    checkpoint: typing.Callable[[NodeEventInfo], None] = None,
+    ):
+    """Hooks upto multiple node event streams over a single event loop invoking passed callback for each event.
+
+    :param nodes: The nodes to which to bind.
+    :param event_callback: Callback to invoke whenever an event of relevant type is received.
+    :param event_ids: Map: node index -> identifer of event from which to start stream.
+    :param refresh: Callback periodically invoked to return nodes to which to bind plus event ids from which to start newly bound streams.
+    :param checkpoint: Callback invoked - upon event loop - with latest event per node prior to which every event was processed.
+
+    """
+    asyncio.run(_stream_nodes(nodes, event_callback, event_ids or dict(), refresh, checkpoint))
+
+
+async def _stream_nodes(
+    nodes: typing.List[Node],
+    event_callback: typing.Callable,
+    event_ids: typing.Dict[int, int],
+    refresh: typing.Optional[typing.Callable],
+    checkpoint: typing.Optional[typing.Callable],
+    ):
+    """Streams events from a set of nodes concurrently, adding & removing streams upon refresh.
+
+    """
+    # Callbacks perform blocking i/o (cache, broker) hence are dispatched to a thread pool.
+    loop = asyncio.get_running_loop()
+    executor = concurrent.futures.ThreadPoolExecutor(EnvVars.CALLBACK_THREADS)
+
+    # Callbacks in flight are bounded so that a fast stream cannot grow the pool's queue without limit.
+    backlog = asyncio.Semaphore(EnvVars.CALLBACK_BACKLOG)
+
+    # Refresh is dispatched to a dedicated thread so that it is not queued behind event callbacks.
+    refresh_executor = concurrent.futures.ThreadPoolExecutor(1)
+    tasks = dict()
+    try:
+        while True:
+            _set_tasks(tasks, nodes, event_callback, event_ids, executor, backlog, checkpoint)
+            if refresh is None:
+                await asyncio.gather(*tasks.values())
+                return
+
+            # Refresh node set - upon failure retain current set until next refresh.
+            await asyncio.sleep(EnvVars.REFRESH_INTERVAL)
+            try:
+                nodes, event_ids = await loop.run_in_executor(refresh_executor, refresh)
+            except Exception as err:
+                log_event(EventType.CORE_ACTOR_ERROR, err)
+
+    finally:
+        for task in tasks.values():
+            task.cancel()
+        executor.shutdown(wait=False)
+        refresh_executor.shutdown(wait=False)
+
+
+def _set_tasks(
+    tasks: typing.Dict[typing.Tuple[str, int], asyncio.Task],
+    nodes: typing.List[Node],
+    event_callback: typing.Callable,
+    event_ids: typing.Dict[int, int],
+    executor: concurrent.futures.Executor,
+    backlog: asyncio.Semaphore,
+    checkpoint: typing.Optional[typing.Callable],
+    ):
+    """Reconciles set of streaming tasks with set of nodes to which to bind.
+
+    """
+    nodes = {(i.network, i.index): i for i in nodes}
+    for key in set(tasks) - set(nodes):
+        tasks.pop(key).cancel()
+    for key in set(nodes) - set(tasks):
+        node = nodes[key]
+        tasks[key] = asyncio.ensure_future(
+            _stream_node(node, event_callback, event_ids.get(node.index, 0), executor, backlog, checkpoint)
+            )
+
+
+async def _stream_node(
+    node: Node,
+    event_callback: typing.Callable,
+    event_id: int,
+    executor: concurrent.futures.Executor,
+    backlog: asyncio.Semaphore,
+    checkpoint: typing.Callable = None,
+    ):
+    """Streams events from a node, reconnecting upon error.
+
+    """
+    loop = asyncio.get_running_loop()
+    watermark = EventWatermark(checkpoint) if checkpoint else None
+    delay = _RECONNECT_DELAY
+    while True:
+        log_event(EventType.MONIT_STREAM_OPENING, node.address_event, node)
+        events = _yield_events(node, event_id)
+        try:
+            async for event_type, last_event_id, payload, block_hash, deploy_hash, account_key in events:
+                event_info = factory.create_node_event_info(
+                    node,
+                    last_event_id,
+                    event_type,
+                    block_hash,
+                    deploy_hash,
+                    account_key,
+                )
+                await backlog.acquire()
+                future = loop.run_in_executor(executor, _invoke_callback, event_callback, node, event_info, payload)
+                future.add_done_callback(lambda _: backlog.release())
+                if watermark:
+                    watermark.on_dispatched(event_info, future)
+                delay = _RECONNECT_DELAY
+
+                # Resume from event subsequent to that last processed.
+                if last_event_id:
+                    event_id = last_event_id + 1
+
+                # Escape upon a failed event so that stream can be resumed from it.
+                if watermark and watermark.failed:
+                    break
+        except asyncio.CancelledError:
+            raise
+        except Exception as err:
+            log_event(EventType.MONIT_STREAM_BIND_ERROR, err, node)
+        finally:
+            await events.aclose()
+
+        # Resume from a failed event under a fresh mark so that checkpointing continues.
+        if watermark and watermark.failed:
+            event_id = watermark.failed.event_id
+            watermark = EventWatermark(checkpoint)
+            log_event(EventType.MONIT_STREAM_BIND_ERROR, f"event callback failed - resuming stream from event {event_id}", node)
+
+        await asyncio.sleep(delay)
+        delay = min(delay * 2, EnvVars.RECONNECT_DELAY_MAX)
+
+
+async def _yield_events(node: Node, event_id: int) -> typing.AsyncIterator[tuple]:
+    """Yields events streaming from node.
+
+    """
+    parser = EventStreamParser()
+    async for chunk in _yield_chunks(node, event_id):
+        for raw_event_id, data in parser.feed(chunk):
+            parsed = _parse_event(node, int(raw_event_id) if raw_event_id else 0, json.loads(data))
+            if parsed:
+                yield parsed
+
+
+async def _yield_chunks(node: Node, event_id: int) -> typing.AsyncIterator[bytes]:
+    """Yields raw chunks of an http event stream body as they arrive.
+
+    """
+    # Set url.
+    url = urllib.parse.urlsplit(node.url_event)
+    path = url.path
+    if event_id:
+        path = f"{path}?start_from={event_id}"
+
+    # Open connection & issue request.
+    reader, writer = await _read(asyncio.open_connection(url.hostname, url.port))
+    try:
+        writer.write((
+            f"GET {path} HTTP/1.1\r\n"
+            f"Host: {url.netloc}\r\n"
+            "Accept: text/event-stream\r\n"
+            "Cache-Control: no-cache\r\n"
+            "\r\n"
+            ).encode("ascii"))
+        await writer.drain()
+
+        # Parse response head.
+        status = (await _read(reader.readline())).decode("latin-1").split()
+        if len(status) < 2 or status[1] != "200":
+            raise IOError(f"event stream request failed :: {' '.join(status)}")
+        headers = {}
+        while True:
+            line = (await _read(reader.readline())).decode("latin-1").strip()
+            if not line:
+                break
+            name, _, value = line.partition(":")
+            headers[name.strip().lower()] = value.strip().lower()
+
+        # Yield body.
+        if headers.get("transfer-encoding") == "chunked":
+            while True:
+                size = int((await _read(reader.readline())).split(b";")[0], 16)
+                if size == 0:
+                    return
+                yield await _read(reader.readexactly(size))
+                await _read(reader.readline())
+        else:
+            while True:
+                chunk = await _read(reader.read(_READ_SIZE))
+                if not chunk:
+                    return
+                yield chunk
+
+    finally:
+        writer.close()
+
+
+async def _read(awaitable: typing.Awaitable) -> typing.Any:
+    """Awaits a stream read, raising a timeout error should the stream fall idle - e.g. a half-open connection.
+
+    """
+    return await asyncio.wait_for(awaitable, EnvVars.READ_TIMEOUT)
+
+
+def _invoke_callback(event_callback: typing.Callable, node: Node, event_info: NodeEventInfo, payload: dict) -> bool:
+    """Invokes event callback within a worker thread, logging rather than propagating errors.
+
+    :returns: Flag indicating whether event was processed.
+
+    """
+    try:
+        event_callback(node, event_info, payload)
+    except Exception as err:
+        log_event(EventType.MONIT_STREAM_BIND_ERROR, err, node)
+        return False
+
+    return True
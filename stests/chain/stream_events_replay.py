@@ -0,0 +1,271 @@
+import asyncio
+import gzip
+import json
+import threading
+import time
+import typing
+import urllib.parse
+
+from stests.chain.stream_events import _yield_raw_events
+from stests.core.types.infra import Node
+
+
+
+# Event emitted upon opening of a replayed stream.
+_API_VERSION_EVENT = {"ApiVersion": "1.0.0"}
+
+# JSON-RPC error: method not found.
+_RPC_ERROR_METHOD_NOT_FOUND = {"code": -32601, "message": "Method not found"}
+
+# JSON-RPC error: entity not found.
+_RPC_ERROR_NOT_FOUND = {"code": -32602, "message": "Not found"}
+
+
+def record(
+    node: Node,
+    fpath: str,
+    event_id: int = 0,
+    max_events: int = None,
+    max_seconds: float = None,
+    ) -> int:
+    """Records raw events streaming from a node to a gzipped file of JSON lines.
+
+    :param node: The node to which to bind.
+    :param fpath: Path to file to which events will be written.
+    :param event_id: Identifer of event from which to start stream.
+    :param max_events: Number of events after which to stop recording.
+    :param max_seconds: Duration after which to stop recording.
+
+    :returns: Number of events recorded.
+
+    """
+    count = 0
+    started = time.monotonic()
+    with gzip.open(fpath, "wt", encoding="utf-8") as fstream:
+        for raw_event_id, data in _yield_raw_events(node, event_id):
+            offset = time.monotonic() - started
+            fstream.write(json.dumps({
+                "offset": round(offset, 6),
+                "id": int(raw_event_id) if raw_event_id else 0,
+                "data": json.loads(data),
+            }) + "\n")
+            count += 1
+            if (max_events and count >= max_events) or (max_seconds and offset >= max_seconds):
+                break
+
+    return count
+
+
+def read(fpath: str) -> typing.List[dict]:
+    """Returns events previously recorded to a gzipped file of JSON lines.
+
+    :param fpath: Path to file to which events were written.
+
+    :returns: Recorded events, i.e. dictionaries of offset, id & data.
+
+    """
+    with gzip.open(fpath, "rt", encoding="utf-8") as fstream:
+        return [json.loads(i) for i in fstream if i.strip()]
+
+
+def write(fpath: str, events: typing.List[dict]):
+    """Writes a set of events to a gzipped file of JSON lines - e.g. a synthetic recording.
+
+    :param fpath: Path to file to which events will be written.
+    :param events: Events, i.e. dictionaries of offset, id & data.
+
+    """
+    with gzip.open(fpath, "wt", encoding="utf-8") as fstream:
+        for event in events:
+            fstream.write(json.dumps(event) + "\n")
+
+
+class ReplayServer():
+    """Local HTTP server replaying recorded events over SSE, plus JSON-RPC queries for recorded blocks & deploys.
+
+    """
+
+    def __init__(self, events: typing.List[dict], speed: float = 1.0):
+        """Constructor.
+
+        :param events: Recorded events.
+        :param speed: Replay speed multiplier, e.g. 1 | 10 - 0 replays at maximum speed.
+
+        """
+        self.events = events
+        self.speed = speed
+        self.port = None
+        self._blocks = dict()
+        self._connections = set()
+        self._deploys = dict()
+        self._loop = None
+        self._server = None
+        self._thread = None
+        for event in events:
+            self._index_event(event["data"])
+
+
+    def start(self, host: str = "127.0.0.1", port: int = 0) -> int:
+        """Starts server within a background thread.
+
+        :param host: Interface upon which to listen.
+        :param port: Port upon which to listen - 0 binds an ephemeral port.
+
+        :returns: Port upon which server is listening.
+
+        """
+        started = threading.Event()
+
+        def _run():
+            self._loop = asyncio.new_event_loop()
+            self._server = self._loop.run_until_complete(asyncio.start_server(self._on_connection, host, port))
+            self.port = self._server.sockets[0].getsockname()[1]
+            started.set()
+            try:
+                self._loop.run_forever()
+            finally:
+                self._loop.close()
+
+        self._thread = threading.Thread(target=_run, daemon=True)
+        self._thread.start()
+        started.wait()
+
+        return self.port
+
+
+    def stop(self):
+        """Stops server, closing open connections prior to stopping event loop.
+
+        """
+        if self._loop is not None:
+            asyncio.run_coroutine_threadsafe(self._shutdown(), self._loop).result()
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+            self._loop = None
+
+
+    async def _shutdown(self):
+        """Closes server & cancels connection handlers.
+
+        """
+        self._server.close()
+        for task in self._connections:
+            task.cancel()
+        await asyncio.gather(*self._connections, return_exceptions=True)
+        await self._server.wait_closed()
+
+
+    def _index_event(self, payload: dict):
+        """Indexes blocks & deploys carried by an event so that they can be queried.
+
+        """
+        if "BlockAdded" in payload and "block" in payload["BlockAdded"]:
+            self._blocks[payload["BlockAdded"]["block_hash"]] = payload["BlockAdded"]["block"]
+
+        elif "DeployProcessed" in payload:
+            info = payload["DeployProcessed"]
+            self._deploys[info["deploy_hash"]] = {
+                "deploy": {
+                    "hash": info["deploy_hash"],
+                    "header": {
+                        "account": info.get("account"),
+                        "timestamp": info.get("timestamp"),
+                        "ttl": info.get("ttl"),
+                        "dependencies": info.get("dependencies", []),
+                    },
+                },
+                "execution_results": [{
+                    "block_hash": info["block_hash"],
+                    "result": info.get("execution_result"),
+                }],
+            }
+
+
+    async def _on_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Handles an inbound http connection.
+
+        """
+        task = asyncio.current_task()
+        self._connections.add(task)
+        try:
+            while True:
+                request_line = (await reader.readline()).decode("latin-1")
+                if not request_line:
+                    break
+                method, target, _ = request_line.split(" ", 2)
+                headers = {}
+                while True:
+                    line = (await reader.readline()).decode("latin-1").strip()
+                    if not line:
+                        break
+                    name, _, value = line.partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                body = await reader.readexactly(int(headers.get("content-length", 0)))
+
+                # N.B. JSON-RPC connections are kept alive so as to mirror a node's behaviour.
+                url = urllib.parse.urlsplit(target)
+                if method == "POST" and url.path == "/rpc":
+                    await self._respond_rpc(writer, json.loads(body))
+                    continue
+                if method == "GET" and url.path == "/events":
+                    query = urllib.parse.parse_qs(url.query)
+                    await self._stream_events(writer, int(query.get("start_from", ["0"])[0]))
+                else:
+                    writer.write(b"HTTP/1.1 404 Not Found\r\nContent-Length: 0\r\nConnection: close\r\n\r\n")
+                    await writer.drain()
+                break
+
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+
+        finally:
+            writer.close()
+            self._connections.discard(task)
+
+
+    async def _stream_events(self, writer: asyncio.StreamWriter, start_from: int):
+        """Streams recorded events paced in accordance with replay speed.
+
+        """
+        writer.write(b"HTTP/1.1 200 OK\r\nContent-Type: text/event-stream\r\nCache-Control: no-cache\r\nConnection: close\r\n\r\n")
+        writer.write(f"data:{json.dumps(_API_VERSION_EVENT)}\n\n".encode("utf-8"))
+        await writer.drain()
+
+        started = time.monotonic()
+        events = [i for i in self.events if i["id"] >= start_from]
+        base_offset = events[0]["offset"] if events else 0
+        for event in events:
+            if self.speed:
+                delay = (event["offset"] - base_offset) / self.speed - (time.monotonic() - started)
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            writer.write(f"data:{json.dumps(event['data'])}\nid:{event['id']}\n\n".encode("utf-8"))
+            await writer.drain()
+
+
+    async def _respond_rpc(self, writer: asyncio.StreamWriter, request: dict):
+        """Responds to a JSON-RPC query for a recorded block or deploy.
+
+        """
+        response = {"jsonrpc": "2.0", "id": request.get("id")}
+        params = request.get("params") or {}
+        if request["method"] == "chain_get_block":
+            try:
+                response["result"] = {"block": self._blocks[params["block_identifier"]["Hash"]]}
+            except (KeyError, TypeError):
+                response["error"] = _RPC_ERROR_NOT_FOUND
+        elif request["method"] == "info_get_deploy":
+            try:
+                response["result"] = self._deploys[params["deploy_hash"]]
+            except KeyError:
+                response["error"] = _RPC_ERROR_NOT_FOUND
+        else:
+            response["error"] = _RPC_ERROR_METHOD_NOT_FOUND
+
+        body = json.dumps(response).encode("utf-8")
+        writer.write(
+            b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n" + \
+            f"Content-Length: {len(body)}\r\n\r\n".encode("latin-1") + \
+            body
+            )
+        await writer.drain()
@@ -0,0 +1,57 @@
+import json
+import typing
+
+from stests.core.cache.codecs import json_compact
+from stests.core.cache.codecs import msgpack
+from stests.core.utils import env
+from stests.core.utils.exceptions import InvalidEnvironmentVariable
+
+
+
+# Environment variables required by this module.
+class EnvVars:
+    # Cache codec type.
+    TYPE = env.get_var("CACHE_CODEC", "JSON")
+
+
+# Map: Cache codec type -> codec.
+CODECS = {
+    "JSON": json_compact,
+    "MSGPACK": msgpack,
+}
+
+# Map: Format tag -> codec.
+CODECS_BY_TAG = {i.TAG: i for i in CODECS.values()}
+
+# Leading byte of a tagged entry - never the leading byte of a utf-8 encoded legacy JSON entry.
+TAG_MARKER = b"\xff"
+
+
+def encode(obj: typing.Any) -> bytes:
+    """Returns an encoded domain object prefixed with a format tag.
+
+    :param obj: Domain object encoded in readiness for serialisation.
+
+    :returns: Serialised domain object.
+
+    """ 
+    try:
+        codec = CODECS[EnvVars.TYPE]
+    except KeyError:
+        raise InvalidEnvironmentVariable("CACHE_CODEC", EnvVars.TYPE, CODECS)
+
+    return TAG_MARKER + codec.TAG + codec.encode(obj)
+
+
+def decode(as_bytes: bytes) -> typing.Any:
+    """Returns a decoded domain object - entries without a format tag are treated as legacy JSON.
+
+    :param as_bytes: Serialised domain object.
+
+    :returns: Domain object ready to be decoded.
+
+    """ 
+    if as_bytes[:1] != TAG_MARKER:
+        return json.loads(as_bytes)
+
+    return CODECS_BY_TAG[as_bytes[1:2]].decode(as_bytes[2:])
@@ -0,0 +1,21 @@
+import json
+import typing
+
+
+
+# Format tag written alongside each entry.
+TAG = b"j"
+
+
+def encode(obj: typing.Any) -> bytes:
+    """Returns an object serialised as compact JSON.
+
+    """
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def decode(as_bytes: bytes) -> typing.Any:
+    """Returns an object deserialised from JSON.
+
+    """
+    return json.loads(as_bytes)
@@ -0,0 +1,22 @@
+import typing
+
+import msgpack
+
+
+
+# Format tag written alongside each entry.
+TAG = b"m"
+
+
+def encode(obj: typing.Any) -> bytes:
+    """Returns an object serialised as msgpack.
+
+    """
+    return msgpack.packb(obj, use_bin_type=True)
+
+
+def decode(as_bytes: bytes) -> typing.Any:
+    """Returns an object deserialised from msgpack.
+
+    """
+    return msgpack.unpackb(as_bytes, raw=False)
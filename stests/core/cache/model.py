@@ -1,9 +1,9 @@
 import enum
-import json
 import os
 import pwd
 import typing
 
+from stests.core.cache import codecs
 from stests.core.utils import encoder
 
 
@@ -35,13 +35,72 @@ class Item():
         self.expiration = expiration
 
     @property
-    def data_as_json(self):
-        return json.dumps(encoder.encode(self.data), indent=4)
+    def data_as_bytes(self):
+        return codecs.encode(encoder.encode(self.data))
 
     def apply_key_prefix(self):
         self.key = f"{_OS_USER}:{self.key}"
 
 
+class ItemBatch():
+    """A batch of items to be encached in a single round-trip.
+    
+    """
+    def __init__(self, items: typing.List[Item]):
+        self.items = items
+
+    def apply_key_prefix(self):
+        for item in self.items:
+            item.apply_key_prefix()
+
+
+class IndexKey():
+    """A key of an entry within a secondary index, i.e. a hash mapping a field to an item key.
+    
+    """
+    def __init__(self, paths: typing.List[str], field: str):
+        self.key = ":".join([str(i) for i in paths])
+        self.field = field
+
+    def apply_key_prefix(self):
+        self.key = f"{_OS_USER}:{self.key}"
+
+
+class IndexKeyBatch(IndexKey):
+    """A key of a set of entries within a secondary index, i.e. a hash mapping fields to item keys.
+    
+    """
+    def __init__(self, paths: typing.List[str], fields: typing.List[str]):
+        super().__init__(paths, None)
+        self.fields = fields
+
+
+class IndexedItem(Item):
+    """An item to be encached alongside it's key plus an entry within a secondary index.
+    
+    """
+    def __init__(self, item_key: ItemKey, data: typing.Any, index_key: IndexKey, expiration: int = None):
+        super().__init__(item_key, data, expiration)
+        self.index_key = index_key
+
+    def apply_key_prefix(self):
+        super().apply_key_prefix()
+        self.index_key.apply_key_prefix()
+
+
+class IndexSearchKey():
+    """A key used to search a secondary index for entries pointing to items under matched keys.
+    
+    """
+    def __init__(self, index_paths: typing.List[str], paths: typing.List[str]):
+        self.key = ":".join([str(i) for i in index_paths])
+        self.item_key_prefix = ":".join([str(i) for i in paths])
+
+    def apply_key_prefix(self):
+        self.key = f"{_OS_USER}:{self.key}"
+        self.item_key_prefix = f"{_OS_USER}:{self.item_key_prefix}"
+
+
 class CountDecrementKey(ItemKey):
     """A key used to decrement a counter.
     
@@ -60,6 +119,69 @@ class CountIncrementKey(ItemKey):
         self.amount = amount
         
 
+class ExpirationKey(ItemKey):
+    """A key used to reset an encached item's expiration.
+    
+    """
+    def __init__(self, paths: typing.List[str], names: typing.List[str], expiration: int):
+        super().__init__(paths, names)
+        self.expiration = expiration
+
+
+class HashCountIncrementKey(ItemKey):
+    """A key used to increment a counter held within a field of a hash, e.g. a histogram bucket.
+    
+    """
+    def __init__(self, paths: typing.List[str], names: typing.List[str], field: str, amount: int):
+        super().__init__(paths, names)
+        self.field = field
+        self.amount = amount
+
+
+class TrackerKey(ItemKey):
+    """A key of a completion tracker, i.e. a hash of outstanding members plus a count of members pending.
+    
+    """
+    def __init__(
+        self,
+        paths: typing.List[str],
+        names: typing.List[str],
+        member: str = None,
+        count: int = None,
+        expiration: int = None,
+        members: typing.List[str] = None,
+        outcome: str = None,
+        ):
+        super().__init__(paths, names)
+        self.member = member
+        self.members = members
+        self.count = count
+        self.expiration = expiration
+        self.outcome = outcome
+
+
+class BarrierKey(ItemKey):
+    """A key of a barrier, i.e. a set of members that have arrived.
+    
+    """
+    def __init__(self, paths: typing.List[str], names: typing.List[str], member: str, expiration: int = None):
+        super().__init__(paths, names)
+        self.member = member
+        self.expiration = expiration
+
+
+class CountIncrementKeyBatch():
+    """A batch of keys used to atomically increment a set of counters.
+    
+    """
+    def __init__(self, keys: typing.List[CountIncrementKey]):
+        self.keys = keys
+
+    def apply_key_prefix(self):
+        for key in self.keys:
+            key.apply_key_prefix()
+        
+
 class SearchKey():
     """A key used to perform a cache search.
     
@@ -76,9 +198,15 @@ class StoreOperation(enum.Enum):
     """Enumeration over types of cache operation.
     
     """
+    # Atomically add a member to a barrier.
+    BARRIER_ARRIVE = enum.auto()
+
     # Atomically increment a counter.
     COUNTER_INCR = enum.auto()
 
+    # Atomically increment a batch of counters.
+    COUNTER_INCR_MANY = enum.auto()
+
     # Atomically decrement a counter.
     COUNTER_DECR = enum.auto()
 
@@ -87,6 +215,9 @@ class StoreOperation(enum.Enum):
 
     # Flush a key set.
     DELETE_MANY = enum.auto()
+
+    # Delete entries within a secondary index.
+    DELETE_MANY_FROM_INDEX = enum.auto()
     
     # Get count of matched cache item.
     GET_COUNT = enum.auto()
@@ -97,21 +228,63 @@ class StoreOperation(enum.Enum):
     # Get value of many cached counters.
     GET_COUNTER_MANY = enum.auto()
 
+    # Get field counts of many cached hashes.
+    GET_HASH_COUNTER_MANY = enum.auto()
+
+    # Atomically increment a batch of counters held within hash fields.
+    HASH_COUNTER_INCR_MANY = enum.auto()
+
     # Get a single cached item.
     GET_ONE = enum.auto()
 
     # Get a single cached item from a collection.
     GET_ONE_FROM_MANY = enum.auto()
 
+    # Get a single cached item via a secondary index.
+    GET_ONE_FROM_INDEX = enum.auto()
+
     # Get a collection of cached items.
     GET_MANY = enum.auto()
 
+    # Get a collection of cached items via a secondary index.
+    GET_MANY_FROM_INDEX = enum.auto()
+
     # Set an item.
     SET_ONE = enum.auto()
 
+    # Set a batch of items.
+    SET_MANY = enum.auto()
+
+    # Set an item plus an entry within a secondary index.
+    SET_ONE_INDEXED = enum.auto()
+
     # Set cached item plus flag indicating whether it already was cached.
     SET_ONE_SINGLETON = enum.auto()
 
+    # Reset an item's expiration.
+    SET_EXPIRATION = enum.auto()
+
+    # Atomically close an open completion tracker such that subsequent updates are ignored.
+    TRACKER_CLOSE = enum.auto()
+
+    # Get a completion tracker's pending count & outstanding members.
+    TRACKER_GET = enum.auto()
+
+    # Get a completion tracker's pending & outstanding counts.
+    TRACKER_GET_COUNT = enum.auto()
+
+    # Atomically remove an outstanding member from a completion tracker.
+    TRACKER_REMOVE = enum.auto()
+
+    # Atomically remove a set of outstanding members from a completion tracker.
+    TRACKER_REMOVE_MANY = enum.auto()
+
+    # Initialise a completion tracker with a count of members pending.
+    TRACKER_SET = enum.auto()
+
+    # Atomically move a pending member into a completion tracker's outstanding set.
+    TRACKER_SET_MEMBER = enum.auto()
+
 
 class StorePartition(enum.Enum):
     """Enumeration over set of types of store partition.
@@ -1,8 +1,13 @@
+import typing
+
 from stests.core.cache.model import Item
+from stests.core.cache.model import ItemBatch
 from stests.core.cache.model import ItemKey
+from stests.core.cache.model import SearchKey
 from stests.core.cache.model import StoreOperation
 from stests.core.cache.model import StorePartition
 from stests.core.cache.ops.utils import cache_op
+from stests.core.types.chain import BlockStatistics
 from stests.core.types.infra import NodeEventInfo
 from stests.core.types.infra import NodeMonitoringLock
 from stests.events import EventType
@@ -11,14 +16,22 @@ from stests.events import EventType
 
 # Cache collections.
 COL_BLOCK = "block"
+COL_BLOCK_ADDED = "block-added"
 COL_DEPLOY = "deploy"
+COL_DEPLOY_PROCESSED = "deploy-processed"
 COL_EVENT = "event"
+COL_EVENT_CHECKPOINT = "event-checkpoint"
 COL_NODE_LOCK = "node-lock"
+COL_SHARD_HEARTBEAT = "shard-heartbeat"
 
 # Cache collection item expiration times.
 EXPIRATION_COL_BLOCK = 300
+EXPIRATION_COL_BLOCK_ADDED = 300
 EXPIRATION_COL_DEPLOY = 300
+EXPIRATION_COL_DEPLOY_PROCESSED = 300
 EXPIRATION_COL_EVENT = 300
+EXPIRATION_COL_EVENT_CHECKPOINT = 600
+EXPIRATION_COL_SHARD_HEARTBEAT = 30
 
 
 @cache_op(StorePartition.MONITORING_LOCKS, StoreOperation.DELETE_ONE)
@@ -42,6 +55,95 @@ def delete_node_monitor_lock(lock: NodeMonitoringLock) -> ItemKey:
     )
 
 
+@cache_op(StorePartition.MONITORING_LOCKS, StoreOperation.DELETE_ONE)
+def delete_shard_heartbeat(network: str, shard_id: str) -> ItemKey:
+    """Deletes a monitoring shard heartbeat - thereby releasing it's nodes to other shards.
+
+    :param network: Name of network being monitored.
+    :param shard_id: Identifier of monitoring shard.
+
+    :returns: Key of heartbeat item.
+
+    """
+    return ItemKey(
+        paths=[
+            network,
+            COL_SHARD_HEARTBEAT,
+        ],
+        names=[
+            shard_id,
+        ],
+    )
+
+
+@cache_op(StorePartition.MONITORING, StoreOperation.GET_ONE)
+def get_block_added(network: str, block_hash: str) -> ItemKey:
+    """Decaches statistics of a block whose addition has been observed.
+
+    :param network: Name of network being monitored.
+    :param block_hash: Hash of added block.
+
+    :returns: Key of cached item.
+
+    """
+    return ItemKey(
+        paths=[
+            network,
+            COL_BLOCK_ADDED,
+        ],
+        names=[
+            block_hash,
+        ],
+    )
+
+
+@cache_op(StorePartition.MONITORING, StoreOperation.GET_MANY)
+def get_deploys_processed(network: str, block_hash: str) -> SearchKey:
+    """Decaches collection of deploys observed as processed within a block.
+
+    :param network: Name of network being monitored.
+    :param block_hash: Hash of block within which deploys were processed.
+
+    :returns: Search key.
+
+    """
+    return SearchKey([
+        network,
+        COL_DEPLOY_PROCESSED,
+        block_hash,
+    ])
+
+
+@cache_op(StorePartition.MONITORING, StoreOperation.GET_MANY)
+def get_node_event_checkpoints(network: str) -> SearchKey:
+    """Decaches collection of node event stream checkpoints.
+
+    :param network: Name of network being monitored.
+
+    :returns: Search key.
+
+    """
+    return SearchKey([
+        network,
+        COL_EVENT_CHECKPOINT,
+    ])
+
+
+@cache_op(StorePartition.MONITORING_LOCKS, StoreOperation.GET_MANY)
+def get_shard_heartbeats(network: str) -> SearchKey:
+    """Decaches collection of live monitoring shard heartbeats.
+
+    :param network: Name of network being monitored.
+
+    :returns: Search key.
+
+    """
+    return SearchKey([
+        network,
+        COL_SHARD_HEARTBEAT,
+    ])
+
+
 @cache_op(StorePartition.MONITORING, StoreOperation.SET_ONE_SINGLETON)
 def set_block(info: NodeEventInfo) -> Item:
     """Encaches an item.
@@ -69,6 +171,30 @@ def set_block(info: NodeEventInfo) -> Item:
     )
 
 
+@cache_op(StorePartition.MONITORING, StoreOperation.SET_ONE)
+def set_block_added(block: BlockStatistics) -> Item:
+    """Encaches statistics of a block whose addition has been observed.
+    
+    :param block: Statistics of added block.
+
+    :returns: Item to be cached.
+
+    """
+    return Item(
+        item_key=ItemKey(
+            paths=[
+                block.network,
+                COL_BLOCK_ADDED,
+            ],
+            names=[
+                block.block_hash,
+            ],
+        ),
+        data=block,
+        expiration=EXPIRATION_COL_BLOCK_ADDED
+    )
+
+
 @cache_op(StorePartition.MONITORING, StoreOperation.SET_ONE_SINGLETON)
 def set_deploy(network: str, block_hash: str, deploy_hash: str) -> Item:
     """Encaches an item.
@@ -98,6 +224,68 @@ def set_deploy(network: str, block_hash: str, deploy_hash: str) -> Item:
     )
 
 
+@cache_op(StorePartition.MONITORING, StoreOperation.SET_ONE)
+def set_deploy_processed(info: NodeEventInfo, execution_result: dict) -> Item:
+    """Encaches outcome of a deploy observed as processed within a block.
+    
+    :param info: Node event information.
+    :param execution_result: Execution result carried by event, i.e. cost plus success | failure.
+
+    :returns: Item to be cached.
+
+    """
+    return Item(
+        item_key=ItemKey(
+            paths=[
+                info.network,
+                COL_DEPLOY_PROCESSED,
+                info.block_hash,
+            ],
+            names=[
+                info.deploy_hash,
+            ],
+        ),
+        data={
+            "block_hash": info.block_hash,
+            "deploy_hash": info.deploy_hash,
+            "execution_result": execution_result,
+            "network": info.network,
+        },
+        expiration=EXPIRATION_COL_DEPLOY_PROCESSED
+    )
+
+
+@cache_op(StorePartition.MONITORING, StoreOperation.SET_MANY)
+def set_node_event_checkpoints(checkpoints: typing.List[NodeEventInfo]) -> ItemBatch:
+    """Encaches a batch of node event stream checkpoints, i.e. the last event processed per node.
+    
+    :param checkpoints: Information pertaining to most recent event processed per node.
+
+    :returns: Batch of items to be cached.
+
+    """
+    return ItemBatch([
+        Item(
+            item_key=ItemKey(
+                paths=[
+                    info.network,
+                    COL_EVENT_CHECKPOINT,
+                ],
+                names=[
+                    info.label_node_index,
+                ],
+            ),
+            data={
+                "event_id": info.event_id,
+                "network": info.network,
+                "node_index": info.node_index,
+            },
+            expiration=EXPIRATION_COL_EVENT_CHECKPOINT
+        )
+        for info in checkpoints
+    ])
+
+
 @cache_op(StorePartition.MONITORING, StoreOperation.SET_ONE_SINGLETON)
 def set_node_event_info(info: NodeEventInfo) -> Item:
     """Encaches an item.
@@ -159,3 +347,31 @@ def set_node_monitor_lock(lock: NodeMonitoringLock) -> Item:
         ),
         data=lock
     )
+
+
+@cache_op(StorePartition.MONITORING_LOCKS, StoreOperation.SET_ONE)
+def set_shard_heartbeat(network: str, shard_id: str) -> Item:
+    """Encaches a monitoring shard heartbeat - expires unless renewed.
+
+    :param network: Name of network being monitored.
+    :param shard_id: Identifier of monitoring shard.
+
+    :returns: Item to be cached.
+
+    """
+    return Item(
+        item_key=ItemKey(
+            paths=[
+                network,
+                COL_SHARD_HEARTBEAT,
+            ],
+            names=[
+                shard_id,
+            ],
+        ),
+        data={
+            "network": network,
+            "shard_id": shard_id,
+        },
+        expiration=EXPIRATION_COL_SHARD_HEARTBEAT
+    )
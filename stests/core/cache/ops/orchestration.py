@@ -2,19 +2,27 @@ import random
 import typing
 
 from stests.core import factory
+from stests.core.cache.model import BarrierKey
 from stests.core.cache.model import CountIncrementKey
+from stests.core.cache.model import CountIncrementKeyBatch
+from stests.core.cache.model import ExpirationKey
+from stests.core.cache.model import HashCountIncrementKey
 from stests.core.cache.model import Item
 from stests.core.cache.model import ItemKey
 from stests.core.cache.model import SearchKey
 from stests.core.cache.model import StoreOperation
 from stests.core.cache.model import StorePartition
+from stests.core.cache.model import TrackerKey
 from stests.core.cache.ops.utils import cache_op
+from stests.core.types.chain import Deploy
 from stests.core.types.infra import NetworkIdentifier
 from stests.core.types.orchestration import ExecutionAspect
 from stests.core.types.orchestration import ExecutionContext
 from stests.core.types.orchestration import ExecutionInfo
 from stests.core.types.orchestration import ExecutionLock
 from stests.core.types.orchestration import ExecutionStatus
+from stests.core.utils import histogram
+from stests.core.utils import timeline
 import stests.core.cache.ops.infra as infra
 
 
@@ -25,13 +33,19 @@ _PARTITION = StorePartition.ORCHESTRATION
 # Cache collections.
 COL_CONTEXT = "context"
 COL_DEPLOY_COUNT = "deploy-count"
+COL_DISPATCH_TIMELINE = "dispatch-timeline"
+COL_FINALIZATION_HISTOGRAM = "finalization-histogram"
 COL_GENERATOR_RUN_COUNT = "generator-run-count"
 COL_INFO = "info"
 COL_LOCK = "lock"
+COL_PHASE_BARRIER = "phase-barrier"
+COL_STEP_TRACKER = "step-tracker"
 
 # Cache collection item expiration times.
 EXPIRATION_COL_CONTEXT = 3600
 EXPIRATION_COL_INFO = 3600
+EXPIRATION_COL_PHASE_BARRIER = 86400
+EXPIRATION_COL_STEP_TRACKER = 86400
 
 
 @cache_op(_PARTITION, StoreOperation.DELETE_MANY)
@@ -62,6 +76,10 @@ def prune_on_run_completion(ctx: ExecutionContext) -> SearchKey:
     """
     _delete_on_run_completion_1(ctx)
     _delete_on_run_completion_2(ctx)
+    _delete_on_run_completion_3(ctx)
+    _delete_on_run_completion_4(ctx)
+    _delete_on_run_completion_5(ctx)
+    _delete_on_run_completion_6(ctx)
 
 
 @cache_op(_PARTITION, StoreOperation.DELETE_MANY)
@@ -102,6 +120,110 @@ def _delete_on_run_completion_2(ctx: ExecutionContext) -> SearchKey:
     )
 
 
+@cache_op(_PARTITION, StoreOperation.DELETE_MANY)
+def _delete_on_run_completion_3(ctx: ExecutionContext) -> SearchKey:
+    """Deletes data cached during the course of a run.
+
+    :param ctx: Execution context information.
+    :returns: Cache search key under which all records will be deleted.
+
+    """
+    return SearchKey(
+        paths=[
+            ctx.network,
+            ctx.run_type,
+            ctx.label_run_index,
+            COL_FINALIZATION_HISTOGRAM,
+            "P-"
+        ]
+    )
+
+
+@cache_op(_PARTITION, StoreOperation.DELETE_MANY)
+def _delete_on_run_completion_4(ctx: ExecutionContext) -> SearchKey:
+    """Deletes data cached during the course of a run.
+
+    :param ctx: Execution context information.
+    :returns: Cache search key under which all records will be deleted.
+
+    """
+    return SearchKey(
+        paths=[
+            ctx.network,
+            ctx.run_type,
+            ctx.label_run_index,
+            COL_DISPATCH_TIMELINE,
+            "P-"
+        ]
+    )
+
+
+@cache_op(_PARTITION, StoreOperation.DELETE_MANY)
+def _delete_on_run_completion_5(ctx: ExecutionContext) -> SearchKey:
+    """Deletes data cached during the course of a run.
+
+    :param ctx: Execution context information.
+    :returns: Cache search key under which all records will be deleted.
+
+    """
+    return SearchKey(
+        paths=[
+            ctx.network,
+            ctx.run_type,
+            ctx.label_run_index,
+            COL_STEP_TRACKER,
+            "P-"
+        ]
+    )
+
+
+@cache_op(_PARTITION, StoreOperation.DELETE_MANY)
+def _delete_on_run_completion_6(ctx: ExecutionContext) -> SearchKey:
+    """Deletes data cached during the course of a run.
+
+    :param ctx: Execution context information.
+    :returns: Cache search key under which all records will be deleted.
+
+    """
+    return SearchKey(
+        paths=[
+            ctx.network,
+            ctx.run_type,
+            ctx.label_run_index,
+            COL_PHASE_BARRIER,
+            "P-"
+        ]
+    )
+
+
+@cache_op(_PARTITION, StoreOperation.TRACKER_REMOVE)
+def delete_step_tracker_deploy(ctx: ExecutionContext, deploy_hash: str) -> TrackerKey:
+    """Removes (atomically) a finalised deploy from a step's deploy completion tracker.
+
+    :param ctx: Execution context information.
+    :param deploy_hash: Hash of a finalised deploy.
+
+    :returns: Flag indicating whether deploy was outstanding, count of deploys pending dispatch
+              (None if step is untracked) & count of deploys outstanding.
+
+    """
+    return _get_step_tracker_key(ctx, member=deploy_hash)
+
+
+@cache_op(_PARTITION, StoreOperation.TRACKER_REMOVE_MANY)
+def delete_step_tracker_deploys(ctx: ExecutionContext, deploy_hashes: typing.List[str]) -> TrackerKey:
+    """Removes (atomically) a set of finalised deploys from a step's deploy completion tracker.
+
+    :param ctx: Execution context information.
+    :param deploy_hashes: Hashes of a set of finalised deploys.
+
+    :returns: Flags indicating whether each deploy was outstanding, count of deploys pending dispatch
+              (None if step is untracked) & count of deploys outstanding.
+
+    """
+    return _get_step_tracker_key(ctx, members=deploy_hashes)
+
+
 @cache_op(_PARTITION, StoreOperation.GET_ONE)
 def get_context(network: str, run_index: int, run_type: str) -> ItemKey:
     """Decaches domain object: ExecutionContext.
@@ -216,6 +338,92 @@ def get_deploy_count_list(network_id: NetworkIdentifier, run_type: str = None, r
         )
 
 
+@cache_op(_PARTITION, StoreOperation.GET_HASH_COUNTER_MANY)
+def get_dispatch_timeline_list(network_id: NetworkIdentifier, run_type: str = None, run_index: int = None) -> SearchKey:
+    """Returns deploy dispatch timelines within the scope of an execution aspect.
+
+    :param network_id: Identifier of network being tested.
+    :param run_type: Type of run that was executed.
+    :param run_index: Index of a run.
+
+    :returns: Timeline keys & timelines, i.e. maps of slot index -> count.
+
+    """
+    if run_type is None:
+        return SearchKey(
+            paths=[
+                network_id.name,
+                "*",
+                "*",
+                COL_DISPATCH_TIMELINE,
+                "-",
+            ],
+        )
+
+    elif run_index:
+        return SearchKey(
+            paths=[
+                network_id.name,
+                run_type,
+                f"R-{str(run_index).zfill(3)}",
+                COL_DISPATCH_TIMELINE,
+            ]
+        )
+
+    else:
+        return SearchKey(
+            paths=[
+                network_id.name,
+                run_type,
+                "*",
+                COL_DISPATCH_TIMELINE,
+            ]
+        )
+
+
+@cache_op(_PARTITION, StoreOperation.GET_HASH_COUNTER_MANY)
+def get_finalization_histogram_list(network_id: NetworkIdentifier, run_type: str = None, run_index: int = None) -> SearchKey:
+    """Returns deploy finalisation latency histograms within the scope of an execution aspect.
+
+    :param network_id: Identifier of network being tested.
+    :param run_type: Type of run that was executed.
+    :param run_index: Index of a run.
+
+    :returns: Histogram keys & histograms, i.e. maps of bucket lower bound (ms) -> count.
+
+    """
+    if run_type is None:
+        return SearchKey(
+            paths=[
+                network_id.name,
+                "*",
+                "*",
+                COL_FINALIZATION_HISTOGRAM,
+                "-",
+            ],
+        )
+
+    elif run_index:
+        return SearchKey(
+            paths=[
+                network_id.name,
+                run_type,
+                f"R-{str(run_index).zfill(3)}",
+                COL_FINALIZATION_HISTOGRAM,
+            ]
+        )
+
+    else:
+        return SearchKey(
+            paths=[
+                network_id.name,
+                run_type,
+                "*",
+                COL_FINALIZATION_HISTOGRAM,
+            ]
+        )
+
+
 @cache_op(_PARTITION, StoreOperation.GET_ONE)
 def get_info(ctx: ExecutionContext, aspect: ExecutionAspect) -> ItemKey:
     """Decaches domain object: ExecutionInfo.
@@ -282,6 +490,30 @@ def get_info_list(network_id: NetworkIdentifier, run_type: str, run_index: int =
         )
 
 
+@cache_op(_PARTITION, StoreOperation.TRACKER_GET)
+def get_step_tracker(ctx: ExecutionContext) -> TrackerKey:
+    """Returns a step's deploy completion tracker state.
+
+    :param ctx: Execution context information.
+
+    :returns: Count of deploys pending dispatch (None if step is untracked) & hashes of deploys outstanding.
+
+    """
+    return _get_step_tracker_key(ctx)
+
+
+@cache_op(_PARTITION, StoreOperation.TRACKER_GET_COUNT)
+def get_step_tracker_count(ctx: ExecutionContext) -> TrackerKey:
+    """Returns (in constant time) a step's deploy completion tracker counts.
+
+    :param ctx: Execution context information.
+
+    :returns: Count of deploys pending dispatch (None if step is untracked) & count of deploys outstanding.
+
+    """
+    return _get_step_tracker_key(ctx)
+
+
 @cache_op(_PARTITION, StoreOperation.COUNTER_INCR)
 def increment_deploy_count(
     ctx: ExecutionContext,
@@ -294,6 +526,60 @@ def increment_deploy_count(
     :param aspect: Aspect of execution in scope.
     :param amount: Amount by which to increment counter.
 
+    """
+    return _get_deploy_count_increment_key(ctx, aspect, amount)
+
+
+@cache_op(_PARTITION, StoreOperation.COUNTER_INCR_MANY)
+def increment_deploy_counts(ctx: ExecutionContext, amount: int = 1) -> CountIncrementKeyBatch:
+    """Increments (atomically & in a single round-trip) run, phase & step deploy counts.
+
+    :param ctx: Execution context information.
+    :param amount: Amount by which to increment counters.
+
+    :returns: Cache increment key batch - decached as [run count, phase count, step count].
+
+    """
+    return CountIncrementKeyBatch(
+        _get_deploy_count_increment_keys(ctx, amount)
+    )
+
+
+def increment_deploy_counts_bulk(
+    increments: typing.List[typing.Tuple[ExecutionContext, int]]
+    ) -> typing.List[typing.Tuple[int, int, int]]:
+    """Increments (atomically & in a single round-trip) run, phase & step deploy counts for a set of contexts.
+
+    :param increments: Sequence of (execution context, amount) pairs.
+
+    :returns: Sequence of (run count, phase count, step count) - one per increment.
+
+    """
+    counts = _increment_deploy_counts_bulk(increments) or []
+
+    return [tuple(counts[i:i + 3]) for i in range(0, len(counts), 3)]
+
+
+@cache_op(_PARTITION, StoreOperation.COUNTER_INCR_MANY)
+def _increment_deploy_counts_bulk(increments: typing.List[typing.Tuple[ExecutionContext, int]]) -> CountIncrementKeyBatch:
+    """Increments (atomically & in a single round-trip) run, phase & step deploy counts for a set of contexts.
+
+    :param increments: Sequence of (execution context, amount) pairs.
+
+    :returns: Cache increment key batch.
+
+    """
+    if not increments:
+        return
+
+    return CountIncrementKeyBatch([
+        key for ctx, amount in increments for key in _get_deploy_count_increment_keys(ctx, amount)
+    ])
+
+
+def _get_deploy_count_increment_key(ctx: ExecutionContext, aspect: ExecutionAspect, amount: int) -> CountIncrementKey:
+    """Returns key used to increment count of deploys within the scope of an execution aspect.
+
     """
     if aspect == ExecutionAspect.RUN:
         names = ["-"]
@@ -314,18 +600,77 @@ def increment_deploy_count(
     )
 
 
-def increment_deploy_counts(ctx: ExecutionContext, amount: int = 1) -> int:
-    """Increments (atomically) count of run deploys.
+def _get_deploy_count_increment_keys(ctx: ExecutionContext, amount: int) -> typing.List[CountIncrementKey]:
+    """Returns keys used to increment run, phase & step deploy counts.
 
-    :param ctx: Execution context information.
+    """
+    return [
+        _get_deploy_count_increment_key(ctx, aspect, amount)
+        for aspect in (ExecutionAspect.RUN, ExecutionAspect.PHASE, ExecutionAspect.STEP)
+    ]
+
+
+@cache_op(_PARTITION, StoreOperation.HASH_COUNTER_INCR_MANY)
+def increment_dispatch_timelines(deploy: Deploy) -> CountIncrementKeyBatch:
+    """Increments (atomically & in a single round-trip) run, phase & step deploy dispatch timelines.
+
+    :param deploy: A deploy dispatched during the course of a run.
+
+    :returns: Cache increment key batch.
 
     """
-    # TODO: increment as a batch.
-    return (
-        increment_deploy_count(ctx, ExecutionAspect.RUN, amount),
-        increment_deploy_count(ctx, ExecutionAspect.PHASE, amount),
-        increment_deploy_count(ctx, ExecutionAspect.STEP, amount)
-    )
+    return CountIncrementKeyBatch([
+        HashCountIncrementKey(
+            paths=[
+                deploy.network,
+                deploy.run_type,
+                deploy.label_run_index,
+                COL_DISPATCH_TIMELINE,
+            ],
+            names=i,
+            field=timeline.get_slot(deploy.dispatch_timestamp.timestamp()),
+            amount=1,
+        )
+        for i in _get_deploy_aspect_names(deploy)
+    ])
+
+
+@cache_op(_PARTITION, StoreOperation.HASH_COUNTER_INCR_MANY)
+def increment_finalization_histograms(deploy: Deploy) -> CountIncrementKeyBatch:
+    """Increments (atomically & in a single round-trip) run, phase & step deploy finalisation latency histograms.
+
+    :param deploy: A finalised deploy dispatched during the course of a run.
+
+    :returns: Cache increment key batch.
+
+    """
+    return CountIncrementKeyBatch([
+        HashCountIncrementKey(
+            paths=[
+                deploy.network,
+                deploy.run_type,
+                deploy.label_run_index,
+                COL_FINALIZATION_HISTOGRAM,
+            ],
+            names=i,
+            field=histogram.get_bucket(deploy.finalization_duration),
+            amount=1,
+        )
+        for i in _get_deploy_aspect_names(deploy)
+    ])
+
+
+def _get_deploy_aspect_names(deploy: Deploy) -> typing.List[typing.List[str]]:
+    """Returns key names of run, phase & step aspects within which a deploy was dispatched.
+
+    """
+    names = [["-"]]
+    if deploy.phase_index:
+        names.append([f"P-{str(deploy.phase_index).zfill(2)}"])
+        if deploy.step_index:
+            names.append(names[-1] + [f"S-{str(deploy.step_index).zfill(2)}"])
+
+    return names
 
 
 @cache_op(_PARTITION, StoreOperation.COUNTER_INCR)
@@ -377,6 +722,99 @@ def set_lock(aspect: ExecutionAspect, lock: ExecutionLock) -> Item:
     )
 
 
+@cache_op(_PARTITION, StoreOperation.BARRIER_ARRIVE)
+def set_phase_barrier_step(ctx: ExecutionContext) -> BarrierKey:
+    """Adds (atomically) a completed step to its phase's step completion barrier.
+
+    :param ctx: Execution context information.
+
+    :returns: Flag indicating whether step had not previously completed & indexes of completed steps.
+
+    """
+    return BarrierKey(
+        paths=[
+            ctx.network,
+            ctx.run_type,
+            ctx.label_run_index,
+            COL_PHASE_BARRIER,
+        ],
+        names=[
+            ctx.label_phase_index,
+        ],
+        member=str(ctx.step_index),
+        expiration=EXPIRATION_COL_PHASE_BARRIER,
+    )
+
+
+@cache_op(_PARTITION, StoreOperation.TRACKER_SET)
+def set_step_tracker(ctx: ExecutionContext, count: int) -> TrackerKey:
+    """Initialises a step's deploy completion tracker.
+
+    :param ctx: Execution context information.
+    :param count: Number of deploys to be dispatched during step.
+
+    :returns: Tracker key.
+
+    """
+    return _get_step_tracker_key(ctx, count=count)
+
+
+@cache_op(_PARTITION, StoreOperation.TRACKER_CLOSE)
+def set_step_tracker_closed(ctx: ExecutionContext, outcome: str) -> TrackerKey:
+    """Closes (atomically) a step's deploy completion tracker - subsequent deploy updates are ignored.
+
+    :param ctx: Execution context information.
+    :param outcome: Outcome of step, e.g. complete | timed-out.
+
+    :returns: Count of deploys pending dispatch & hashes of deploys outstanding prior to closure
+              (None if tracker was either untracked or already closed).
+
+    """
+    return _get_step_tracker_key(ctx, outcome=outcome)
+
+
+@cache_op(_PARTITION, StoreOperation.TRACKER_SET_MEMBER)
+def set_step_tracker_deploy(ctx: ExecutionContext, deploy_hash: str) -> TrackerKey:
+    """Registers (atomically) a dispatched deploy with a step's deploy completion tracker.
+
+    :param ctx: Execution context information.
+    :param deploy_hash: Hash of a dispatched deploy.
+
+    :returns: Flag indicating whether deploy was registered - i.e. false if step is untracked or closed.
+
+    """
+    return _get_step_tracker_key(ctx, member=deploy_hash)
+
+
+def _get_step_tracker_key(
+    ctx: ExecutionContext,
+    member: str = None,
+    count: int = None,
+    members: typing.List[str] = None,
+    outcome: str = None,
+    ) -> TrackerKey:
+    """Returns key of a step's deploy completion tracker.
+
+    """
+    return TrackerKey(
+        paths=[
+            ctx.network,
+            ctx.run_type,
+            ctx.label_run_index,
+            COL_STEP_TRACKER,
+        ],
+        names=[
+            ctx.label_phase_index,
+            ctx.label_step_index,
+        ],
+        member=member,
+        members=members,
+        count=count,
+        expiration=EXPIRATION_COL_STEP_TRACKER,
+        outcome=outcome,
+    )
+
+
 @cache_op(_PARTITION, StoreOperation.SET_ONE)
 def set_context(ctx: ExecutionContext) -> Item:
     """Encaches domain object: ExecutionContext.
@@ -402,6 +840,30 @@ def set_context(ctx: ExecutionContext) -> Item:
     )
 
 
+@cache_op(_PARTITION, StoreOperation.SET_EXPIRATION)
+def set_context_expiration(network: str, run_index: int, run_type: str) -> ExpirationKey:
+    """Resets expiration of an encached run context - e.g. whilst messages referencing it are in flight.
+    
+    :param network: Name of network being tested.
+    :param run_index: Generator run index.
+    :param run_type: Generator run type, e.g. wg-100.
+
+    :returns: Flag indicating whether run context was encached.
+
+    """
+    return ExpirationKey(
+        paths=[
+            network,
+            run_type,
+            f"R-{str(run_index).zfill(3)}",
+        ],
+        names=[
+            COL_CONTEXT,
+        ],
+        expiration=EXPIRATION_COL_CONTEXT,
+    )
+
+
 @cache_op(_PARTITION, StoreOperation.SET_ONE)
 def set_info(info: ExecutionInfo) -> Item:
     """Encaches domain object: ExecutionInfo.
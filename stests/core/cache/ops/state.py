@@ -4,6 +4,10 @@ import typing
 from stests.core import factory
 from stests.core.cache.model import CountDecrementKey
 from stests.core.cache.model import CountIncrementKey
+from stests.core.cache.model import IndexedItem
+from stests.core.cache.model import IndexKey
+from stests.core.cache.model import IndexKeyBatch
+from stests.core.cache.model import IndexSearchKey
 from stests.core.cache.model import Item
 from stests.core.cache.model import ItemKey
 from stests.core.cache.model import SearchKey
@@ -31,6 +35,7 @@ COL_ACCOUNT = "account"
 COL_ACCOUNT_BALANCE = "account-balance"
 COL_NAMED_KEY = "named-key"
 COL_DEPLOY = "deploy"
+COL_DEPLOY_INDEX = "deploy-index"
 COL_TRANSFER = "transfer"
 
 
@@ -83,8 +88,18 @@ def decrement_account_balance_on_deploy_finalisation(deploy: Deploy, cost: int)
     )
 
 
+def prune_on_run_completion(ctx: ExecutionContext):
+    """Deletes data cached during the course of a run.
+
+    :param ctx: Execution context information.
+
+    """
+    _prune_deploy_index_on_run_completion(ctx)
+    _prune_on_run_completion(ctx)
+
+
 @cache_op(_PARTITION, StoreOperation.DELETE_MANY)
-def prune_on_run_completion(ctx: ExecutionContext) -> SearchKey:
+def _prune_on_run_completion(ctx: ExecutionContext) -> SearchKey:
     """Deletes data cached during the course of a run.
 
     :param ctx: Execution context information.
@@ -100,6 +115,28 @@ def prune_on_run_completion(ctx: ExecutionContext) -> SearchKey:
     )
 
 
+@cache_op(_PARTITION, StoreOperation.DELETE_MANY_FROM_INDEX)
+def _prune_deploy_index_on_run_completion(ctx: ExecutionContext) -> IndexSearchKey:
+    """Deletes deploy index entries pointing to deploys cached during the course of a run.
+
+    :param ctx: Execution context information.
+    :returns: Cache index search key.
+
+    """
+    return IndexSearchKey(
+        index_paths=[
+            ctx.network,
+            COL_DEPLOY_INDEX,
+        ],
+        paths=[
+            ctx.network,
+            ctx.run_type,
+            ctx.label_run_index,
+            COL_DEPLOY,
+        ]
+    )
+
+
 @cache_op(_PARTITION, StoreOperation.GET_ONE)
 def get_account(account_id: AccountIdentifier) -> ItemKey:
     """Decaches domain object: Account.
@@ -154,53 +191,72 @@ def get_account_by_index(ctx: ExecutionContext, index: int) -> Account:
         ))
 
 
-@cache_op(_PARTITION, StoreOperation.GET_ONE_FROM_MANY)
-def get_deploy(ctx: ExecutionContext, deploy_hash: str) -> ItemKey:
+def get_deploy(ctx: ExecutionContext, deploy_hash: str) -> Deploy:
     """Decaches domain object: Deploy.
 
     :param ctx: Execution context information.    
     :param deploy_hash: A deploy hash.
 
-    :returns: Cache item key.
+    :returns: A cached deploy.
 
     """
-    return ItemKey(
-        paths=[
-            ctx.network,
-            ctx.run_type,
-            ctx.label_run_index,
-            COL_DEPLOY,
-        ],
-        names=[
-            "*.*",
-            deploy_hash,
-            "A-*"
-        ],
-    )
+    deploy = get_deploy_on_finalisation(ctx.network, deploy_hash)
+    if deploy is not None and deploy.run_type == ctx.run_type and deploy.run_index == ctx.run_index:
+        return deploy
 
 
-@cache_op(_PARTITION, StoreOperation.GET_ONE_FROM_MANY)
-def get_deploy_on_finalisation(network_name: str, deploy_hash: str) -> ItemKey:
+@cache_op(_PARTITION, StoreOperation.GET_ONE_FROM_INDEX)
+def get_deploy_on_finalisation(network_name: str, deploy_hash: str) -> IndexKey:
     """Decaches domain object: Deploy.
     
     :param network_name: Name of network to which deploy was dispatched.
     :param deploy_hash: A deploy hash.
 
-    :returns: Cache item key.
+    :returns: Cache index key.
 
     """
-    return ItemKey(
+    return IndexKey(
         paths=[
             network_name,
-            "WG-*",
-            "R-*",
-            COL_DEPLOY,
+            COL_DEPLOY_INDEX,
         ],
-        names=[
-            "*.*",
-            deploy_hash,
-            "A-*"
+        field=deploy_hash,
+    )
+
+
+def get_deploys_by_hash(ctx: ExecutionContext, deploy_hashes: typing.List[str]) -> typing.Dict[str, Deploy]:
+    """Decaches (in a single round-trip) domain objects: Deploy.
+
+    :param ctx: Execution context information.    
+    :param deploy_hashes: A set of deploy hashes.
+
+    :returns: Map: deploy hash -> cached deploy - deploys not dispatched during run are excluded.
+
+    """
+    deploys = get_deploys_on_finalisation(ctx.network, deploy_hashes) or []
+
+    return {
+        i.deploy_hash: i for i in deploys
+        if i is not None and i.run_type == ctx.run_type and i.run_index == ctx.run_index
+    }
+
+
+@cache_op(_PARTITION, StoreOperation.GET_MANY_FROM_INDEX)
+def get_deploys_on_finalisation(network_name: str, deploy_hashes: typing.List[str]) -> IndexKeyBatch:
+    """Decaches domain objects: Deploy.
+    
+    :param network_name: Name of network to which deploys were dispatched.
+    :param deploy_hashes: A set of deploy hashes.
+
+    :returns: Cache index key batch.
+
+    """
+    return IndexKeyBatch(
+        paths=[
+            network_name,
+            COL_DEPLOY_INDEX,
         ],
+        fields=deploy_hashes,
     )
 
 
@@ -293,8 +349,8 @@ def set_account(account: Account) -> Item:
     )
 
 
-@cache_op(_PARTITION, StoreOperation.SET_ONE)
-def set_deploy(deploy: Deploy) -> Item:
+@cache_op(_PARTITION, StoreOperation.SET_ONE_INDEXED)
+def set_deploy(deploy: Deploy) -> IndexedItem:
     """Encaches domain object: Deploy.
     
     :param deploy: Deploy domain object instance to be cached.
@@ -302,8 +358,15 @@ def set_deploy(deploy: Deploy) -> Item:
     :returns: Cache item.
 
     """
-    return Item(
+    return IndexedItem(
         data=deploy,
+        index_key=IndexKey(
+            paths=[
+                deploy.network,
+                COL_DEPLOY_INDEX,
+            ],
+            field=deploy.deploy_hash,
+        ),
         item_key=ItemKey(
             paths=[
                 deploy.network,
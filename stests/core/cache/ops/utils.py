@@ -1,28 +1,52 @@
-import json
 import typing
 import functools
-import time
 
 import redis
 
 from stests.core.cache.model import StoreOperation
 from stests.core.cache.model import StorePartition
+from stests.core.cache.model import BarrierKey
 from stests.core.cache.model import CountDecrementKey
 from stests.core.cache.model import CountIncrementKey
+from stests.core.cache.model import CountIncrementKeyBatch
+from stests.core.cache.model import ExpirationKey
+from stests.core.cache.model import IndexedItem
+from stests.core.cache.model import IndexKey
+from stests.core.cache.model import IndexKeyBatch
+from stests.core.cache.model import IndexSearchKey
 from stests.core.cache.model import Item
+from stests.core.cache.model import ItemBatch
 from stests.core.cache.model import ItemKey
 from stests.core.cache.model import SearchKey
+from stests.core.cache.model import TrackerKey
+from stests.core.cache import codecs
 from stests.core.cache import stores
 from stests.core.utils import encoder
 
 
 
-def _decode_item(as_json: str) -> typing.Any:
+def _barrier_arrive(store: typing.Callable, key: BarrierKey) -> typing.Tuple[bool, typing.List[str]]:
+    """Adds (atomically) a member to a barrier.
+
+    :returns: Flag indicating whether member had not previously arrived & set of arrived members.
+    
+    """
+    with store.pipeline(transaction=True) as pipeline:
+        pipeline.sadd(key.key, key.member)
+        pipeline.smembers(key.key)
+        if key.expiration:
+            pipeline.expire(key.key, key.expiration)
+        added, members, *_ = pipeline.execute()
+
+    return bool(added), sorted(i.decode("utf-8") for i in members)
+
+
+def _decode_item(as_bytes: bytes) -> typing.Any:
     """Returns a decoded encached domain object(s).
 
     """
-    if as_json is not None:
-        return encoder.decode(json.loads(as_json))
+    if as_bytes is not None:
+        return encoder.decode(codecs.decode(as_bytes))
 
 
 def _decr(store: typing.Callable, decrement: CountDecrementKey):
@@ -51,6 +75,20 @@ def _delete_many(store: typing.Callable, search_key: SearchKey):
             store.delete(*keys)
 
 
+def _delete_many_from_index(store: typing.Callable, search_key: IndexSearchKey):
+    """Deletes secondary index entries pointing to items under matched keys.
+
+    """
+    chunk_size = 1000
+    prefix = search_key.item_key_prefix.encode("utf8")
+    cursor = '0'
+    while cursor != 0:
+        cursor, entries = store.hscan(search_key.key, cursor=cursor, count=chunk_size)
+        fields = [k for k, v in entries.items() if v.startswith(prefix)]
+        if fields:
+            store.hdel(search_key.key, *fields)
+
+
 def _get_counter_one(store: typing.Callable, item_key: ItemKey) -> int:
     """Returns count under exactly matched key.
     
@@ -74,6 +112,25 @@ def _get_counter_many(store: typing.Callable, search_key: SearchKey) -> typing.T
     return [i.decode('utf8') for i in keys], [int(i) for i in store.mget(keys)]
 
 
+def _get_hash_counter_many(store: typing.Callable, search_key: SearchKey) -> typing.Tuple[typing.List[str], typing.List[typing.Dict[str, int]]]:
+    """Returns field counts of hashes under matched keys.
+    
+    """
+    keys = []
+    chunk_size = 1000
+    cursor = '0'
+    while cursor != 0:
+        cursor, keys_ = store.scan(cursor=cursor, match=search_key.key, count=chunk_size)
+        keys += keys_
+
+    with store.pipeline(transaction=False) as pipeline:
+        for key in keys:
+            pipeline.hgetall(key)
+        hashes = pipeline.execute() if keys else []
+
+    return [i.decode('utf8') for i in keys], [{k.decode('utf8'): int(v) for k, v in i.items()} for i in hashes]
+
+
 def _get_count(store: typing.Callable, search_key: SearchKey) -> int:
     """Returns length of collection under matched keys.
     
@@ -107,6 +164,21 @@ def _get_one_from_many(store: typing.Callable, item_key: ItemKey) -> typing.Any:
             return _decode_item(store.get(keys[0]))
 
 
+def _get_one_from_index(store: typing.Callable, index_key: IndexKey) -> typing.Any:
+    """Returns item under key resolved via a secondary index.
+    
+    """
+    key = store.hget(index_key.key, index_key.field)
+    if key is None:
+        return
+
+    as_json = store.get(key)
+    if as_json is None:
+        store.hdel(index_key.key, index_key.field)
+
+    return _decode_item(as_json)
+
+
 def _get_many(store: typing.Callable, search_key: SearchKey) -> typing.List[typing.Any]:
     """Returns collection cached under all matched keys.
     
@@ -121,6 +193,24 @@ def _get_many(store: typing.Callable, search_key: SearchKey) -> typing.List[typi
     return [_decode_item(i) for i in store.mget(keys)] if keys else []
 
 
+def _get_many_from_index(store: typing.Callable, index_key: IndexKeyBatch) -> typing.List[typing.Any]:
+    """Returns items under keys resolved via a secondary index - in field order, None if not found.
+    
+    """
+    if not index_key.fields:
+        return []
+
+    keys = store.hmget(index_key.key, index_key.fields)
+    resolved = [i for i in keys if i is not None]
+    items = dict(zip(resolved, store.mget(resolved))) if resolved else dict()
+
+    stale = [f for f, k in zip(index_key.fields, keys) if k is not None and items[k] is None]
+    if stale:
+        store.hdel(index_key.key, *stale)
+
+    return [None if k is None else _decode_item(items[k]) for k in keys]
+
+
 def _incr(store: typing.Callable, item_key: CountIncrementKey) -> typing.Any:
     """Increments count under exactly matched key.
     
@@ -128,11 +218,64 @@ def _incr(store: typing.Callable, item_key: CountIncrementKey) -> typing.Any:
     return store.incrby(item_key.key, item_key.amount)
 
 
+def _incr_many(store: typing.Callable, batch: CountIncrementKeyBatch) -> typing.List[int]:
+    """Increments (atomically & in a single round-trip) counts under exactly matched keys.
+    
+    """
+    with store.pipeline(transaction=True) as pipeline:
+        for item_key in batch.keys:
+            pipeline.incrby(item_key.key, item_key.amount)
+
+        return pipeline.execute()
+
+
+def _hincr_many(store: typing.Callable, batch: CountIncrementKeyBatch) -> typing.List[int]:
+    """Increments (atomically & in a single round-trip) counts held within fields of hashes under exactly matched keys.
+    
+    """
+    with store.pipeline(transaction=True) as pipeline:
+        for item_key in batch.keys:
+            pipeline.hincrby(item_key.key, item_key.field, item_key.amount)
+
+        return pipeline.execute()
+
+
 def _set_one(store: typing.Callable, item: Item) -> str:
     """Set item under a key.
     
     """
-    store.set(item.key, item.data_as_json, ex=item.expiration)
+    store.set(item.key, item.data_as_bytes, ex=item.expiration)
+
+    return item.key
+
+
+def _set_expiration(store: typing.Callable, key: ExpirationKey) -> bool:
+    """Resets expiration of an item - returns false if item does not exist.
+    
+    """
+    return bool(store.expire(key.key, key.expiration))
+
+
+def _set_many(store: typing.Callable, batch: ItemBatch) -> typing.List[str]:
+    """Set items under keys in a single round-trip.
+    
+    """
+    with store.pipeline(transaction=False) as pipeline:
+        for item in batch.items:
+            pipeline.set(item.key, item.data_as_bytes, ex=item.expiration)
+        pipeline.execute()
+
+    return [i.key for i in batch.items]
+
+
+def _set_one_indexed(store: typing.Callable, item: IndexedItem) -> str:
+    """Set item under a key plus an entry within a secondary index.
+    
+    """
+    with store.pipeline(transaction=True) as pipeline:
+        pipeline.set(item.key, item.data_as_bytes, ex=item.expiration)
+        pipeline.hset(item.index_key.key, item.index_key.field, item.key)
+        pipeline.execute()
 
     return item.key
 
@@ -141,27 +284,181 @@ def _set_one_singleton(store: typing.Callable, item: Item) -> typing.Tuple[str,
     """Sets item under a key if not already cached.
     
     """
-    key, was_cached = item.key, bool(store.setnx(item.key, item.data_as_json))
+    key, was_cached = item.key, bool(store.setnx(item.key, item.data_as_bytes))
     if was_cached and item.expiration:
         store.expire(key, item.expiration)
 
     return key, was_cached  
 
 
+# Field within a completion tracker under which count of pending members is held.
+_TRACKER_PENDING = "-"
+
+# Field within a completion tracker under which outcome of a closed tracker is held.
+_TRACKER_OUTCOME = "#"
+
+
+def _tracker_close(store: typing.Callable, key: TrackerKey) -> typing.Optional[typing.Tuple[int, typing.List[str]]]:
+    """Closes (atomically) an open completion tracker - thereafter it is neither pending nor outstanding.
+
+    :returns: Pending count & outstanding members prior to closure, or None if tracker was not open.
+    
+    """
+    with store.pipeline(transaction=True) as pipeline:
+        while True:
+            try:
+                pipeline.watch(key.key)
+                fields = {k.decode("utf-8"): v for k, v in pipeline.hgetall(key.key).items()}
+                if _TRACKER_PENDING not in fields or _TRACKER_OUTCOME in fields:
+                    return None
+                pipeline.multi()
+                pipeline.delete(key.key)
+                pipeline.hset(key.key, mapping={_TRACKER_PENDING: 0, _TRACKER_OUTCOME: key.outcome})
+                if key.expiration:
+                    pipeline.expire(key.key, key.expiration)
+                pipeline.execute()
+                break
+            except redis.WatchError:
+                continue
+
+    return int(fields.pop(_TRACKER_PENDING)), sorted(fields.keys())
+
+
+def _tracker_get(store: typing.Callable, key: TrackerKey) -> typing.Tuple[typing.Optional[int], typing.List[str]]:
+    """Returns a completion tracker's pending count (None if tracker does not exist) & outstanding members.
+    
+    """
+    fields = {k.decode("utf-8"): v for k, v in store.hgetall(key.key).items()}
+    pending = fields.pop(_TRACKER_PENDING, None)
+    fields.pop(_TRACKER_OUTCOME, None)
+
+    return None if pending is None else int(pending), sorted(fields.keys())
+
+
+def _tracker_get_count(store: typing.Callable, key: TrackerKey) -> typing.Tuple[typing.Optional[int], int]:
+    """Returns a completion tracker's pending count (None if tracker does not exist) & outstanding count.
+    
+    """
+    with store.pipeline(transaction=True) as pipeline:
+        pipeline.hget(key.key, _TRACKER_PENDING)
+        pipeline.hexists(key.key, _TRACKER_OUTCOME)
+        pipeline.hlen(key.key)
+        pending, is_closed, size = pipeline.execute()
+
+    return _get_tracker_counts(pending, is_closed, size)
+
+
+def _tracker_remove(store: typing.Callable, key: TrackerKey) -> typing.Tuple[bool, typing.Optional[int], int]:
+    """Removes (atomically) an outstanding member from a completion tracker.
+
+    :returns: Flag indicating whether member was outstanding, pending count (None if tracker does not exist) & outstanding count.
+    
+    """
+    with store.pipeline(transaction=True) as pipeline:
+        pipeline.hdel(key.key, key.member)
+        pipeline.hget(key.key, _TRACKER_PENDING)
+        pipeline.hexists(key.key, _TRACKER_OUTCOME)
+        pipeline.hlen(key.key)
+        removed, pending, is_closed, size = pipeline.execute()
+
+    return (bool(removed), ) + _get_tracker_counts(pending, is_closed, size)
+
+
+def _tracker_remove_many(store: typing.Callable, key: TrackerKey) -> typing.Tuple[typing.List[bool], typing.Optional[int], int]:
+    """Removes (atomically) a set of outstanding members from a completion tracker.
+
+    :returns: Flags indicating whether each member was outstanding, pending count (None if tracker does not exist) & outstanding count.
+    
+    """
+    with store.pipeline(transaction=True) as pipeline:
+        for member in key.members:
+            pipeline.hdel(key.key, member)
+        pipeline.hget(key.key, _TRACKER_PENDING)
+        pipeline.hexists(key.key, _TRACKER_OUTCOME)
+        pipeline.hlen(key.key)
+        *removed, pending, is_closed, size = pipeline.execute()
+
+    return ([bool(i) for i in removed], ) + _get_tracker_counts(pending, is_closed, size)
+
+
+def _tracker_set(store: typing.Callable, key: TrackerKey) -> str:
+    """Initialises a completion tracker with a count of members pending.
+    
+    """
+    with store.pipeline(transaction=True) as pipeline:
+        pipeline.delete(key.key)
+        pipeline.hset(key.key, _TRACKER_PENDING, key.count)
+        if key.expiration:
+            pipeline.expire(key.key, key.expiration)
+        pipeline.execute()
+
+    return key.key
+
+
+def _tracker_set_member(store: typing.Callable, key: TrackerKey) -> bool:
+    """Moves (atomically) a pending member into an open completion tracker's outstanding set.
+
+    :returns: Flag indicating whether member was moved - i.e. false if tracker does not exist or is closed.
+    
+    """
+    with store.pipeline(transaction=True) as pipeline:
+        while True:
+            try:
+                pipeline.watch(key.key)
+                if pipeline.hget(key.key, _TRACKER_PENDING) is None or pipeline.hexists(key.key, _TRACKER_OUTCOME):
+                    return False
+                pipeline.multi()
+                pipeline.hset(key.key, key.member, 1)
+                pipeline.hincrby(key.key, _TRACKER_PENDING, -1)
+                if key.expiration:
+                    pipeline.expire(key.key, key.expiration)
+                pipeline.execute()
+                return True
+            except redis.WatchError:
+                continue
+
+
+def _get_tracker_counts(pending: typing.Optional[bytes], is_closed: bool, size: int) -> typing.Tuple[typing.Optional[int], int]:
+    """Returns a completion tracker's pending count (None if tracker does not exist) & outstanding count.
+    
+    """
+    if pending is None:
+        return None, 0
+
+    return int(pending), max(0, size - (2 if is_closed else 1))
+
+
 # Map: operation -> redis command wrapper.
 _HANDLERS = {
+    StoreOperation.BARRIER_ARRIVE: _barrier_arrive,
     StoreOperation.COUNTER_DECR: _decr,
     StoreOperation.DELETE_ONE: _delete_one,
     StoreOperation.DELETE_MANY: _delete_many,
+    StoreOperation.DELETE_MANY_FROM_INDEX: _delete_many_from_index,
     StoreOperation.GET_COUNT: _get_count,
     StoreOperation.GET_COUNTER_ONE: _get_counter_one,
     StoreOperation.GET_COUNTER_MANY: _get_counter_many,
+    StoreOperation.GET_HASH_COUNTER_MANY: _get_hash_counter_many,
+    StoreOperation.HASH_COUNTER_INCR_MANY: _hincr_many,
     StoreOperation.GET_ONE: _get_one,
     StoreOperation.GET_ONE_FROM_MANY: _get_one_from_many,
+    StoreOperation.GET_ONE_FROM_INDEX: _get_one_from_index,
     StoreOperation.GET_MANY: _get_many,
+    StoreOperation.GET_MANY_FROM_INDEX: _get_many_from_index,
     StoreOperation.COUNTER_INCR: _incr,
+    StoreOperation.COUNTER_INCR_MANY: _incr_many,
     StoreOperation.SET_ONE: _set_one,
+    StoreOperation.SET_MANY: _set_many,
+    StoreOperation.SET_ONE_INDEXED: _set_one_indexed,
     StoreOperation.SET_ONE_SINGLETON: _set_one_singleton,
+    StoreOperation.SET_EXPIRATION: _set_expiration,
+    StoreOperation.TRACKER_CLOSE: _tracker_close,
+    StoreOperation.TRACKER_GET: _tracker_get,
+    StoreOperation.TRACKER_GET_COUNT: _tracker_get_count,
+    StoreOperation.TRACKER_REMOVE: _tracker_remove,
+    StoreOperation.TRACKER_REMOVE_MANY: _tracker_remove_many,
+    StoreOperation.TRACKER_SET: _tracker_set,
+    StoreOperation.TRACKER_SET_MEMBER: _tracker_set_member,
 }
 
 # Set of partitions whereby keys are prefixed with os-user. 
@@ -170,10 +467,6 @@ _USER_PARTITIONS = {
     StorePartition.STATE,
 }
 
-# Max. number of times an operation will be tried.
-_MAX_OP_ATTEMPTS = 5
-
-
 def cache_op(partition: StorePartition, operation: StoreOperation) -> typing.Callable:
     """Decorator to orthoganally process a cache operation.
 
@@ -189,7 +482,7 @@ def cache_op(partition: StorePartition, operation: StoreOperation) -> typing.Cal
             # JIT extend encoder - ensures all types are registered.
             encoder.initialise()
             
-            
+            # N.B. store is backed by a per-process partition connection pool.
             with stores.get_store(partition) as store:
                 # Invoke inner function.
                 obj = func(*args, **kwargs)
@@ -200,18 +493,8 @@ def cache_op(partition: StorePartition, operation: StoreOperation) -> typing.Cal
                 if partition in _USER_PARTITIONS:
                     obj.apply_key_prefix()
                 
-                # Invoke operation applying retry semantics in case of broken pipes.
-                # TODO: revisit connection pooling, 
-                attempts = 0
-                handler = _HANDLERS[operation]
-                while attempts < _MAX_OP_ATTEMPTS:
-                    try:
-                        return handler(store, obj)
-                    except redis.ConnectionError as err:
-                        attempts += 1
-                        if attempts == _MAX_OP_ATTEMPTS:
-                            raise err
-                        time.sleep(float(0.01))
+                # Invoke operation - N.B. connection errors are retried by pooled connection.
+                return _HANDLERS[operation](store, obj)
 
         return wrapper
     return decorator
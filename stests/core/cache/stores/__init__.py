@@ -1,6 +1,8 @@
 from stests.core.cache.model import StorePartition
 from stests.core.cache.stores import redis
 from stests.core.cache.stores import stub
+from stests.core.cache.stores.redis import get_pool_metrics
+from stests.core.cache.stores.redis import set_metrics_hook
 from stests.core.utils import env
 from stests.core.utils.exceptions import InvalidEnvironmentVariable
 
@@ -1,4 +1,11 @@
+import os
+import threading
+import time
+import typing
+
 import redis
+from redis.backoff import ExponentialBackoff
+from redis.retry import Retry
 
 from stests.core.cache.model import StorePartition
 from stests.core.utils import env
@@ -16,6 +23,12 @@ class EnvVars:
     # Redis port.
     PORT = env.get_var('CACHE_REDIS_PORT', 6379, int)
 
+    # Maximum number of connections per partition pool.
+    POOL_SIZE = env.get_var('CACHE_REDIS_POOL_SIZE', 64, int)
+
+    # Interval (seconds) after which an idle connection is health checked prior to use.
+    POOL_HEALTH_CHECK_INTERVAL = env.get_var('CACHE_REDIS_POOL_HEALTH_CHECK_INTERVAL', 30, int)
+
 
 # Map: partition type -> cache db index offset.
 PARTITION_OFFSETS = {
@@ -27,6 +40,24 @@ PARTITION_OFFSETS = {
     StorePartition.WORKFLOW: 5,
 }
 
+# Number of times a command is retried by a pooled connection upon a connection error.
+_CONNECTION_RETRIES = 3
+
+# Interval (seconds) between invocations of pool metrics hook.
+_METRICS_INTERVAL = 60.0
+
+# Map: (process id, partition type) -> connection pool.
+_POOLS = {}
+
+# Guards pool instantiation across threads.
+_POOLS_LOCK = threading.Lock()
+
+# Callback to which pool utilisation metrics are periodically reported.
+_metrics_hook: typing.Callable[[typing.Dict[str, dict]], None] = None
+
+# Timestamp at which metrics hook was last invoked.
+_metrics_ts: float = 0.0
+
 
 def get_store(partition_type: StorePartition) -> redis.Redis:
     """Returns instance of a redis cache store accessor.
@@ -34,14 +65,83 @@ def get_store(partition_type: StorePartition) -> redis.Redis:
     :returns: An instance of a redis cache store accessor.
 
     """
-    # Set cache db index.
-    db = EnvVars.DB
-    db += PARTITION_OFFSETS[partition_type]
+    _report_metrics()
 
     # TODO: cluster connections
-    return redis.Redis(
-        db=db,
-        host=EnvVars.HOST,
-        port=EnvVars.PORT
-        )
+    return redis.Redis(connection_pool=get_pool(partition_type))
+
+
+def get_pool(partition_type: StorePartition) -> redis.ConnectionPool:
+    """Returns a connection pool scoped to current process & partition.
+
+    :param partition_type: Type of partition to which pool pertains.
+
+    :returns: A redis connection pool.
+
+    """
+    key = (os.getpid(), partition_type)
+    try:
+        return _POOLS[key]
+    except KeyError:
+        pass
+
+    with _POOLS_LOCK:
+        if key not in _POOLS:
+            _POOLS[key] = redis.ConnectionPool(
+                db=EnvVars.DB + PARTITION_OFFSETS[partition_type],
+                host=EnvVars.HOST,
+                port=EnvVars.PORT,
+                max_connections=EnvVars.POOL_SIZE,
+                health_check_interval=EnvVars.POOL_HEALTH_CHECK_INTERVAL,
+                retry=Retry(ExponentialBackoff(), _CONNECTION_RETRIES),
+                retry_on_error=[redis.ConnectionError, redis.TimeoutError],
+                )
+
+    return _POOLS[key]
+
+
+def get_pool_metrics() -> typing.Dict[str, dict]:
+    """Returns utilisation metrics of connection pools instantiated by current process.
+
+    :returns: Map: partition name -> pool utilisation.
+
+    """
+    pid = os.getpid()
+
+    return {
+        partition_type.name: {
+            "created": getattr(pool, "_created_connections", 0),
+            "in_use": len(getattr(pool, "_in_use_connections", [])),
+            "available": len(getattr(pool, "_available_connections", [])),
+            "max": pool.max_connections,
+        }
+        for (pool_pid, partition_type), pool in list(_POOLS.items()) if pool_pid == pid
+    }
+
+
+def set_metrics_hook(callback: typing.Callable[[typing.Dict[str, dict]], None]):
+    """Registers a callback to which pool utilisation metrics are periodically reported.
+
+    :param callback: Function invoked with output of get_pool_metrics.
+
+    """
+    global _metrics_hook
+
+    _metrics_hook = callback
+
+
+def _report_metrics():
+    """Invokes metrics hook if registered & reporting interval has elapsed.
+
+    """
+    global _metrics_ts
+
+    if _metrics_hook is None:
+        return
+
+    now = time.monotonic()
+    if now - _metrics_ts < _METRICS_INTERVAL:
+        return
 
+    _metrics_ts = now
+    _metrics_hook(get_pool_metrics())
@@ -3,15 +3,20 @@ import fakeredis
 from stests.core.cache.model import StorePartition
 
 
-# Factory simply instantiates an instance.
-get_store = fakeredis.FakeStrictRedis
 
+# Map: partition type -> in-memory server - shared so that state persists across accessors.
+_SERVERS = {}
 
 
-def get_store(_: StorePartition) -> fakeredis.FakeStrictRedis:
+def get_store(partition_type: StorePartition) -> fakeredis.FakeStrictRedis:
     """Returns instance of a fake redis cache store accessor.
 
     :returns: An instance of a fake redis cache store accessor.
 
     """
-    return fakeredis.FakeStrictRedis()
+    try:
+        server = _SERVERS[partition_type]
+    except KeyError:
+        server = _SERVERS.setdefault(partition_type, fakeredis.FakeServer())
+
+    return fakeredis.FakeStrictRedis(server=server)
@@ -8,11 +8,18 @@ from stests.core.crypto.ecc import get_key_pair_from_pvk_pem_file
 from stests.core.crypto.ecc import get_key_pair_from_seed
 from stests.core.crypto.ecc import get_pvk_pem_file_from_bytes
 from stests.core.crypto.ecc import get_pvk_pem_from_bytes
+from stests.core.crypto.ecc import get_signature
+from stests.core.crypto.ecc import get_signature_from_signing_key
+from stests.core.crypto.ecc import get_signing_key
 from stests.core.crypto.enums import HashAlgorithm
 from stests.core.crypto.enums import HashEncoding
 from stests.core.crypto.enums import KeyAlgorithm
 from stests.core.crypto.enums import KeyEncoding
 from stests.core.crypto.hashifier import get_hash
+from stests.core.crypto.key_cache import delete_pvk_pem_files
+from stests.core.crypto.key_cache import get_key_scope
+from stests.core.crypto.key_cache import get_pvk_pem_file_from_cache
+from stests.core.crypto.key_cache import get_signature_from_cached_key
 
 # Defaults.
 DEFAULT_KEY_ALGO=KeyAlgorithm.ED25519
@@ -90,6 +90,44 @@ def get_key_pair_from_seed(seed: bytes, algo: KeyAlgorithm, encoding: KeyEncodin
     return (pvk.hex(), pbk.hex()) if encoding == KeyEncoding.HEX else (pvk, pbk)
 
 
+def get_signature(msg: bytes, pvk: bytes, algo: KeyAlgorithm) -> bytes:
+    """Returns an ECC digital signature of data signed from a private key.
+
+    :param msg: A message to be signed.
+    :param pvk: Private key.
+    :param algo: Type of ECC algo used to generate private key.
+
+    :returns : A digital signature.
+    
+    """
+    return ALGOS[algo].get_signature(msg, pvk)
+
+
+def get_signature_from_signing_key(msg: bytes, sk: typing.Any, algo: KeyAlgorithm) -> bytes:
+    """Returns an ECC digital signature of data signed from a decoded signing key.
+
+    :param msg: A message to be signed.
+    :param sk: A decoded signing key.
+    :param algo: Type of ECC algo used to generate private key.
+
+    :returns : A digital signature.
+    
+    """
+    return ALGOS[algo].get_signature_from_signing_key(msg, sk)
+
+
+def get_signing_key(pvk: bytes, algo: KeyAlgorithm) -> typing.Any:
+    """Returns an ECC signing key decoded from private key bytes.
+
+    :param pvk: Private key.
+    :param algo: Type of ECC algo used to generate private key.
+
+    :returns : A decoded signing key.
+    
+    """
+    return ALGOS[algo].get_signing_key(pvk)
+
+
 def get_pvk_pem_from_bytes(pvk: bytes, algo: KeyAlgorithm) -> bytes:
     """Returns an ECC private key in PEM format.
 
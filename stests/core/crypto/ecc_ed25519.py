@@ -63,6 +63,37 @@ def get_key_pair_from_seed(seed: bytes) -> typing.Tuple[bytes, bytes]:
     return _get_key_pair_from_sk(sk)
 
 
+def get_signature(msg: bytes, pvk: bytes) -> bytes:
+    """Returns an ED25519 digital signature of data signed from a private key.
+
+    :param msg: A message to be signed.
+    :param pvk: A private key derived from a generated key pair.
+
+    :returns: A digital signature.
+
+    """
+    return get_signature_from_signing_key(msg, get_signing_key(pvk))
+
+
+def get_signature_from_signing_key(msg: bytes, sk: ed25519.Ed25519PrivateKey) -> bytes:
+    """Returns an ED25519 digital signature of data signed from a decoded signing key.
+
+    :param msg: A message to be signed.
+    :param sk: A decoded signing key.
+
+    :returns: A digital signature.
+
+    """
+    return sk.sign(msg)
+
+
+def get_signing_key(pvk: bytes) -> ed25519.Ed25519PrivateKey:
+    """Returns an ED25519 signing key decoded from private key bytes.
+    
+    """
+    return ed25519.Ed25519PrivateKey.from_private_bytes(pvk)
+
+
 def get_pvk_pem_from_bytes(pvk: bytes) -> bytes:
     """Returns ED25519 private key (pem) from bytes.
     
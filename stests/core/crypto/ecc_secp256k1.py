@@ -1,7 +1,9 @@
 import base64
+import hashlib
 import typing
 
 import ecdsa
+from ecdsa.util import sigencode_string_canonize
 
 from stests.core.crypto.enums import KeyEncoding
 
@@ -45,6 +47,37 @@ def get_key_pair_from_pvk_pem_file(fpath: str) -> typing.Tuple[bytes, bytes]:
     return _get_key_pair_from_sk(ecdsa.SigningKey.from_pem(as_pem))
 
 
+def get_signature(msg: bytes, pvk: bytes) -> bytes:
+    """Returns an SECP256K1 digital signature of data signed from a private key.
+
+    :param msg: A message to be signed.
+    :param pvk: A private key derived from a generated key pair.
+
+    :returns: A digital signature.
+
+    """
+    return get_signature_from_signing_key(msg, get_signing_key(pvk))
+
+
+def get_signature_from_signing_key(msg: bytes, sk: ecdsa.SigningKey) -> bytes:
+    """Returns an SECP256K1 digital signature of data signed from a decoded signing key.
+
+    :param msg: A message to be signed.
+    :param sk: A decoded signing key.
+
+    :returns: A digital signature.
+
+    """
+    return sk.sign_deterministic(msg, hashfunc=hashlib.sha256, sigencode=sigencode_string_canonize)
+
+
+def get_signing_key(pvk: bytes) -> ecdsa.SigningKey:
+    """Returns an SECP256K1 signing key decoded from private key bytes.
+    
+    """
+    return ecdsa.SigningKey.from_string(pvk, curve=CURVE)
+
+
 def get_pvk_pem_from_bytes(pvk: bytes) -> bytes:
     """Returns SECP256K1 private key (pem) from bytes.
     
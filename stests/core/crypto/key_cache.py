@@ -0,0 +1,133 @@
+import collections
+import contextlib
+import os
+import pathlib
+import tempfile
+import threading
+import typing
+
+from stests.core.crypto import ecc
+from stests.core.crypto.enums import KeyAlgorithm
+
+
+
+# Maximum number of decoded signing keys held in memory per process.
+_MAX_SIGNING_KEYS = 4096
+
+# Root directory beneath which cached PEM files are written.
+_PEM_ROOT = pathlib.Path(tempfile.gettempdir()) / "stests" / "keys"
+
+# Map: account hash -> decoded signing key, in least recently used order.
+_SIGNING_KEYS = collections.OrderedDict()
+
+# Map: PEM file path -> count of in-flight references.
+_PEM_REFCOUNTS = collections.Counter()
+
+# Guards access to caches across worker threads.
+_LOCK = threading.Lock()
+
+
+def get_signature_from_cached_key(
+    account_hash: str,
+    msg: bytes,
+    pvk: bytes,
+    algo: KeyAlgorithm,
+    ) -> bytes:
+    """Returns an ECC digital signature, decoding the signing key only upon first use.
+
+    :param account_hash: Hash of account whose key is signing.
+    :param msg: A message to be signed.
+    :param pvk: Private key.
+    :param algo: Type of ECC algo used to generate private key.
+
+    :returns: A digital signature.
+
+    """
+    with _LOCK:
+        try:
+            _SIGNING_KEYS.move_to_end(account_hash)
+            sk = _SIGNING_KEYS[account_hash]
+        except KeyError:
+            sk = _SIGNING_KEYS[account_hash] = ecc.get_signing_key(pvk, algo)
+            if len(_SIGNING_KEYS) > _MAX_SIGNING_KEYS:
+                _SIGNING_KEYS.popitem(last=False)
+
+    return ecc.get_signature_from_signing_key(msg, sk, algo)
+
+
+@contextlib.contextmanager
+def get_pvk_pem_file_from_cache(
+    account_hash: str,
+    pvk: bytes,
+    algo: KeyAlgorithm,
+    scope: str,
+    ) -> typing.Iterator[str]:
+    """Yields path to a PEM file at a deterministic location, writing it only if absent.
+
+    :param account_hash: Hash of account whose key is being written.
+    :param pvk: Private key.
+    :param algo: Type of ECC algo used to generate private key.
+    :param scope: Relative directory within which file is written, e.g. network/run.
+
+    :returns: Path to a file containing an ECC private key in PEM format.
+
+    """
+    fpath = _PEM_ROOT / scope / f"{account_hash}.pem"
+    with _LOCK:
+        _PEM_REFCOUNTS[fpath] += 1
+    try:
+        if not fpath.exists():
+            _write_pem_file(fpath, ecc.get_pvk_pem_from_bytes(pvk, algo))
+        yield str(fpath)
+    finally:
+        with _LOCK:
+            _PEM_REFCOUNTS[fpath] -= 1
+            if _PEM_REFCOUNTS[fpath] <= 0:
+                del _PEM_REFCOUNTS[fpath]
+
+
+def delete_pvk_pem_files(scope: str):
+    """Deletes cached PEM files within a scope that are not currently in use.
+
+    :param scope: Relative directory within which files were written, e.g. network/run.
+
+    """
+    dpath = _PEM_ROOT / scope
+    if not dpath.exists():
+        return
+
+    with _LOCK:
+        for fpath in dpath.glob("*.pem"):
+            if fpath not in _PEM_REFCOUNTS:
+                fpath.unlink(missing_ok=True)
+    try:
+        dpath.rmdir()
+    except OSError:
+        pass
+
+
+def get_key_scope(network: str, run_type: str = None, run_index: int = None) -> str:
+    """Returns relative directory within which an account's cached PEM file is written.
+
+    :param network: Name of network with which account is associated.
+    :param run_type: Type of generator run with which account is associated.
+    :param run_index: Index of generator run with which account is associated.
+
+    :returns: A relative directory path.
+
+    """
+    if run_index is None:
+        return f"{network}"
+
+    return f"{network}/{run_type}/R-{str(run_index).zfill(3)}"
+
+
+def _write_pem_file(fpath: pathlib.Path, as_pem: bytes):
+    """Atomically writes a PEM file so that concurrent readers never observe a partial file.
+
+    """
+    fpath.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.NamedTemporaryFile("wb", dir=fpath.parent, delete=False) as temp_file:
+        temp_file.write(as_pem)
+    os.chmod(temp_file.name, 0o600)
+    os.replace(temp_file.name, fpath)
@@ -1,32 +1,75 @@
+import collections
+import dataclasses
 import inspect
+import threading
+import time
 import typing
 
+from stests.core.types.orchestration import ExecutionContext
+from stests.core.types.orchestration import ExecutionStatus
 from stests.core.utils import encoder as _encoder
+from stests.core.utils import env
 
 
 
+# Environment variables required by this module.
+class EnvVars:
+    # Mode by which execution contexts are passed within messages: VALUE | REFERENCE.
+    CONTEXT_MODE = env.get_var("BROKER_CONTEXT_MODE", "VALUE")
+
+
 # Represents contents of a Message object as a dict.
 MessageData = typing.Dict[str, typing.Any]
 
+# Key under which a context reference is encoded.
+_CONTEXT_REF = "_ctx_ref"
+
+# Maximum number of run contexts held in memory per process.
+_MAX_CONTEXTS = 256
+
+# Maximum delay (milliseconds) of a message carrying context references - messages delayed longer carry contexts by value.
+_MAX_REFERENCE_DELAY = 1800 * 1000
+
+# Interval (seconds) between successive resets of a referenced run context's cache expiration.
+_REFRESH_INTERVAL = 60.0
+
+# Map: (network, run type, run index) -> moment at which run context's cache expiration was last reset.
+_REFRESHED = dict()
+
+# Map: (network, run type, run index) -> run context, in least recently used order.
+_CONTEXTS = collections.OrderedDict()
+
+# Guards access to context cache across worker threads.
+_LOCK = threading.Lock()
+
 
 def encode(data: MessageData) -> bytes:
     """Encodes input data in readiness for dispatch over wire.
 
     :param data: Message data to be dispatched over wire.
     :returns: Bytestream for dispatch.
-    
+
     """
+    if EnvVars.CONTEXT_MODE == "REFERENCE" and not _is_long_delayed(data):
+        data = _encode_context_refs(data)
+
     return _encoder.as_json(data)
 
 
 def decode(data: bytes) -> MessageData:
     """Decodes data dispatched over wire.
-    
+
     :param data: Bytestream to be decoded.
     :returns: Message data for further processing.
 
     """
-    return _encoder.from_json(data.decode("utf-8"))
+    data = _encoder.from_json(data.decode("utf-8"))
+    if "args" in data:
+        data["args"] = [_decode_context_ref(i) for i in data["args"]]
+    if data.get("kwargs"):
+        data["kwargs"] = {k: _decode_context_ref(v) for k, v in data["kwargs"].items()}
+
+    return data
 
 
 def initialise():
@@ -34,3 +77,141 @@ def initialise():
 
     """
     _encoder.initialise()
+
+
+def register_context(ctx: ExecutionContext):
+    """Registers a run context - which must have been cached - so that messages may carry a reference to it.
+
+    :param ctx: Execution context information.
+
+    """
+    _set_context(dataclasses.replace(ctx))
+
+
+def _encode_context_refs(obj: typing.Any) -> typing.Any:
+    """Returns message data within which registered run contexts are replaced by compact references.
+
+    """
+    if isinstance(obj, ExecutionContext):
+        with _LOCK:
+            registered = _CONTEXTS.get(_get_context_key(obj))
+        if registered is None or registered.uid != obj.uid:
+            return obj
+        _refresh_context(_get_context_key(obj))
+        return {_CONTEXT_REF: [
+            obj.network,
+            obj.run_type,
+            obj.run_index,
+            obj.uid,
+            obj.phase_index,
+            obj.step_index,
+            obj.step_label,
+            obj.status.name,
+        ]}
+
+    if isinstance(obj, (list, tuple)):
+        return [_encode_context_refs(i) for i in obj]
+
+    if isinstance(obj, dict):
+        return {k: _encode_context_refs(v) for k, v in obj.items()}
+
+    return obj
+
+
+def _decode_context_ref(obj: typing.Any) -> typing.Any:
+    """Returns run context resolved from a reference - fields that vary across a run are carried by reference.
+
+    """
+    if not isinstance(obj, dict) or _CONTEXT_REF not in obj:
+        return obj
+
+    network, run_type, run_index, uid, phase_index, step_index, step_label, status = obj[_CONTEXT_REF]
+    ctx = _get_context(network, run_type, run_index, uid)
+
+    return dataclasses.replace(
+        ctx,
+        phase_index=phase_index,
+        status=ExecutionStatus[status],
+        step_index=step_index,
+        step_label=step_label,
+        )
+
+
+def _get_context(network: str, run_type: str, run_index: int, uid: str) -> ExecutionContext:
+    """Returns run context from process cache, pulling it from cache store upon first use.
+
+    N.B. run indexes restart once a generator's run count is flushed, hence contexts are matched upon run uid.
+
+    """
+    key = (network, run_type, run_index)
+    with _LOCK:
+        try:
+            _CONTEXTS.move_to_end(key)
+            ctx = _CONTEXTS[key]
+        except KeyError:
+            ctx = None
+    if ctx is not None and ctx.uid == uid:
+        _refresh_context(key)
+        return ctx
+
+    # JIT import to avoid circularity.
+    from stests.core import cache
+
+    ctx = cache.orchestration.get_context(network, run_index, run_type)
+    if ctx is None or ctx.uid != uid:
+        raise ValueError(f"Unresolvable context reference: {network} :: {run_type} :: R-{str(run_index).zfill(3)} :: {uid}")
+    _set_context(ctx)
+
+    return ctx
+
+
+def _get_context_key(ctx: ExecutionContext) -> typing.Tuple[str, str, int]:
+    """Returns key under which a run context is held in process cache.
+
+    """
+    return ctx.network, ctx.run_type, ctx.run_index
+
+
+def _is_long_delayed(data: MessageData) -> bool:
+    """Returns flag indicating whether a message is delayed such that a context reference might not resolve upon receipt.
+
+    """
+    eta = (data.get("options") or dict()).get("eta")
+
+    return eta is not None and eta - int(time.time() * 1000) > _MAX_REFERENCE_DELAY
+
+
+def _refresh_context(key: typing.Tuple[str, str, int]):
+    """Periodically resets cache expiration of a referenced run context so that it outlives messages in flight.
+
+    """
+    now = time.monotonic()
+    with _LOCK:
+        if key in _REFRESHED and now - _REFRESHED[key] < _REFRESH_INTERVAL:
+            return
+        _REFRESHED[key] = now
+        if len(_REFRESHED) > _MAX_CONTEXTS:
+            del _REFRESHED[next(iter(_REFRESHED))]
+
+    _set_context_expiration(*key)
+
+
+def _set_context_expiration(network: str, run_type: str, run_index: int):
+    """Resets cache expiration of a run context.
+
+    """
+    # JIT import to avoid circularity.
+    from stests.core import cache
+
+    cache.orchestration.set_context_expiration(network, run_index, run_type)
+
+
+def _set_context(ctx: ExecutionContext):
+    """Holds a run context in process cache.
+
+    """
+    with _LOCK:
+        _CONTEXTS[_get_context_key(ctx)] = ctx
+        _CONTEXTS.move_to_end(_get_context_key(ctx))
+        if len(_CONTEXTS) > _MAX_CONTEXTS:
+            _CONTEXTS.popitem(last=False)
@@ -1,74 +1,137 @@
-import random
+import itertools
+import time
+import typing
 from uuid import uuid4
 
-from dramatiq import group
-from dramatiq import pipeline
-from dramatiq import  middleware
+import dramatiq
+from dramatiq import Message
+from dramatiq.middleware.group_callbacks import GroupCallbacks
 from dramatiq.rate_limits import Barrier
 
 
 
-class MessageGroup(group):
-    """Extends dramatiq group composition primitive.
-    
+# Default number of messages built & enqueued per chunk.
+CHUNK_SIZE = 1000
+
+# Default time-to-live (milliseconds) of a group completion barrier.
+BARRIER_TTL = 86400 * 1000
+
+
+class MessageGroup():
+    """Streams a (potentially very large) group of messages to a broker in fixed size chunks.
+
+    Unlike dramatiq's group composition primitive, messages are neither materialised
+    nor copied: each is built, with completion barrier options attached, just prior
+    to being enqueued, thus memory is bounded by chunk size rather than group size.
+
     """
-    def run(self, *, delay=None, dispatch_window=None):
-        """Run the actors in this group over a dispatch window.
+    def __init__(
+        self,
+        actor: dramatiq.Actor,
+        args: typing.Iterator[tuple],
+        count: int,
+        *,
+        broker: dramatiq.Broker = None,
+        chunk_size: int = CHUNK_SIZE,
+        ):
+        """Constructor.
+
+        :param actor: Actor to which messages will be dispatched.
+        :param args: Iterator over message arguments.
+        :param count: Number of messages to be dispatched - i.e. parties to completion barrier.
+        :param broker: Broker to which messages will be enqueued - defaults to global broker.
+        :param chunk_size: Number of messages built & enqueued per chunk.
+
+        """
+        self.actor = actor
+        self.args = args
+        self.broker = broker or dramatiq.get_broker()
+        self.chunk_size = chunk_size
+        self.completion_callbacks = []
+        self.count = count
+
+
+    def __len__(self):
+        """Returns the size of the group.
+
+        """
+        return self.count
+
+
+    def add_completion_callback(self, message: Message):
+        """Adds a callback to be enqueued once every message in the group has been processed.
+
+        :param message: Callback message.
 
-        Parameters:
-          delay(int): The minimum amount of time, in milliseconds,
-            each message in the group should be delayed by.
         """
+        self.completion_callbacks.append(message.asdict())
+
 
+    def run(self, *, delay: int = None, dispatch_interval: float = None) -> int:
+        """Enqueues messages chunk by chunk, optionally at a fixed dispatch rate.
+
+        :param delay: The minimum amount of time, in milliseconds, each message should be delayed by.
+        :param dispatch_interval: The amount of time, in milliseconds, between successive messages -
+                                  messages are scheduled against the moment the group started running
+                                  so that the time taken to enqueue does not skew the achieved rate.
+
+        :returns: Number of messages enqueued.
+
+        """
+        options = dict()
         if self.completion_callbacks:
-            from dramatiq.middleware.group_callbacks import GROUP_CALLBACK_BARRIER_TTL, GroupCallbacks
-
-            rate_limiter_backend = None
-            for middleware in self.broker.middleware:
-                if isinstance(middleware, GroupCallbacks):
-                    rate_limiter_backend = middleware.rate_limiter_backend
-                    break
-            else:
-                raise RuntimeError(
-                    "GroupCallbacks middleware not found! Did you forget "
-                    "to set it up? It is required if you want to use "
-                    "group callbacks."
-                )
-
-            # Generate a new completion uuid on every run so that if a
-            # group is re-run, the barriers are all separate.
-            # Re-using a barrier's name is an unsafe operation.
-            completion_uuid = str(uuid4())
-            completion_barrier = Barrier(rate_limiter_backend, completion_uuid, ttl=GROUP_CALLBACK_BARRIER_TTL)
-            completion_barrier.create(len(self.children))
-
-            children = []
-            for child in self.children:
-                if isinstance(child, group):
-                    raise NotImplementedError
-
-                elif isinstance(child, pipeline):
-                    pipeline_children = child.messages[:]
-                    pipeline_children[-1] = pipeline_children[-1].copy(options={
-                        "group_completion_uuid": completion_uuid,
-                        "group_completion_callbacks": self.completion_callbacks,
-                    })
-
-                    children.append(pipeline(pipeline_children, broker=child.broker))
-
-                else:
-                    children.append(child.copy(options={
-                        "group_completion_uuid": completion_uuid,
-                        "group_completion_callbacks": self.completion_callbacks,
-                    }))
+            barrier = self._create_completion_barrier()
+            options["group_completion_uuid"] = barrier.key
+            options["group_completion_callbacks"] = self.completion_callbacks
+
+        started = time.monotonic()
+        enqueued = 0
+        while True:
+            chunk = list(itertools.islice(self.args, self.chunk_size))
+            if not chunk:
+                break
+            for args in chunk:
+                if dispatch_interval:
+                    elapsed = (time.monotonic() - started) * 1000
+                    delay = max(0, int(enqueued * dispatch_interval - elapsed))
+                self.broker.enqueue(
+                    self.actor.message_with_options(args=args, **options),
+                    delay=delay or None
+                    )
+                enqueued += 1
+
+        # Release barrier parties for which no message was yielded.
+        if self.completion_callbacks and enqueued < self.count:
+            self._release_completion_barrier(barrier, self.count - enqueued)
+
+        return enqueued
+
+
+    def _create_completion_barrier(self) -> Barrier:
+        """Creates barrier which, once all messages have been processed, triggers completion callbacks.
+
+        """
+        for middleware in self.broker.middleware:
+            if isinstance(middleware, GroupCallbacks):
+                break
         else:
-            children = self.children
+            raise RuntimeError("GroupCallbacks middleware not found - it is required by group callbacks.")
+
+        # N.B. barrier TTL is configured upon the middleware in later dramatiq versions.
+        ttl = getattr(middleware, "barrier_ttl", BARRIER_TTL)
 
-        for child in children:
-            if isinstance(child, (group, pipeline)):
-                child.run(delay=delay)
-            else:
-                delay = random.randint(0, dispatch_window) if dispatch_window else delay
-                self.broker.enqueue(child, delay=delay)
+        # N.B. a new barrier is created per run as re-using a barrier's name is unsafe.
+        barrier = Barrier(middleware.rate_limiter_backend, str(uuid4()), ttl=ttl)
+        barrier.create(max(1, self.count))
 
-        return self
+        return barrier
+
+
+    def _release_completion_barrier(self, barrier: Barrier, parties: int):
+        """Releases barrier parties, enqueuing completion callbacks if barrier is thereby cleared.
+
+        """
+        for _ in range(parties):
+            if barrier.wait(block=False):
+                for message in self.completion_callbacks:
+                    self.broker.enqueue(Message(**message))
@@ -3,28 +3,60 @@ import typing
 from stests.core.types.orchestration import ExecutionContext
 from stests.core.types.infra import NodeIdentifier
 from stests.generators.meta import GENERATOR_MAP as WORKFLOWS
+from stests.generators.utils import verification
 
 
 
+# Map: run type -> workflow - workflows are immutable thus built once per process & shared.
+_REGISTRY: typing.Dict[str, "Workflow"] = dict()
+
+
+class WorkflowStepResult():
+    """Outcome of a single execution of a workflow step.
+    
+    """
+    def __init__(self, step: "WorkflowStep"):
+        """Constructor.
+        
+        :param step: Step that was executed.
+
+        """
+        # Step that was executed.
+        self.step = step
+
+        # Execution error.
+        self.error: typing.Union[str, Exception] = None
+
+        # Execution result.
+        self.result: typing.Union[None, typing.Callable] = None
+
+
 class WorkflowStep():
     """A step with a phase of a broader workflow.
     
+    N.B. steps are shared across actor invocations thus execution state is held by a WorkflowStepResult.
+
     """
-    def __init__(self, index: int, container):
+    def __init__(self, index: int, container, is_last: bool = False, dependencies: typing.Tuple[int] = ()):
         """Constructor.
         
         :param index: Ordinal position within set of steps.
         :param container: Module containing step related functions.
+        :param is_last: Flag indicating whether this is the last step within the phase.
+        :param dependencies: Ordinal positions of steps that must complete prior to this step starting.
 
         """
         # Index within the set of phase steps.
         self.index: int = index
 
+        # Indexes of steps that must complete prior to this step starting.
+        self.dependencies: typing.FrozenSet[int] = frozenset(dependencies)
+
         # A flag indicating whether this is an asynchronous step - i.e. relies upon chain events to complete.
         self.is_async = hasattr(container, "verify_deploy")
 
         # Flag indicating whether this is the last step within the phase.
-        self.is_last: bool = False
+        self.is_last: bool = is_last
 
         # A flag indicating whether this is a synchronous step.
         self.is_sync = not self.is_async
@@ -32,45 +64,32 @@ class WorkflowStep():
         # Python module in which the step is declared.
         self.container = container
 
-        # Execution error.
-        self.error: typing.Union[str, Exception] = None
-
-        # Execution result.
-        self.result: typing.Union[None, typing.Callable] = None
-
-    @property
-    def has_verifer(self) -> bool:
-        try:
-            self.container.verify
-        except AttributeError:
-            return False
-        else:
-            return True
+        # Flag indicating whether step declares a verifier.
+        self.has_verifer: bool = hasattr(container, "verify")
 
-    @property
-    def has_verifer_for_deploy(self) -> bool:
-        try:
-            self.container.verify_deploy
-        except AttributeError:
-            return False
-        else:
-            return True
+        # Flag indicating whether step declares a deploy verifier.
+        self.has_verifer_for_deploy: bool = hasattr(container, "verify_deploy")
 
     @property
     def label(self) -> str:
         return self.container.LABEL
 
 
-    def execute(self, ctx):
+    def execute(self, ctx) -> WorkflowStepResult:
         """Performs step execution.
         
         :param ctx: Execution context information.
 
+        :returns: Execution outcome - exceptions are trapped.
+
         """
+        outcome = WorkflowStepResult(self)
         try:
-            self.result = self.container.execute(ctx)
+            outcome.result = self.container.execute(ctx)
         except Exception as err:
-            self.error = err
+            outcome.error = err
+
+        return outcome
 
 
     def verify(self, ctx):
@@ -94,6 +113,30 @@ class WorkflowStep():
         self.container.verify_deploy(ctx, node_id, block_hash, deploy_hash)
 
 
+    def verify_deploys(
+        self,
+        ctx: ExecutionContext,
+        finalized: typing.List[typing.Tuple[NodeIdentifier, str, str]],
+        ) -> typing.Dict[str, AssertionError]:
+        """Performs step deploy verification over a set of deploys - deploys are decached in a single round-trip.
+        
+        :param ctx: Execution context information.
+        :param finalized: Set of (node identifier, block hash, deploy hash) - one per finalized deploy.
+
+        :returns: Map: deploy hash -> verification error - one per deploy that failed verification.
+
+        """
+        errors = dict()
+        with verification.prefetch_deploys(ctx, [deploy_hash for _, _, deploy_hash in finalized]):
+            for node_id, block_hash, deploy_hash in finalized:
+                try:
+                    self.verify_deploy(ctx, node_id, block_hash, deploy_hash)
+                except AssertionError as err:
+                    errors[deploy_hash] = err
+
+        return errors
+
+
     def verify_deploy_batch_is_complete(self, ctx: ExecutionContext, deploy_index: int):
         """Performs step deploy batch is complete verification.
         
@@ -113,28 +156,32 @@ class WorkflowPhase():
     """A phase within a broader workflow.
     
     """
-    def __init__(self, index: int, container):
+    def __init__(self, index: int, container, is_last: bool = False):
         """Constructor.
         
         :param index: Ordinal position within set of phases.
-        :param container: Module or tuple containing phase steps.
+        :param container: Module or tuple containing phase steps (executed in sequence),
+                          or dict mapping each phase step to steps upon which it depends (executed concurrently when ready).
+        :param is_last: Flag indicating whether this is the last phase within the workflow.
 
         """
         # Index within the set of phases.
         self.index: int = index
 
         # Flag indicating whether this is the last phase within the workflow.
-        self.is_last: bool = False
+        self.is_last: bool = is_last
+
+        # Flag indicating whether steps are scheduled as per declared dependencies rather than in sequence.
+        self.is_concurrent: bool = isinstance(container, dict)
 
         # Set steps.
-        if isinstance(container, tuple):
-            self.steps = [WorkflowStep(i, s) for i, s in enumerate(container)]
+        if self.is_concurrent:
+            self.steps: typing.Tuple[WorkflowStep] = _get_concurrent_steps(container)
         else:
-            self.steps = [WorkflowStep(i, s) for i, s in enumerate(container.STEPS)]
-
-        # Set last step flag.
-        if self.steps:
-            self.steps[-1].is_last = True
+            steps = container if isinstance(container, tuple) else container.STEPS
+            self.steps: typing.Tuple[WorkflowStep] = tuple(
+                WorkflowStep(i, s, i == len(steps) - 1, () if i == 0 else (i - 1, )) for i, s in enumerate(steps)
+                )
 
 
     def get_step(self, step_index: int) -> WorkflowStep:
@@ -144,6 +191,37 @@ class WorkflowPhase():
         return self.steps[step_index - 1]
 
 
+    def get_ready_steps(self, completed: typing.Set[int]) -> typing.List[WorkflowStep]:
+        """Returns steps that are ready to start, i.e. incomplete steps whose dependencies are complete.
+
+        :param completed: Indexes (1 based, as per execution context) of completed steps.
+
+        :returns: Steps ready to start.
+
+        """
+        completed = {i - 1 for i in completed}
+
+        return [i for i in self.steps if i.index not in completed and i.dependencies <= completed]
+
+
+def _get_concurrent_steps(container: dict) -> typing.Tuple[WorkflowStep]:
+    """Returns steps of a phase whose steps are scheduled as per declared dependencies.
+
+    N.B. a step may only depend upon steps declared before it, thus dependencies are acyclic.
+
+    """
+    indexes = dict()
+    steps = []
+    for i, (step, dependencies) in enumerate(container.items()):
+        try:
+            steps.append(WorkflowStep(i, step, dependencies=[indexes[j] for j in dependencies]))
+        except KeyError:
+            raise ValueError(f"Step dependencies must be declared before dependent step: {step.LABEL}")
+        indexes[step] = i
+
+    return tuple(steps)
+
+
 class Workflow():
     """A workflow executed in order to test a scenario.
     
@@ -151,16 +229,13 @@ class Workflow():
     def __init__(self, meta):
         """Constructor.
 
-        :param ctx: Execution context information.
         :param meta: Workflow metadata module.
 
         """
         # Set phases.
-        self.phases = [WorkflowPhase(i, p) for i, p in enumerate(meta.PHASES)]
-
-        # Set last phase flag.
-        if self.phases:
-            self.phases[-1].is_last = True
+        self.phases: typing.Tuple[WorkflowPhase] = tuple(
+            WorkflowPhase(i, p, i == len(meta.PHASES) - 1) for i, p in enumerate(meta.PHASES)
+            )
 
     
     def get_phase(self, phase_index: int) -> WorkflowPhase:
@@ -185,15 +260,20 @@ class Workflow():
         
         :param ctx: Workflow execution context information.
 
-        :returns: Workflow wrapper instance.
+        :returns: Workflow wrapper instance - memoised per run type.
 
         """
+        try:
+            return _REGISTRY[ctx.run_type]
+        except KeyError:
+            pass
+
         try:
             WORKFLOWS[ctx.run_type]
         except KeyError:
             raise ValueError(f"Unsupported workflow type: {ctx.run_type}")
         else:
-            return Workflow(WORKFLOWS[ctx.run_type])
+            return _REGISTRY.setdefault(ctx.run_type, Workflow(WORKFLOWS[ctx.run_type]))
 
 
     @staticmethod
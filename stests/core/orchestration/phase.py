@@ -6,6 +6,7 @@ from stests.core.logging import log_event
 from stests.core.orchestration import predicates
 from stests.core.orchestration.model import Workflow
 from stests.core.orchestration.step import do_step
+from stests.core.orchestration.step import do_steps
 from stests.core.types.orchestration import ExecutionAspect
 from stests.core.types.orchestration import ExecutionContext
 from stests.core.types.orchestration import ExecutionStatus
@@ -41,8 +42,12 @@ def do_phase(ctx: ExecutionContext):
     # Notify.
     log_event(EventType.WFLOW_PHASE_START, None, ctx)
 
-    # Enqueue step.
-    do_step.send(ctx)
+    # Enqueue either first step or - when scheduled as per declared dependencies - steps without dependencies.
+    phase = Workflow.get_phase_(ctx, ctx.phase_index)
+    if phase.is_concurrent:
+        do_steps(ctx, phase.get_ready_steps(set()))
+    else:
+        do_step.send(ctx)
 
 
 @dramatiq.actor(queue_name=_QUEUE)
@@ -1,8 +1,10 @@
 import dramatiq
 
 from stests.core import cache
+from stests.core import crypto
 from stests.core import factory
 from stests.core.logging import log_event
+from stests.core.mq import encoder as mq_encoder
 from stests.core.orchestration import predicates
 from stests.core.orchestration.phase import do_phase
 from stests.core.types.orchestration import ExecutionAspect
@@ -48,6 +50,9 @@ def do_run(ctx: ExecutionContext):
         ExecutionAspect.RUN, ctx
         ))
 
+    # Context is now cached, thus subsequent messages may carry it by reference.
+    mq_encoder.register_context(ctx)
+
     # Notify.
     log_event(EventType.WFLOW_RUN_START, None, ctx)
 
@@ -72,6 +77,9 @@ def on_run_end(ctx: ExecutionContext):
     # Locks can now be deleted.
     cache.orchestration.delete_locks(ctx)   
 
+    # Cached key files can now be deleted.
+    crypto.delete_pvk_pem_files(crypto.get_key_scope(ctx.network, ctx.run_type, ctx.run_index))
+
     # Cache can now be pruned.
     if bool(ctx.prune_on_completion):
         cache.orchestration.prune_on_run_completion(ctx)   
@@ -1,5 +1,7 @@
+import dataclasses
 import random
 import time
+import typing
 
 import dramatiq
 
@@ -8,21 +10,38 @@ from stests.core import factory
 from stests.core.logging import log_event
 from stests.core.mq.extensions import MessageGroup
 from stests.core.orchestration.model import Workflow
+from stests.core.orchestration.model import WorkflowPhase
 from stests.core.orchestration.model import WorkflowStep
+from stests.core.orchestration.model import WorkflowStepResult
 from stests.core.orchestration import predicates
 from stests.core.types.infra import NodeIdentifier
 from stests.core.types.orchestration import ExecutionAspect
 from stests.core.types.orchestration import ExecutionContext
 from stests.core.types.orchestration import ExecutionStatus
+from stests.core.utils.env import get_var
 from stests.core.utils.exceptions import IgnoreableAssertionError
 from stests.events import EventType
 
 
 
+# Environment variables required by this module.
+class EnvVars:
+    # Time (seconds) - beyond expected dispatch duration - after which an incomplete asynchronous step is ended with a report (0 = never).
+    ASYNC_STEP_TIMEOUT = get_var("ORCHESTRATION_ASYNC_STEP_TIMEOUT", 0, int)
+
 
 # Queue to which messages will be dispatched.
 _QUEUE = "orchestration.engine.step"
 
+# Maximum number of outstanding deploys listed within a step timeout report.
+_MAX_REPORTED_DEPLOYS = 20
+
+# Outcome of a step whose deploys were all finalised.
+_OUTCOME_COMPLETE = "complete"
+
+# Outcome of a step whose deploys were not all finalised within timeout.
+_OUTCOME_TIMED_OUT = "timed-out"
+
 
 @dramatiq.actor(queue_name=_QUEUE)
 def do_step(ctx: ExecutionContext):
@@ -100,8 +119,11 @@ def on_step_end(ctx: ExecutionContext):
     # Notify.
     log_event(EventType.WFLOW_STEP_END, None, ctx)
 
-    # Enqueue either end of phase or next step. 
-    if step.is_last:
+    # Enqueue either end of phase or next step(s). 
+    phase = Workflow.get_phase_(ctx, ctx.phase_index)
+    if phase.is_concurrent:
+        _on_concurrent_step_end(ctx, phase)
+    elif step.is_last:
         # Note: JIT import to avoid circularity.
         from stests.core.orchestration.phase import on_phase_end
         on_phase_end.send(ctx)
@@ -152,25 +174,117 @@ def on_step_deploy_finalized(ctx: ExecutionContext, node_id: NodeIdentifier, blo
         log_event(EventType.WFLOW_STEP_FAILURE, f"deploy verification failed: {err} :: {deploy_hash}", ctx)
         return
 
+    # Update step completion tracker - escape if deploy is not outstanding, e.g. a duplicate correlation.
+    was_outstanding, pending, outstanding = cache.orchestration.delete_step_tracker_deploy(ctx, deploy_hash)
+    if pending is not None and not was_outstanding:
+        return
+
     # Increment verified deploy counts.
     _, _, deploy_index = cache.orchestration.increment_deploy_counts(ctx)
 
-    # Verify deploy batch is complete.
-    try:
-        step.verify_deploy_batch_is_complete(ctx, deploy_index)
-    except:
+    # Signal step end if complete.
+    _on_step_deploys_verified(ctx, step, deploy_index, pending, outstanding)
+
+
+@dramatiq.actor(queue_name=_QUEUE)
+def on_step_deploys_finalized(ctx: ExecutionContext, finalized: typing.List[typing.Tuple[NodeIdentifier, str, str]]):
+    """Processes a batch of finalized deploys within the context of a step.
+    
+    :param ctx: Execution context information.
+    :param finalized: Set of (node identifier, block hash, deploy hash) - one per finalized deploy.
+
+    """
+    # Set step - escape if not found.
+    step = Workflow.get_phase_step(ctx, ctx.phase_index, ctx.step_index)
+    if step is None:
+        log_event(EventType.WFLOW_STEP_FAILURE, "invalid step", ctx)
         return
 
-    # Verify step.
-    if step.has_verifer:
-        try:
-            step.verify(ctx)
-        except AssertionError as err:
-            log_event(EventType.WFLOW_STEP_FAILURE, f"verification failed", ctx)
-            return    
+    # Escape if no deploy verifier.
+    if not step.has_verifer_for_deploy:
+        log_event(EventType.WFLOW_STEP_FAILURE, "deploy verifier undefined", ctx)
+        return 
 
-    # Step verification succeeded therefore signal step end.
-    on_step_end.send(ctx)
+    # Verify deploys - failures are reported per deploy.
+    errors = step.verify_deploys(ctx, finalized)
+    for deploy_hash, err in errors.items():
+        log_event(EventType.WFLOW_STEP_FAILURE, f"deploy verification failed: {err} :: {deploy_hash}", ctx)
+    verified = [deploy_hash for _, _, deploy_hash in finalized if deploy_hash not in errors]
+    if not verified:
+        return
+
+    # Update step completion tracker - deploys that are not outstanding, e.g. duplicate correlations, are ignored.
+    was_outstanding, pending, outstanding = cache.orchestration.delete_step_tracker_deploys(ctx, verified)
+    count = len(verified) if pending is None else sum(was_outstanding)
+    if count == 0:
+        return
+
+    # Increment verified deploy counts.
+    _, _, deploy_index = cache.orchestration.increment_deploy_counts(ctx, count)
+
+    # Signal step end if complete.
+    _on_step_deploys_verified(ctx, step, deploy_index, pending, outstanding)
+
+
+@dramatiq.actor(queue_name=_QUEUE)
+def on_step_timeout(ctx: ExecutionContext, timeout: int):
+    """Ends in error an asynchronous step whose deploys were not all finalised within timeout.
+    
+    :param ctx: Execution context information.
+    :param timeout: Time (seconds) after which step timed out.
+
+    """
+    # Escape if step completed.
+    pending, outstanding = cache.orchestration.get_step_tracker_count(ctx)
+    if pending is None or (not pending and not outstanding):
+        return
+
+    # Close tracker - escape if step concurrently completed.
+    state = cache.orchestration.set_step_tracker_closed(ctx, _OUTCOME_TIMED_OUT)
+    if state is None:
+        return
+
+    # Report deploys that were either not dispatched or not finalised.
+    pending, outstanding = state
+    err = f"timed out after {timeout}s :: deploys not dispatched={pending} :: deploys not finalised={len(outstanding)}"
+    if outstanding:
+        err += f" :: {', '.join(outstanding[:_MAX_REPORTED_DEPLOYS])}"
+        if len(outstanding) > _MAX_REPORTED_DEPLOYS:
+            err += ", ..."
+    on_step_error.send(ctx, err)
+
+
+def do_steps(ctx: ExecutionContext, steps: typing.List[WorkflowStep]):
+    """Enqueues a set of steps for concurrent execution.
+    
+    :param ctx: Execution context information.
+    :param steps: Steps within current phase to be executed.
+
+    """
+    # N.B. do_step executes step following that of context.
+    for step in steps:
+        do_step.send(dataclasses.replace(ctx, step_index=step.index, step_label=None))
+
+
+def _on_concurrent_step_end(ctx: ExecutionContext, phase: WorkflowPhase):
+    """Enqueues either end of phase - once all steps have completed - or steps whose dependencies have completed.
+    
+    """
+    # Update phase barrier - escape if step previously completed.
+    arrived, completed = cache.orchestration.set_phase_barrier_step(ctx)
+    if not arrived:
+        return
+
+    # Enqueue end of phase.
+    completed = {int(i) for i in completed}
+    if len(completed) == len(phase.steps):
+        # Note: JIT import to avoid circularity.
+        from stests.core.orchestration.phase import on_phase_end
+        on_phase_end.send(ctx)
+
+    # Enqueue steps made ready by this step - duplicates are rejected by step locks.
+    else:
+        do_steps(ctx, [i for i in phase.get_ready_steps(completed) if ctx.step_index - 1 in i.dependencies])
 
 
 def _can_start(ctx: ExecutionContext) -> bool:
@@ -211,87 +325,131 @@ def _execute(ctx: ExecutionContext, step: WorkflowStep):
     
     """
     # Execute - exceptions are trapped.
-    step.execute(ctx)
+    outcome = step.execute(ctx)
 
     # Process errors.
-    if step.error:
-        on_step_error.send(ctx, str(step.error))
+    if outcome.error:
+        on_step_error.send(ctx, str(outcome.error))
 
     # Exception if step result != None | tuple.
-    elif step.result is not None and not isinstance(step.result, tuple):
+    elif outcome.result is not None and not isinstance(outcome.result, tuple):
         raise TypeError("Expecting either None or a tuple from a step function.")
 
     # Process result for async ops.
     elif step.is_async:
-        _on_execute_async(ctx, step)
+        _on_execute_async(ctx, outcome)
 
     # Process result for sync ops.
     else:
-        _on_execute_sync(ctx, step)
+        _on_execute_sync(ctx, outcome)
 
 
-def _on_execute_async(ctx: ExecutionContext, step: WorkflowStep):
+def _on_step_deploys_verified(
+    ctx: ExecutionContext,
+    step: WorkflowStep,
+    deploy_index: int,
+    pending: typing.Optional[int],
+    outstanding: int,
+    ):
+    """Signals step end once all deploys dispatched during an asynchronous step have been verified.
+        
+    """
+    # Verify deploy batch is complete - untracked steps fall back to deploy count.
+    if pending is None:
+        try:
+            step.verify_deploy_batch_is_complete(ctx, deploy_index)
+        except:
+            return
+    elif pending or outstanding:
+        return
+
+    # Close tracker - escape if step timed out or was previously completed.
+    if pending is not None and cache.orchestration.set_step_tracker_closed(ctx, _OUTCOME_COMPLETE) is None:
+        return
+
+    # Verify step.
+    if step.has_verifer:
+        try:
+            step.verify(ctx)
+        except AssertionError as err:
+            log_event(EventType.WFLOW_STEP_FAILURE, f"verification failed", ctx)
+            return    
+
+    # Step verification succeeded therefore signal step end.
+    on_step_end.send(ctx)
+
+
+def _on_execute_async(ctx: ExecutionContext, outcome: WorkflowStepResult):
     """Performs post asynchronous step work.
         
     """
     # Enqueue message.
-    if isinstance(step.result, tuple) and len(step.result) == 2:
-        _enqueue_message(ctx, step)
+    if isinstance(outcome.result, tuple) and len(outcome.result) == 2:
+        _set_step_tracker(ctx, 1)
+        _enqueue_message(ctx, outcome)
 
     # Enqueue message batch.
-    elif isinstance(step.result, tuple) and len(step.result) == 3:
-        _enqueue_message_batch(ctx, step)
+    elif isinstance(outcome.result, tuple) and len(outcome.result) == 3:
+        _set_step_tracker(ctx, outcome.result[1])
+        _enqueue_message_batch(ctx, outcome)
     
     else:
         raise TypeError("Async steps must return either a single message or a batch of messages")
 
 
-def _on_execute_sync(ctx: ExecutionContext, step: WorkflowStep):
+def _set_step_tracker(ctx: ExecutionContext, count: int):
+    """Initialises tracking of deploys dispatched during an asynchronous step, plus step timeout.
+        
+    """
+    cache.orchestration.set_step_tracker(ctx, count)
+    if EnvVars.ASYNC_STEP_TIMEOUT:
+        timeout = EnvVars.ASYNC_STEP_TIMEOUT
+        if ctx.deploys_per_second:
+            timeout += int(count / ctx.deploys_per_second)
+        on_step_timeout.send_with_options(args=(ctx, timeout), delay=timeout * 1000)
+
+
+def _on_execute_sync(ctx: ExecutionContext, outcome: WorkflowStepResult):
     """Performs synchronous step work.
         
     """
     # If unit of work is complete then signal step end.
-    if step.result is None:
+    if outcome.result is None:
         do_step_verification.send(ctx)
 
     # Enqueue message batch (with completion callback).
-    elif isinstance(step.result, tuple) and len(step.result) == 3:
-        _enqueue_message_batch(ctx, step)
+    elif isinstance(outcome.result, tuple) and len(outcome.result) == 3:
+        _enqueue_message_batch(ctx, outcome)
 
     else:
         raise TypeError("Sync steps must return None or a batch of messages")
 
 
-def _enqueue_message(ctx, step):
+def _enqueue_message(ctx, outcome):
     """Enqueues a single message.
     
     """
-    actor, args = step.result
+    actor, args = outcome.result
     actor.send_with_options(args=args)
 
 
-def _enqueue_message_batch(ctx, step):
+def _enqueue_message_batch(ctx, outcome):
     """Enqueues a message batch.
     
     """
     # Unpack step result.
-    actor, count, args_factory = step.result
-
-    # Yield args of messages to be enqueued.
-    def message_factory():
-        for args in args_factory():
-            yield actor.message_with_options(args=args)
+    actor, count, args_factory = outcome.result
 
-    # Instantiate a dramatiq group to batch message set.
-    group = MessageGroup(message_factory())
+    # Instantiate a group to stream message set - messages are built lazily chunk by chunk.
+    group = MessageGroup(actor, iter(args_factory()), count)
 
     # When in sync mode we can signal end of step in a completion callback. 
     # In async mode the step end signal is determined post deploy finalisation event.
-    if step.is_sync:
+    if outcome.step.is_sync:
         group.add_completion_callback(do_step_verification.message(ctx))
 
-    # Set window of dispatch.
-    dispatch_window = None if not ctx.deploys_per_second else ctx.get_dispatch_window_ms(count)
+    # Set interval between dispatches - evenly spaced so as to track target rate.
+    dispatch_interval = None if not ctx.deploys_per_second else ctx.get_dispatch_interval_ms()
 
     # Enqueue message batch.
-    group.run(dispatch_window=dispatch_window)
+    group.run(dispatch_interval=dispatch_interval)
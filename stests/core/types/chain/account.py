@@ -60,11 +60,24 @@ class Account:
     def label_run_index(self):
         return f"R-{str(self.run_index).zfill(3)}"
 
-    def get_private_key_pem_filepath(self):
-        """Returns path to associated pem file.
+    def get_private_key_pem_file(self) -> typing.ContextManager[str]:
+        """Returns context manager yielding path to associated (cached) pem file.
         
         """
-        return crypto.get_pvk_pem_file_from_bytes(
+        return crypto.get_pvk_pem_file_from_cache(
+            self.account_hash,
+            bytes.fromhex(self.private_key),
+            crypto.KeyAlgorithm[self.key_algo],
+            crypto.get_key_scope(self.network, self.run_type, self.run_index),
+            )
+
+    def get_signature(self, msg: bytes) -> bytes:
+        """Returns signature of a message signed with associated (cached) signing key.
+        
+        """
+        return crypto.get_signature_from_cached_key(
+            self.account_hash,
+            msg,
             bytes.fromhex(self.private_key),
             crypto.KeyAlgorithm[self.key_algo],
             )
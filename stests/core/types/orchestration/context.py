@@ -98,10 +98,10 @@ class ExecutionContext:
         return f"S-{str(self.step_index).zfill(2)}"
 
 
-    def get_dispatch_window_ms(self, deploy_count):
-        """Returns a time window during which deploys will be dispatched.
+    def get_dispatch_interval_ms(self):
+        """Returns time interval between successive deploy dispatches.
         
         """
         if self.deploys_per_second:
-            return int((deploy_count / self.deploys_per_second) * 1000)
+            return 1000 / self.deploys_per_second
         return 0
\ No newline at end of file
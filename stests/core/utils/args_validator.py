@@ -151,8 +151,8 @@ def validate_node_index_optional(value):
     """Argument verifier: node index.
 
     """
-    if value in (0, -1):
-        return value
+    if value in (0, -1, "0", "-1"):
+        return int(value)
 
     return _validate_int(value, NODE_INDEX_MIN, NODE_INDEX_MAX, "Node")
 
@@ -26,6 +26,12 @@ DCLASS_MAP = dict()
 # Set: supported dataclass types.  
 DCLASS_SET = set()
 
+# Map: dataclass typekey -> specialised decoder.  
+DCLASS_DECODERS = dict()
+
+# Map: dataclass type -> specialised encoder.  
+DCLASS_ENCODERS = dict()
+
 # Set: primitive data types.
 PRIMITIVES = (type(None), int, str, float, bool)
 
@@ -94,35 +100,7 @@ def _decode_dclass(obj):
     """Decodes a registered data class instance.
     
     """
-    # Set data class type.
-    dcls = DCLASS_MAP[obj['_type_key']]
-
-    # Convert fields:
-    for field in dataclasses.fields(dcls):
-        if field.name not in obj:
-            continue
-
-        field_value = obj[field.name]
-        if isinstance(field_value, type(None)):
-            continue 
-
-        field_type = _get_field_type(field)
-        if field_type is datetime.datetime:
-            obj[field.name] = datetime.datetime.fromtimestamp(field_value)
-
-        elif field.type in ENUM_TYPE_SET:
-            obj[field.name] = field.type[obj[field.name]]
-    
-        elif field_type in DCLASS_SET:
-            obj[field.name] = _decode_dclass(obj[field.name])
-
-        else:
-            obj[field.name] = decode(obj[field.name])
-
-    # Remove type key as it has served it's purpose.
-    del obj['_type_key']
-
-    return dcls(**obj)
+    return DCLASS_DECODERS[obj['_type_key']](obj)
 
 
 def _get_field_type(field):
@@ -157,36 +135,75 @@ def encode(data: typing.Any, requires_decoding=True) -> typing.Any:
     if isinstance(data, list):
         return list(map(lambda i: encode(i, requires_decoding), data))
 
-    if type(data) in DCLASS_SET:
-        return _encode_dclass(data, dataclasses.asdict(data), requires_decoding)
+    if type(data) in DCLASS_ENCODERS:
+        return DCLASS_ENCODERS[type(data)](data, requires_decoding)
 
     if type(data) in ENUM_TYPE_SET:
         return data.name
 
+    if dataclasses.is_dataclass(data):
+        return encode(dataclasses.asdict(data), requires_decoding)
+
     log_event(EventType.CORE_ENCODING_FAILURE, f"unrecognized data type: {data}")
 
     return data
 
 
-def _encode_dclass(data, obj, requires_decoding):
-    """Encodes a data class that has been previously registered with the encoder.
+def _get_dclass_decoder(cls) -> typing.Callable[[dict], typing.Any]:
+    """Returns a decoder specialised for a data class - field handling is resolved once upfront.
+    
+    """
+    # Map fields to value decoders.
+    fields = []
+    for field in dataclasses.fields(cls):
+        field_type = _get_field_type(field)
+        if field_type is datetime.datetime:
+            fields.append((field.name, datetime.datetime.fromtimestamp))
+        elif inspect.isclass(field_type) and issubclass(field_type, enum.Enum):
+            fields.append((field.name, field_type.__getitem__))
+        elif dataclasses.is_dataclass(field_type):
+            fields.append((field.name, decode))
+        elif field_type in PRIMITIVES:
+            fields.append((field.name, None))
+        else:
+            fields.append((field.name, decode))
+
+    def decoder(obj):
+        kwargs = dict()
+        for name, decode_value in fields:
+            if name not in obj:
+                continue
+            value = obj[name]
+            if value is None or decode_value is None:
+                kwargs[name] = value
+            else:
+                kwargs[name] = decode_value(value)
+
+        return cls(**kwargs)
+
+    return decoder
+
+
+def _get_dclass_encoder(cls) -> typing.Callable[[typing.Any, bool], dict]:
+    """Returns an encoder specialised for a data class - field handling is resolved once upfront.
     
     """
-    # Inject typekey for subsequent roundtrip.
-    if requires_decoding:
-        obj['_type_key'] = f"{data.__module__}.{data.__class__.__name__}"
+    type_key = f"{cls.__module__}.{cls.__name__}"
+    names = [i.name for i in dataclasses.fields(cls)]
 
-    # Set fields to be encoded.
-    fields = [i for i in dir(data) if i in obj and not i.startswith('_')]
+    def encoder(data, requires_decoding):
+        obj = dict()
+        for name in names:
+            value = getattr(data, name)
+            obj[name] = value if isinstance(value, PRIMITIVES) else encode(value, requires_decoding)
 
-    # Recurse through properties that are also registered data classes.
-    fields_dcls = [i for i in fields if type(getattr(data, i)) in DCLASS_SET]
-    for field in fields_dcls:
-        _encode_dclass(getattr(data, field), obj[field], requires_decoding)
+        # Inject typekey for subsequent roundtrip.
+        if requires_decoding:
+            obj['_type_key'] = type_key
 
-    # TODO: handle lists of dclasses
+        return obj
 
-    return encode(obj, requires_decoding)
+    return encoder
 
 
 def register_type(cls):
@@ -203,6 +220,9 @@ def register_type(cls):
     else:
         DCLASS_MAP[f"{cls.__module__}.{cls.__name__}"] = cls
         DCLASS_SET = DCLASS_SET | { cls, }
+        if dataclasses.is_dataclass(cls):
+            DCLASS_DECODERS[f"{cls.__module__}.{cls.__name__}"] = _get_dclass_decoder(cls)
+            DCLASS_ENCODERS[cls] = _get_dclass_encoder(cls)
 
 
 def initialise():
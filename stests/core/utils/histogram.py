@@ -0,0 +1,62 @@
+import typing
+
+
+
+# Number of significant bits retained per bucket - i.e. bucket width is < 1% of bucket value.
+_SIGNIFICANT_BITS = 8
+
+# Set of percentiles rendered by default.
+PERCENTILES = (50, 90, 99)
+
+
+def get_bucket(value: float) -> int:
+    """Returns HDR style log-linear bucket into which a value (in seconds) falls.
+
+    :param value: Value in seconds, e.g. a deploy finalisation duration.
+
+    :returns: Lower bound (in milliseconds) of bucket.
+
+    """
+    as_ms = max(0, int(value * 1000))
+    shift = max(0, as_ms.bit_length() - _SIGNIFICANT_BITS)
+
+    return (as_ms >> shift) << shift
+
+
+def get_count(buckets: typing.Dict[typing.Union[int, str], int]) -> int:
+    """Returns number of values recorded within a histogram.
+
+    :param buckets: Map: bucket lower bound (ms) -> count.
+
+    """
+    return sum(buckets.values())
+
+
+def get_percentiles(
+    buckets: typing.Dict[typing.Union[int, str], int],
+    percentiles: typing.Tuple[int] = PERCENTILES,
+    ) -> typing.Dict[int, typing.Optional[float]]:
+    """Returns percentiles computed over a histogram.
+
+    :param buckets: Map: bucket lower bound (ms) -> count.
+    :param percentiles: Percentiles to be computed, e.g. 50, 90, 99.
+
+    :returns: Map: percentile -> value in seconds (None if histogram is empty).
+
+    """
+    ordered = sorted((int(k), v) for k, v in buckets.items() if v > 0)
+    total = sum(v for _, v in ordered)
+    if total == 0:
+        return {i: None for i in percentiles}
+
+    result = dict()
+    for pct in percentiles:
+        threshold, seen = total * pct / 100, 0
+        for bucket, count in ordered:
+            seen += count
+            if seen >= threshold:
+                result[pct] = bucket / 1000
+                break
+
+    return result
+
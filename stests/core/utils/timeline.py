@@ -0,0 +1,32 @@
+import typing
+
+
+
+# Number of timeline slots per second, i.e. slot width is 100ms.
+SLOTS_PER_SECOND = 10
+
+
+def get_slot(timestamp: float) -> int:
+    """Returns timeline slot into which a moment in time falls.
+
+    :param timestamp: POSIX timestamp, e.g. a deploy dispatch timestamp.
+
+    :returns: Index of slot.
+
+    """
+    return int(timestamp * SLOTS_PER_SECOND)
+
+
+def get_rate(slots: typing.Dict[typing.Union[int, str], int]) -> typing.Optional[float]:
+    """Returns average rate (per second) at which events were recorded across a timeline.
+
+    :param slots: Map: slot index -> count.
+
+    :returns: Events per second (None if timeline is empty).
+
+    """
+    indexes = [int(k) for k, v in slots.items() if v > 0]
+    if not indexes:
+        return None
+
+    return sum(slots.values()) / ((max(indexes) - min(indexes) + 1) / SLOTS_PER_SECOND)
@@ -79,8 +79,11 @@ def do_transfer(
     dispatch_fn = TFR_TYPE_TO_TFR_FN[DeployType[transfer_type]]
     deploy_hash, dispatch_duration, dispatch_attempts = dispatch_fn(dispatch_info, cp2, amount)
 
+    # Update cache: step completion tracker - prior to deploy so that correlation cannot precede it.
+    cache.orchestration.set_step_tracker_deploy(ctx, deploy_hash)
+
     # Update cache: deploy.
-    cache.state.set_deploy(factory.create_deploy_for_run(
+    deploy = factory.create_deploy_for_run(
         ctx=ctx, 
         account=cp1,
         associated_account=cp2,
@@ -89,7 +92,11 @@ def do_transfer(
         dispatch_attempts=dispatch_attempts,
         dispatch_duration=dispatch_duration,
         typeof=DeployType[transfer_type]
-        ))
+        )
+    cache.state.set_deploy(deploy)
+
+    # Update cache: dispatch timelines.
+    cache.orchestration.increment_dispatch_timelines(deploy)
 
     # Update cache: account balances.
     if cp1.is_run_account:
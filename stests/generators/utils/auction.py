@@ -64,8 +64,11 @@ def _do_delegate_action(ctx: ExecutionContext, account_index: int, amount: int,
     dispatch_info = DeployDispatchInfo(user, network, node)
     deploy_hash, dispatch_duration, dispatch_attempts = dispatch_fn(dispatch_info, validator, amount)
 
+    # Update cache: step completion tracker - prior to deploy so that correlation cannot precede it.
+    cache.orchestration.set_step_tracker_deploy(ctx, deploy_hash)
+
     # Update cache: deploy.
-    cache.state.set_deploy(factory.create_deploy_for_run(
+    deploy = factory.create_deploy_for_run(
         ctx=ctx, 
         account=user,
         node=node, 
@@ -73,7 +76,11 @@ def _do_delegate_action(ctx: ExecutionContext, account_index: int, amount: int,
         dispatch_attempts=dispatch_attempts,
         dispatch_duration=dispatch_duration,
         typeof=deploy_type
-        ))
+        )
+    cache.state.set_deploy(deploy)
+
+    # Update cache: dispatch timelines.
+    cache.orchestration.increment_dispatch_timelines(deploy)
 
 
 def _get_account(ctx: ExecutionContext, network: Network, account_index: int) -> Account:
@@ -1,3 +1,7 @@
+import contextlib
+import threading
+import typing
+
 from stests import chain
 from stests.core import cache
 from stests.core.types.chain import Account
@@ -11,11 +15,36 @@ from stests.generators.utils.infra import get_network_node
 from stests.generators.utils.constants import ACC_RUN_USERS
 
 
+# Deploys decached in bulk ahead of verification - scoped to current thread.
+_PREFETCHED = threading.local()
+
+
+@contextlib.contextmanager
+def prefetch_deploys(ctx: ExecutionContext, deploy_hashes: typing.List[str]) -> typing.Iterator[typing.Dict[str, Deploy]]:
+    """Decaches a set of deploys in a single round-trip for use by deploy verifiers invoked within scope.
+
+    :param ctx: Execution context information.
+    :param deploy_hashes: Hashes of deploys to be verified.
+
+    :returns: Map: deploy hash -> cached deploy.
+
+    """
+    _PREFETCHED.deploys = cache.state.get_deploys_by_hash(ctx, deploy_hashes)
+    try:
+        yield _PREFETCHED.deploys
+    finally:
+        _PREFETCHED.deploys = None
+
+
 def verify_deploy(ctx: ExecutionContext, block_hash: str, deploy_hash: str, expected_status=DeployStatus.ADDED) -> Deploy:
     """Verifies that a deploy is in a finalized state.
     
     """
-    deploy = cache.state.get_deploy(ctx, deploy_hash)
+    prefetched = getattr(_PREFETCHED, "deploys", None)
+    if prefetched is not None:
+        deploy = prefetched.get(deploy_hash)
+    else:
+        deploy = cache.state.get_deploy(ctx, deploy_hash)
     assert deploy, f"deploy could not be retrieved: {deploy_hash}"
     assert deploy.status == expected_status, f"deploy status is not {expected_status.name}"
     assert deploy.block_hash == block_hash, f"deploy block hash mismatch : block-hash={block_hash}"
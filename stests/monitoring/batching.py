@@ -0,0 +1,97 @@
+import contextlib
+import threading
+import typing
+
+import dramatiq
+
+from stests.core.types.infra import NodeIdentifier
+from stests.core.types.orchestration import ExecutionContext
+from stests.core.utils import encoder
+from stests.core.utils.env import get_var
+
+
+
+# Environment variables required by this module.
+class EnvVars:
+    # Max. number of correlated deploys dispatched to orchestrator per message (1 = no batching).
+    BATCH_SIZE = get_var("MONITORING_FINALIZATION_BATCH_SIZE", 1, int)
+
+
+# Batches of correlated deploys pending dispatch - scoped to current thread.
+_SCOPE = threading.local()
+
+
+@contextlib.contextmanager
+def batch() -> typing.Iterator[None]:
+    """Groups deploys correlated within scope - e.g. those of a finalised block - per step & dispatches them upon exit.
+
+    N.B. batches are dispatched prior to the calling actor returning, thus are never held beyond its message.
+
+    """
+    if EnvVars.BATCH_SIZE <= 1 or getattr(_SCOPE, "batches", None) is not None:
+        yield
+        return
+
+    _SCOPE.batches = dict()
+    try:
+        yield
+    finally:
+        batches, _SCOPE.batches = _SCOPE.batches, None
+        for ctx, finalized in batches.values():
+            for i in range(0, len(finalized), EnvVars.BATCH_SIZE):
+                _dispatch_many(ctx, finalized[i:i + EnvVars.BATCH_SIZE])
+
+
+def enqueue(ctx: ExecutionContext, node_id: NodeIdentifier, block_hash: str, deploy_hash: str):
+    """Enqueues a correlated deploy for further processing by orchestrator.
+
+    N.B. within a batch scope deploys are grouped per step & dispatched upon exit, otherwise they are dispatched singly.
+
+    :param ctx: Execution context of run during which deploy was dispatched.
+    :param node_id: Identifier of node that emitted finalization event.
+    :param block_hash: Hash of a finalized block.
+    :param deploy_hash: Hash of a finalized deploy.
+
+    """
+    batches = getattr(_SCOPE, "batches", None)
+    if batches is None:
+        _dispatch_one(ctx, node_id, block_hash, deploy_hash)
+        return
+
+    key = (ctx.network, ctx.run_type, ctx.run_index, ctx.phase_index, ctx.step_index)
+    _, finalized = batches.setdefault(key, (ctx, []))
+    finalized.append((node_id, block_hash, deploy_hash))
+
+
+def _dispatch_one(ctx: ExecutionContext, node_id: NodeIdentifier, block_hash: str, deploy_hash: str):
+    """Dispatches a single correlated deploy to orchestrator.
+
+    """
+    dramatiq.get_broker().enqueue(dramatiq.Message(
+        queue_name="orchestration.engine.step",
+        actor_name="on_step_deploy_finalized",
+        args=([
+            encoder.encode(ctx),
+            encoder.encode(node_id),
+            block_hash,
+            deploy_hash
+            ]),
+        kwargs=dict(),
+        options=dict(),
+    ))
+
+
+def _dispatch_many(ctx: ExecutionContext, finalized: typing.List[typing.Tuple[NodeIdentifier, str, str]]):
+    """Dispatches a batch of correlated deploys to orchestrator.
+
+    """
+    dramatiq.get_broker().enqueue(dramatiq.Message(
+        queue_name="orchestration.engine.step",
+        actor_name="on_step_deploys_finalized",
+        args=([
+            encoder.encode(ctx),
+            [[encoder.encode(node_id), block_hash, deploy_hash] for node_id, block_hash, deploy_hash in finalized],
+            ]),
+        kwargs=dict(),
+        options=dict(),
+    ))
@@ -1,5 +1,6 @@
 import random
 import time
+import uuid
 
 import dramatiq
 from dramatiq.middleware import TimeLimitExceeded
@@ -8,6 +9,7 @@ from dramatiq.middleware import Shutdown
 from stests.core import cache
 from stests.core import factory
 from stests.core.logging import log_event
+from stests.core.types.infra import NetworkIdentifier
 from stests.core.types.infra import NodeIdentifier
 from stests.core.types.infra import NodeMonitoringLock
 from stests.core.utils.env import get_var
@@ -16,6 +18,15 @@ from stests.events import EventType
 
 
 
+# Environment variables required by this module.
+class EnvVars:
+    # Stream mode - MULTIPLEXED (one event loop per network) | PER_NODE (one actor per node).
+    STREAM_MODE = get_var("MONITORING_STREAM_MODE", "MULTIPLEXED")
+
+    # Number of monitoring shards launched per network in multiplexed mode.
+    SHARDS = get_var("MONITORING_SHARDS", 1, int)
+
+
 # Queue to which messages will be dispatched.
 _QUEUE = "monitoring.control"
 
@@ -25,8 +36,8 @@ _MONITORS_PER_NODE = 1
 # Time limit for node monitoring actor.
 _60_MINUTES_IN_MS = 3600000
 
-# Maximum number of nodes to monitor.
-_MAX_NODES = 5
+# Maximum number of nodes to monitor when each node ties up an actor.
+_MAX_NODES_PER_NODE_MODE = 5
 
 
 @dramatiq.actor(queue_name=_QUEUE)
@@ -36,13 +47,46 @@ def do_start_monitoring():
     """
     for network in cache.infra.get_networks():
         network_id = factory.create_network_id(network.name)
-        for node in cache.infra.get_nodes_for_monitoring(network, _MAX_NODES):
+        if EnvVars.STREAM_MODE == "MULTIPLEXED":
+            for _ in range(EnvVars.SHARDS):
+                do_monitor_shard.send(network_id)
+            continue
+
+        for node in cache.infra.get_nodes_for_monitoring(network, _MAX_NODES_PER_NODE_MODE):
             do_monitor_node.send(
                 factory.create_node_id(network_id, node.index),
                 )
             time.sleep(float(1))
 
 
+@dramatiq.actor(queue_name=_QUEUE, notify_shutdown=True, time_limit=_60_MINUTES_IN_MS)
+def do_monitor_shard(network_id: NetworkIdentifier, shard_id: str = None):
+    """Launches monitoring of those nodes within a network assigned to a shard by consistent hashing.
+
+    :network_id: Identifier of network to be monitored.
+    :shard_id: Identifier of monitoring shard - retained across actor recycling so that nodes are not rebalanced.
+
+    """
+    shard_id = shard_id or uuid.uuid4().hex[:12]
+
+    # Monitor nodes by listening to & processing node events.
+    try:
+        listener.bind_to_shard(network_id, shard_id)
+
+    # Exception: actor timeout.
+    except TimeLimitExceeded:
+        do_monitor_shard.send(network_id, shard_id)
+
+    # Exception: process shutdown - release nodes to other shards.
+    except Shutdown:
+        cache.monitoring.delete_shard_heartbeat(network_id.name, shard_id)
+
+    # Exception: unexpected event loop failure - per node stream errors are handled by stream client.
+    except Exception as err:
+        log_event(EventType.CORE_ACTOR_ERROR, err)
+        do_monitor_shard.send(network_id, shard_id)
+
+
 @dramatiq.actor(queue_name=_QUEUE, notify_shutdown=True, time_limit=_60_MINUTES_IN_MS)
 def do_monitor_node(node_id: NodeIdentifier):   
     """Launches node monitoring.
@@ -0,0 +1,182 @@
+from datetime import datetime
+
+from stests.core import cache
+from stests.core import factory
+from stests.core.logging import log_event
+from stests.core.types.chain import BlockStatus
+from stests.core.types.chain import DeployStatus
+from stests.core.types.infra import NodeEventInfo
+from stests.events import EventType
+from stests.monitoring import batching
+
+
+
+class Context():
+    """Contextual information passed along chain of execution whilst correlating finalised deploys.
+    
+    """
+    def __init__(self, info: NodeEventInfo):
+        self.block = None
+        self.block_hash = info.block_hash
+        self.deploy = None
+        self.deploy_hash = None
+        self.info = info
+        self.network_id = factory.create_network_id(info.network)
+        self.network = cache.infra.get_network(self.network_id)
+        self.node_id = factory.create_node_id(self.network_id, info.node_index)
+        self.node = cache.infra.get_node(self.node_id)
+        self.on_chain_block = None
+        self.on_chain_deploy = None
+    
+    @property
+    def deploy_hashes(self):
+        """Gets set of associated deploy hashes."""
+        try:
+            return self.on_chain_block['body']['deploy_hashes']
+        except (TypeError, KeyError):
+            return []            
+
+    @property
+    def deploy_execution_ctx(self):
+        """Returns workload generated execution context."""
+        ctx = cache.orchestration.get_context(
+            self.deploy.network,
+            self.deploy.run_index,
+            self.deploy.run_type,
+            )
+
+        # N.B. steps may execute concurrently thus deploy's step takes precedence over that of cached context.
+        if ctx is not None and self.deploy.step_index is not None:
+            ctx.phase_index = self.deploy.phase_index
+            ctx.step_index = self.deploy.step_index
+            ctx.step_label = self.deploy.step_label
+
+        return ctx
+
+    @property
+    def transfer_hashes(self):
+        """Gets set of associated transfer hashes."""
+        try:
+            return self.on_chain_block['body']['transfer_hashes']
+        except (TypeError, KeyError):
+            return []            
+
+
+def is_block_processed(info: NodeEventInfo) -> bool:
+    """Returns flag indicating whether finalised block event has already been processed.
+
+    :param info: Node event information.
+
+    :returns: Flag indicating whether block was previously processed.
+
+    """
+    _, encached = cache.monitoring.set_block(info)
+
+    return not encached
+
+
+def is_deploy_processed(ctx: Context) -> bool:
+    """Returns flag indicating whether finalised deploy event has already been processed.
+
+    :param ctx: Correlation context - deploy hash must be set.
+
+    :returns: Flag indicating whether deploy was previously processed.
+
+    """
+    _, encached = cache.monitoring.set_deploy(ctx.network.name, ctx.block_hash, ctx.deploy_hash)
+
+    return not encached
+
+
+def set_block_statistics(ctx: Context):
+    """Sets statistics pertaining to a finalised block.
+    
+    :param ctx: Correlation context - on-chain block must be set.
+
+    """
+    ctx.block = factory.create_block_statistics_on_addition(
+        block_hash = ctx.block_hash,
+        block_hash_parent = ctx.on_chain_block['header']['parent_hash'],
+        chain_name = ctx.network.chain_name,
+        era_id = ctx.on_chain_block['header']['era_id'],
+        deploy_cost_total = None,
+        deploy_count = len(ctx.deploy_hashes) + len(ctx.transfer_hashes),
+        deploy_gas_price_avg = None,
+        height = ctx.on_chain_block['header']['height'],
+        is_switch_block = ctx.on_chain_block['header']['era_end'] is not None,
+        network = ctx.network.name,
+        proposer = ctx.on_chain_block['body']['proposer'],      
+        size_bytes = None,
+        state_root_hash = ctx.on_chain_block['header']['state_root_hash'],
+        status = BlockStatus.FINALIZED.name,
+        timestamp = datetime.strptime(ctx.on_chain_block['header']['timestamp'], "%Y-%m-%dT%H:%M:%S.%fZ"),
+    )
+
+    # Emit event.
+    log_event(EventType.CHAIN_ADDED_BLOCK, f"{ctx.block_hash}", ctx.block)
+
+
+def process_deploy(ctx: Context):
+    """Processes a finalised deploy, enqueuing it for further processing by orchestrator if dispatched by a generator.
+    
+    :param ctx: Correlation context - block statistics, deploy hash & on-chain deploy must be set.
+
+    """
+    # Escape if deploy not found.
+    if ctx.on_chain_deploy is None:
+        log_event(EventType.CHAIN_QUERY_DEPLOY_NOT_FOUND, None, ctx.deploy_hash)
+        return
+
+    # Emit event.
+    log_event(EventType.CHAIN_ADDED_DEPLOY, f"{ctx.block_hash}.{ctx.deploy_hash}", ctx.info)
+
+    # Escape if deploy cannot be correlated to a workflow.
+    ctx.deploy = cache.state.get_deploy_on_finalisation(ctx.network.name, ctx.deploy_hash)
+    if not ctx.deploy:
+        return
+
+    # Process correlated - i.e. deploys previously dispatched by a generator.
+    _process_deploy_correlated(ctx)
+
+
+def _process_deploy_correlated(ctx: Context):
+    """Process a monitored deploy that was previously dispatched during a generator run.
+    
+    """
+    # Notify.
+    log_event(EventType.WFLOW_DEPLOY_CORRELATED, f"{ctx.block_hash}.{ctx.deploy_hash}", ctx.node, block_hash=ctx.block_hash, deploy_hash=ctx.deploy_hash)
+
+    # Update cache: deploy.
+    ctx.deploy.block_hash = ctx.block_hash
+    try:
+        ctx.deploy.deploy_cost = int(ctx.on_chain_deploy["execution_results"][0]["result"]["Success"]["cost"])
+    except KeyError:
+        try:
+            ctx.deploy.deploy_cost = int(ctx.on_chain_deploy["execution_results"][0]["result"]["cost"])
+        except KeyError:
+            ctx.deploy.deploy_cost = 0
+
+    ctx.deploy.era_id = ctx.block.era_id
+    ctx.deploy.finalization_duration = ctx.block.timestamp.timestamp() - ctx.deploy.dispatch_timestamp.timestamp()    
+    ctx.deploy.finalization_node_index = ctx.node.index
+    ctx.deploy.finalization_timestamp = ctx.block.timestamp
+    ctx.deploy.state_root_hash = ctx.block.state_root_hash
+    ctx.deploy.status = DeployStatus.ADDED
+    cache.state.set_deploy(ctx.deploy)
+
+    # Update cache: finalisation latency histograms.
+    cache.orchestration.increment_finalization_histograms(ctx.deploy)
+
+    # Update cache: account balance.
+    if ctx.deploy.deploy_cost > 0:
+        cache.state.decrement_account_balance_on_deploy_finalisation(ctx.deploy, ctx.deploy.deploy_cost)
+
+    # Enqueue message for processing by orchestrator.
+    _enqueue_correlated(ctx)
+
+
+def _enqueue_correlated(ctx: Context):
+    """Enqueues a correlated deploy for further processing by orchestrator.
+    
+    """
+    batching.enqueue(ctx.deploy_execution_ctx, ctx.node_id, ctx.block_hash, ctx.deploy_hash)
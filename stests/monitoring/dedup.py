@@ -0,0 +1,60 @@
+import threading
+import time
+import typing
+
+from stests.core.types.infra import NodeEventInfo
+
+
+
+# Interval (seconds) spanned by each generation of seen events.
+_WINDOW = 60.0
+
+# Maximum number of events held per generation - bounds memory under bursts.
+_WINDOW_SIZE = 100000
+
+# Set of event keys seen within current & previous generations.
+_current: typing.Set[tuple] = set()
+_previous: typing.Set[tuple] = set()
+
+# Timestamp at which current generation was opened.
+_current_ts: float = time.monotonic()
+
+# Guards access to generations across callback threads.
+_LOCK = threading.Lock()
+
+
+def is_duplicate(info: NodeEventInfo) -> bool:
+    """Returns flag indicating whether an equivalent event was recently seen by this process.
+
+    N.B. generations are exact sets rather than probabilistic filters so that a
+    first-seen event is never dropped; the cache remains the cross-process authority.
+
+    :param info: Node event information.
+
+    :returns: True if event was seen within the last one to two windows.
+
+    """
+    global _current, _previous, _current_ts
+
+    key = get_key(info)
+    with _LOCK:
+        now = time.monotonic()
+        if now - _current_ts >= _WINDOW or len(_current) >= _WINDOW_SIZE:
+            _previous, _current, _current_ts = _current, set(), now
+
+        if key in _current or key in _previous:
+            return True
+        _current.add(key)
+
+    return False
+
+
+def get_key(info: NodeEventInfo) -> tuple:
+    """Returns key by which equivalent events emitted by different nodes are identified.
+
+    :param info: Node event information.
+
+    :returns: Tuple of network, event type, block hash & deploy hash.
+
+    """
+    return info.network, info.event_type, info.block_hash, info.deploy_hash
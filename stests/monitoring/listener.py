@@ -1,39 +1,126 @@
+import threading
+import time
+import typing
+
 from stests import chain
 from stests.core import cache
 from stests.core.logging import log_event
+from stests.core.types.infra import NetworkIdentifier
 from stests.core.types.infra import Node
 from stests.core.types.infra import NodeEventInfo
+from stests.core.utils.env import get_var
+from stests.core.utils.exceptions import InvalidEnvironmentVariable
 from stests.events import EventType
+from stests.monitoring import dedup
+from stests.monitoring import sharding
 from stests.monitoring.on_consensus_finality_signature import on_consensus_finality_signature
+from stests.monitoring.on_deploy_processed import on_block_added
+from stests.monitoring.on_deploy_processed import on_deploy_processed
+
 
 
+# Environment variables required by this module.
+class EnvVars:
+    # Correlation mode - FINALITY_SIGNATURE (blocks & deploys queried upon finality) | DEPLOY_PROCESSED (event payloads joined).
+    CORRELATION_MODE = get_var("MONITORING_CORRELATION_MODE", "FINALITY_SIGNATURE")
+
+
+# Map: correlation mode -> event type -> actor.
+_ACTORS_BY_MODE = {
+    "FINALITY_SIGNATURE": {
+        EventType.MONIT_CONSENSUS_FINALITY_SIGNATURE: on_consensus_finality_signature,
+    },
+    "DEPLOY_PROCESSED": {
+        EventType.MONIT_BLOCK_ADDED: on_block_added,
+        EventType.MONIT_DEPLOY_PROCESSED: on_deploy_processed,
+    },
+}
 
 # Map: event type -> actor.
-_ACTORS = {
-    EventType.MONIT_CONSENSUS_FINALITY_SIGNATURE: on_consensus_finality_signature,
+try:
+    _ACTORS = _ACTORS_BY_MODE[EnvVars.CORRELATION_MODE]
+except KeyError:
+    raise InvalidEnvironmentVariable("MONITORING_CORRELATION_MODE", EnvVars.CORRELATION_MODE, _ACTORS_BY_MODE)
+
+# Map: event type -> function returning actor arguments drawn from event payload.
+_ACTOR_ARGS = {
+    EventType.MONIT_BLOCK_ADDED: lambda payload: (payload["BlockAdded"]["block"], ),
+    EventType.MONIT_DEPLOY_PROCESSED: lambda payload: (payload["DeployProcessed"]["execution_result"], ),
 }
 
+# Interval (seconds) between flushes of node event stream checkpoints.
+_CHECKPOINT_INTERVAL = 5.0
+
+# Map: (network, node index) -> latest event prior to which every event was processed, pending flush.
+_CHECKPOINTS = {}
+
+# Guards access to pending checkpoints across callback threads.
+_CHECKPOINTS_LOCK = threading.Lock()
+
+# Timestamp at which checkpoints were last flushed.
+_checkpoints_ts: float = 0.0
+
 
 def bind_to_stream(node: Node, event_id: int = 0):
     """Binds to a node's event stream.
 
     :node: Node being monitored.
-    :param event_id: Identifer of event from which to start stream.
-    
+    :param event_id: Identifer of event from which to start stream - defaults to that subsequent to last checkpoint.
+
     """
-    chain.stream_events(node, _on_node_event)
+    event_id = event_id or _get_resume_event_ids([node]).get(node.index, 0)
+    try:
+        chain.stream_events(node, _on_node_event, event_id)
+    finally:
+        _flush_checkpoints()
+
+
+def bind_to_shard(network_id: NetworkIdentifier, shard_id: str):
+    """Binds to event streams of those nodes assigned to a monitoring shard, multiplexed over a single event loop.
+
+    :param network_id: Identifier of network being monitored.
+    :param shard_id: Identifier of monitoring shard.
+
+    """
+    def _get_assigned_nodes():
+        cache.monitoring.set_shard_heartbeat(network_id.name, shard_id)
+        _flush_checkpoints()
+        nodes = sharding.get_assigned_nodes(
+            cache.infra.get_nodes_for_monitoring(network_id),
+            [i["shard_id"] for i in cache.monitoring.get_shard_heartbeats(network_id.name)],
+            shard_id,
+            )
+
+        return nodes, _get_resume_event_ids(nodes)
+
+    nodes, event_ids = _get_assigned_nodes()
+    try:
+        chain.stream_events_multiplexed(nodes, _process_node_event, event_ids, _get_assigned_nodes, _record_checkpoint)
+    finally:
+        _flush_checkpoints()
 
 
 def _on_node_event(node: Node, info: NodeEventInfo, payload: dict):
     """Event callback.
-    
+
+    """
+    _process_node_event(node, info, payload)
+    _set_checkpoint(info)
+
+
+def _process_node_event(node: Node, info: NodeEventInfo, payload: dict):
+    """Processes a node event.
+
     """
     # Escape if event not of interest.
     if info.event_type not in _ACTORS:
         return
 
     # Escape if event already processed - happens when monitoring multiple nodes.
+    # N.B. in-process filter absorbs most duplicates, cache lock arbitrates across processes.
     if info.event_id:
+        if dedup.is_duplicate(info):
+            return
         _, was_lock_acquired = cache.monitoring.set_node_event_info(info)
         if not was_lock_acquired:
             return
@@ -50,4 +137,63 @@ def _on_node_event(node: Node, info: NodeEventInfo, payload: dict):
 
     # Dispatch message to actor for further processing.
     actor = _ACTORS[info.event_type]
-    actor.send(info)
+    args = _ACTOR_ARGS[info.event_type](payload) if info.event_type in _ACTOR_ARGS else ()
+    actor.send(info, *args)
+
+
+def _get_resume_event_ids(nodes: typing.List[Node]) -> typing.Dict[int, int]:
+    """Returns map: node index -> identifier of event from which to resume stream.
+
+    """
+    event_ids = dict()
+    for network in {i.network for i in nodes}:
+        for checkpoint in cache.monitoring.get_node_event_checkpoints(network):
+            event_ids[checkpoint["node_index"]] = checkpoint["event_id"] + 1
+
+    return event_ids
+
+
+def _record_checkpoint(info: NodeEventInfo):
+    """Records an event - prior to which every event was processed - pending flush.
+
+    """
+    if not info.event_id:
+        return
+
+    key = (info.network, info.node_index)
+    with _CHECKPOINTS_LOCK:
+        if key not in _CHECKPOINTS or _CHECKPOINTS[key].event_id < info.event_id:
+            _CHECKPOINTS[key] = info
+
+
+def _set_checkpoint(info: NodeEventInfo):
+    """Records an event as processed, flushing pending checkpoints once interval has elapsed.
+
+    N.B. events streamed from a single node are processed in order.
+
+    """
+    global _checkpoints_ts
+
+    if not info.event_id:
+        return
+
+    _record_checkpoint(info)
+    with _CHECKPOINTS_LOCK:
+        now = time.monotonic()
+        if now - _checkpoints_ts < _CHECKPOINT_INTERVAL:
+            return
+        _checkpoints_ts = now
+
+    _flush_checkpoints()
+
+
+def _flush_checkpoints():
+    """Encaches pending checkpoints in a single round-trip.
+
+    """
+    with _CHECKPOINTS_LOCK:
+        checkpoints = list(_CHECKPOINTS.values())
+        _CHECKPOINTS.clear()
+
+    if checkpoints:
+        cache.monitoring.set_node_event_checkpoints(checkpoints)
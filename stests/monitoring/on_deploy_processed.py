@@ -0,0 +1,84 @@
+import dramatiq
+
+from stests.core import cache
+from stests.core.logging import log_event
+from stests.core.types.infra import NodeEventInfo
+from stests.events import EventType
+from stests.monitoring import batching
+from stests.monitoring import correlation
+
+
+
+# Queue to which messages will be dispatched.
+_QUEUE = "monitoring.events.deploy.processed"
+
+
+@dramatiq.actor(queue_name=_QUEUE)
+def on_block_added(info: NodeEventInfo, on_chain_block: dict):
+    """Event: raised whenever a block is added, i.e. finalised & executed, by a node.
+
+    N.B. correlates deploys whose processing was observed prior to block addition.
+
+    :param info: Node event information.
+    :param on_chain_block: Block carried by event.
+
+    """
+    if correlation.is_block_processed(info):
+        return
+
+    ctx = correlation.Context(info)
+    ctx.on_chain_block = on_chain_block
+
+    # Escape if block empty.
+    if not ctx.deploy_hashes and not ctx.transfer_hashes:
+        log_event(EventType.CHAIN_ADDED_BLOCK_EMPTY, None, ctx.block_hash)
+        return
+
+    # Set stats - thereby confirming finality to deploys processed subsequently.
+    correlation.set_block_statistics(ctx)
+    cache.monitoring.set_block_added(ctx.block)
+
+    # Process deploys + transfers processed prior to block addition.
+    with batching.batch():
+        for processed in cache.monitoring.get_deploys_processed(ctx.network.name, ctx.block_hash):
+            _process_deploy_on_finality(ctx, processed["deploy_hash"], processed["execution_result"])
+
+
+@dramatiq.actor(queue_name=_QUEUE)
+def on_deploy_processed(info: NodeEventInfo, execution_result: dict):
+    """Event: raised whenever a deploy is processed, i.e. executed within a block, by a node.
+
+    N.B. deploys processed prior to block addition are correlated upon block addition.
+
+    :param info: Node event information.
+    :param execution_result: Execution result carried by event, i.e. cost plus success | failure.
+
+    """
+    cache.monitoring.set_deploy_processed(info, execution_result)
+
+    # Escape if block addition not yet observed.
+    block = cache.monitoring.get_block_added(info.network, info.block_hash)
+    if block is None:
+        return
+
+    ctx = correlation.Context(info)
+    ctx.block = block
+    _process_deploy_on_finality(ctx, info.deploy_hash, execution_result)
+
+
+def _process_deploy_on_finality(ctx: correlation.Context, deploy_hash: str, execution_result: dict):
+    """Processes a deploy whose processing & block addition have both been observed.
+
+    """
+    ctx.deploy_hash = deploy_hash
+    if correlation.is_deploy_processed(ctx):
+        return
+
+    # N.B. event payload mirrors that returned by a node's deploy query - thus no query is required.
+    ctx.on_chain_deploy = {
+        "execution_results": [{
+            "block_hash": ctx.block_hash,
+            "result": execution_result,
+        }]
+    }
+    correlation.process_deploy(ctx)
@@ -0,0 +1,67 @@
+import bisect
+import hashlib
+import typing
+
+from stests.core.types.infra import Node
+
+
+
+# Number of points placed upon hash ring per shard - smooths distribution of nodes.
+_VIRTUAL_NODES = 64
+
+
+class HashRing():
+    """Consistent hash ring mapping monitored nodes to monitoring shards.
+
+    """
+
+    def __init__(self, shard_ids: typing.List[str]):
+        """Constructor.
+
+        :param shard_ids: Identifiers of live monitoring shards.
+
+        """
+        self._points = sorted(
+            (_get_hash(f"{shard_id}:{i}"), shard_id)
+            for shard_id in set(shard_ids)
+            for i in range(_VIRTUAL_NODES)
+            )
+        self._hashes = [i[0] for i in self._points]
+
+
+    def get_shard_id(self, key: str) -> typing.Optional[str]:
+        """Returns identifier of shard to which a key is assigned.
+
+        :param key: Key being assigned, e.g. a node label.
+
+        :returns: Identifier of shard to which key is assigned.
+
+        """
+        if not self._points:
+            return None
+
+        idx = bisect.bisect(self._hashes, _get_hash(key)) % len(self._points)
+
+        return self._points[idx][1]
+
+
+def get_assigned_nodes(nodes: typing.List[Node], shard_ids: typing.List[str], shard_id: str) -> typing.List[Node]:
+    """Returns subset of nodes assigned to a monitoring shard.
+
+    :param nodes: Nodes to be monitored.
+    :param shard_ids: Identifiers of live monitoring shards.
+    :param shard_id: Identifier of shard whose nodes are being returned.
+
+    :returns: Nodes to be monitored by shard.
+
+    """
+    ring = HashRing(shard_ids)
+
+    return [i for i in nodes if ring.get_shard_id(f"{i.network}:{i.index}") == shard_id]
+
+
+def _get_hash(key: str) -> int:
+    """Returns position of a key upon hash ring.
+
+    """
+    return int.from_bytes(hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest(), "big")
@@ -0,0 +1,170 @@
+import hashlib
+
+import ecdsa
+import pytest
+from cryptography.exceptions import InvalidSignature
+from cryptography.hazmat.primitives.asymmetric import ed25519
+
+from stests.chain import deploy
+from stests.chain import serialisation
+from stests.chain.utils import DeployDispatchInfo
+from stests.core import crypto
+from stests.core import factory
+from stests.core.types.chain import AccountType
+from stests.core.types.infra import NodeGroup
+from stests.core.types.infra import NodeType
+
+
+
+# Golden vector: moment (ms) at which deploy is created, i.e. 2021-01-01T00:00:00.123Z.
+_GOLDEN_TIMESTAMP = 1609459200123
+
+# Golden vector: dispatcher key pairs (private key, public key).
+_GOLDEN_KEYS = {
+    crypto.KeyAlgorithm.ED25519: (
+        "11" * 32,
+        "d04ab232742bb4ab3a1368bd4615e4e6d0224ab71a016baf8520a332c9778737",
+    ),
+    crypto.KeyAlgorithm.SECP256K1: (
+        "22" * 32,
+        "02466d7fcae563e5cb09a0d1870bb580344804617879a14949cf22285f1bae3f27",
+    ),
+}
+
+# Golden vector: transfer target account hash.
+_GOLDEN_TARGET = "4dd6685334b0ff4b12677d60950e193f62569169e40fa5b23dd85f624d0596b2"
+
+# Golden vector: serialised payment (module bytes, amount = 1e11) + session (transfer, amount = 1e9, id = 1).
+_GOLDEN_BODY = bytes.fromhex(
+    "00" "00000000" "01000000"
+        "06000000" "616d6f756e74" "06000000" "0500e8764817" "08"
+    "05" "03000000"
+        "06000000" "616d6f756e74" "05000000" "0400ca9a3b" "08"
+        "06000000" "746172676574" "20000000" f"{_GOLDEN_TARGET}" "0f" "20000000"
+        "02000000" "6964" "09000000" "01" "0100000000000000" "0d" "05"
+    )
+
+# Golden vector: deploy body hash.
+_GOLDEN_BODY_HASH = "211e058f7ca797f9478a978a2e2fbba770852f6a48d7578cc018a8da2348b025"
+
+# Golden vector: deploy hashes.
+_GOLDEN_HASHES = {
+    crypto.KeyAlgorithm.ED25519: "5a4b8a80c13868dafa19eade974c2a222048d282e0bd0d13e0e9c95ed0ec464d",
+    crypto.KeyAlgorithm.SECP256K1: "9dc2a7b6f7acbb917e1c2260765b615d1e9b537623bf858e4567a501a31ddf60",
+}
+
+
+def _get_dispatch_info(key_algo: crypto.KeyAlgorithm, private_key: str = None, public_key: str = None) -> DeployDispatchInfo:
+    network = factory.create_network("lrt1", "casper-lrt1")
+    node = factory.create_node(
+        NodeGroup.UNKNOWN, "localhost", 1, factory.create_network_id("lrt1"), 8888, 7777, 9999, NodeType.VALIDATOR
+        )
+    dispatcher = factory.create_account(
+        "lrt1", AccountType.NETWORK_FAUCET, key_algo=key_algo, private_key=private_key, public_key=public_key
+        )
+
+    return DeployDispatchInfo(dispatcher, network, node)
+
+
+def test_01():
+    """Test serialisation: u512."""
+    assert serialisation.to_u512(0) == bytes.fromhex("00")
+    assert serialisation.to_u512(100) == bytes.fromhex("0164")
+    assert serialisation.to_u512(int(1e11)) == bytes.fromhex("0500e8764817")
+
+
+def test_02():
+    """Test function: deploy.get_ttl_ms."""
+    assert deploy.get_ttl_ms("3600000ms") == 3600000
+    assert deploy.get_ttl_ms("1h") == 3600000
+    with pytest.raises(ValueError):
+        deploy.get_ttl_ms("1 fortnight")
+
+
+@pytest.mark.parametrize("key_algo", list(crypto.KeyAlgorithm))
+def test_03(key_algo):
+    """Test function: deploy.create_transfer."""
+    info = _get_dispatch_info(key_algo)
+    cp2 = factory.create_account("lrt1", AccountType.NETWORK_FAUCET, index=2)
+
+    as_json = deploy.create_transfer(info, int(1e9), cp2, 1)
+    assert len(as_json["hash"]) == 64
+    assert as_json["header"]["account"] == info.dispatcher.account_key
+    assert as_json["header"]["chain_name"] == "casper-lrt1"
+    assert as_json["approvals"][0]["signature"][:2] == info.dispatcher.account_key[:2]
+    assert as_json["session"]["Transfer"]["args"][0][1]["parsed"] == str(int(1e9))
+
+
+def test_04(tmp_path, monkeypatch):
+    """Test function: deploy.create_module_bytes."""
+    (tmp_path / "test.wasm").write_bytes(b"\x00asm")
+    monkeypatch.setenv("CSPR_BIN", str(tmp_path))
+    info = _get_dispatch_info(crypto.KeyAlgorithm.ED25519)
+    cp2 = factory.create_account("lrt1", AccountType.NETWORK_FAUCET, index=2)
+
+    as_json = deploy.create_module_bytes(info, "test.wasm", [
+        ("amount", serialisation.cl_u512(int(1e9))),
+        ("target", serialisation.cl_account_hash(cp2.account_hash)),
+    ])
+    assert as_json["session"]["ModuleBytes"]["module_bytes"] == "0061736d"
+
+    (tmp_path / "test.wasm").unlink()
+    assert deploy.get_module_bytes(info.network, "test.wasm") == b"\x00asm"
+
+
+def _get_golden_transfer(monkeypatch, key_algo: crypto.KeyAlgorithm) -> dict:
+    monkeypatch.setattr(deploy.time, "time", lambda: _GOLDEN_TIMESTAMP / 1000)
+    info = _get_dispatch_info(key_algo, *_GOLDEN_KEYS[key_algo])
+    cp2 = factory.create_account("lrt1", AccountType.NETWORK_FAUCET, index=2)
+    cp2.account_hash = _GOLDEN_TARGET
+
+    return deploy.create_transfer(info, int(1e9), cp2, 1)
+
+
+def _is_signature_valid(key_algo: crypto.KeyAlgorithm, signature: bytes, msg: bytes) -> bool:
+    public_key = bytes.fromhex(_GOLDEN_KEYS[key_algo][1])
+    try:
+        if key_algo == crypto.KeyAlgorithm.ED25519:
+            ed25519.Ed25519PublicKey.from_public_bytes(public_key).verify(signature, msg)
+        else:
+            ecdsa.VerifyingKey.from_string(public_key, curve=ecdsa.SECP256k1).verify(signature, msg, hashfunc=hashlib.sha256)
+    except (InvalidSignature, ecdsa.BadSignatureError):
+        return False
+
+    return True
+
+
+@pytest.mark.parametrize("key_algo", list(crypto.KeyAlgorithm))
+def test_05(monkeypatch, key_algo):
+    """Test function: deploy.create_transfer - golden vector: body & header bytes."""
+    as_json = _get_golden_transfer(monkeypatch, key_algo)
+    account_key = as_json["header"]["account"]
+    header = bytes.fromhex(
+        f"{account_key}"
+        "7b703ebb76010000"
+        "80ee360000000000"
+        "0a00000000000000"
+        f"{_GOLDEN_BODY_HASH}"
+        "00000000"
+        "0b000000" "6361737065722d6c727431"
+        )
+    assert account_key == crypto.get_account_key(key_algo, _GOLDEN_KEYS[key_algo][1])
+    assert hashlib.blake2b(_GOLDEN_BODY, digest_size=32).hexdigest() == _GOLDEN_BODY_HASH
+    assert as_json["header"]["body_hash"] == _GOLDEN_BODY_HASH
+    assert as_json["header"]["timestamp"] == "2021-01-01T00:00:00.123Z"
+    assert hashlib.blake2b(header, digest_size=32).hexdigest() == _GOLDEN_HASHES[key_algo]
+    assert as_json["hash"] == _GOLDEN_HASHES[key_algo]
+
+
+@pytest.mark.parametrize("key_algo", list(crypto.KeyAlgorithm))
+def test_06(monkeypatch, key_algo):
+    """Test function: deploy.create_transfer - golden vector: approval signature verifies against deploy hash."""
+    as_json = _get_golden_transfer(monkeypatch, key_algo)
+    approval = as_json["approvals"][0]
+    assert approval["signer"] == as_json["header"]["account"]
+    assert approval["signature"][:2] == approval["signer"][:2]
+
+    signature = bytes.fromhex(approval["signature"][2:])
+    deploy_hash = bytes.fromhex(_GOLDEN_HASHES[key_algo])
+    assert _is_signature_valid(key_algo, signature, deploy_hash)
+    assert not _is_signature_valid(key_algo, signature, deploy_hash[::-1])
@@ -0,0 +1,27 @@
+import time
+
+from stests.chain import query_cache
+
+
+
+def test_01():
+    """Test chain query results are fetched once whilst unexpired."""
+    fetched = []
+    fetch = lambda: fetched.append(1) or {"hash": "aa"}
+    assert query_cache.get_or_fetch(("lrt1", "block", "aa"), fetch) == {"hash": "aa"}
+    assert query_cache.get_or_fetch(("lrt1", "block", "aa"), fetch) == {"hash": "aa"}
+    assert len(fetched) == 1
+
+    expiry, result = query_cache._RESULTS[("lrt1", "block", "aa")]
+    query_cache._RESULTS[("lrt1", "block", "aa")] = (time.monotonic() - 1, result)
+    query_cache.get_or_fetch(("lrt1", "block", "aa"), fetch)
+    assert len(fetched) == 2
+
+
+def test_02():
+    """Test mutable chain query results are not cached."""
+    fetched = []
+    fetch = lambda: fetched.append(1) or {"execution_results": []}
+    for _ in range(2):
+        query_cache.get_or_fetch(("lrt1", "deploy", "bb"), fetch, lambda i: bool(i["execution_results"]))
+    assert len(fetched) == 2
@@ -0,0 +1,181 @@
+import collections
+
+import pytest
+import requests
+
+from stests import chain
+from stests.chain import query_cache
+from stests.chain import rpc
+from stests.core import factory
+from stests.core.types.chain import AccountType
+from stests.core.types.infra import NodeGroup
+from stests.core.types.infra import NodeType
+from stests.core.utils.exceptions import InvalidEnvironmentVariable
+
+
+
+# Canned node responses: JSON-RPC method -> result.
+_RESULTS = {
+    "chain_get_block": {"api_version": "1.0.0", "block": {"hash": "aa", "header": {"height": 1}}},
+    "chain_get_state_root_hash": {"api_version": "1.0.0", "state_root_hash": "bb"},
+    "info_get_deploy": {"api_version": "1.0.0", "deploy": {"hash": "cc"}, "execution_results": []},
+    "info_get_peers": {"api_version": "1.0.0", "peers": []},
+    "state_get_auction_info": {"api_version": "1.0.0", "auction_state": {"bids": []}},
+    "state_get_balance": {"api_version": "1.0.0", "balance_value": "1000000000"},
+    "state_get_item": {"api_version": "1.0.0", "stored_value": {"Account": {}}},
+}
+
+
+class _Response():
+    """Mimics a requests response returned by a node."""
+
+    def __init__(self, payload: dict, status_code: int = 200):
+        self.payload = payload
+        self.status_code = status_code
+
+    def json(self):
+        return self.payload
+
+    def raise_for_status(self):
+        if self.status_code != 200:
+            raise requests.HTTPError(f"{self.status_code} Server Error")
+
+
+class _Session():
+    """Mimics a pooled http session bound to a node returning canned responses."""
+
+    def __init__(self):
+        self.errors = dict()
+        self.requests = []
+        self.status_code = 200
+
+    def post(self, url, json, timeout):
+        self.requests.append((url, json))
+        if json["method"] in self.errors:
+            return _Response({"jsonrpc": "2.0", "id": json["id"], "error": self.errors[json["method"]]})
+
+        return _Response({"jsonrpc": "2.0", "id": json["id"], "result": _RESULTS[json["method"]]}, self.status_code)
+
+
+@pytest.fixture
+def session(monkeypatch) -> _Session:
+    """Returns stub session through which JSON-RPC requests are posted."""
+    session = _Session()
+    monkeypatch.setattr(rpc, "get_session", lambda: session)
+    monkeypatch.setattr(rpc.EnvVars, "CLIENT_TYPE", "RPC")
+    monkeypatch.setattr(query_cache, "_RESULTS", collections.OrderedDict())
+
+    return session
+
+
+def _get_network_and_node():
+    network = factory.create_network("lrt1", "casper-lrt1")
+    node = factory.create_node(
+        NodeGroup.UNKNOWN, "localhost", 1, factory.create_network_id("lrt1"), 8888, 7777, 9999, NodeType.VALIDATOR
+        )
+
+    return network, node
+
+
+def test_01(session):
+    """Test function: rpc.invoke - request payload & result."""
+    _, node = _get_network_and_node()
+    assert rpc.invoke(node, "chain_get_state_root_hash") == _RESULTS["chain_get_state_root_hash"]
+    rpc.invoke(node, "chain_get_block", {"block_identifier": {"Hash": "aa"}})
+
+    (url, first), (_, second) = session.requests
+    assert url == node.url_rpc
+    assert first["jsonrpc"] == "2.0"
+    assert "params" not in first
+    assert second["params"] == {"block_identifier": {"Hash": "aa"}}
+    assert second["id"] > first["id"]
+
+
+def test_02(session):
+    """Test function: rpc.invoke - node errors."""
+    _, node = _get_network_and_node()
+    session.errors["state_get_item"] = {"code": -32003, "message": "state query failed"}
+    with pytest.raises(rpc.RPC_Exception) as err:
+        rpc.invoke(node, "state_get_item", {})
+    assert err.value.method == "state_get_item"
+    assert err.value.err["code"] == -32003
+
+    session.status_code = 503
+    with pytest.raises(requests.HTTPError):
+        rpc.invoke(node, "info_get_peers")
+
+
+def test_03(monkeypatch):
+    """Test function: rpc.get_session - a single session is reused per process."""
+    monkeypatch.setattr(rpc, "_SESSIONS", dict())
+    session = rpc.get_session()
+    assert rpc.get_session() is session
+    assert session.get_adapter("http://localhost:7777")._pool_maxsize == rpc.EnvVars.POOL_SIZE
+
+    # Forked process.
+    monkeypatch.setattr(rpc.os, "getpid", lambda: -1)
+    assert rpc.get_session() is not session
+
+
+def test_04(monkeypatch):
+    """Test function: rpc.is_cli_client."""
+    monkeypatch.setattr(rpc.EnvVars, "CLIENT_TYPE", "RPC")
+    assert rpc.is_cli_client() is False
+    monkeypatch.setattr(rpc.EnvVars, "CLIENT_TYPE", "CLI")
+    assert rpc.is_cli_client() is True
+    monkeypatch.setattr(rpc.EnvVars, "CLIENT_TYPE", "GRPC")
+    with pytest.raises(InvalidEnvironmentVariable):
+        rpc.is_cli_client()
+
+
+def test_05(session):
+    """Test chain queries parse node results."""
+    network, node = _get_network_and_node()
+    assert chain.get_state_root_hash(network, node) == "bb"
+    assert chain.get_block(network, node, "aa") == {"hash": "aa", "header": {"height": 1}}
+    assert chain.get_block(network, node) == {"hash": "aa", "header": {"height": 1}}
+    assert chain.get_deploy(network, node, "cc") == _RESULTS["info_get_deploy"]
+    assert chain.get_account_balance(network, node, "uref-dd-007", "bb") == int(1e9)
+    assert chain.get_auction_info(network, node) == _RESULTS["state_get_auction_info"]
+    assert chain.get_node_peers(network, node) == _RESULTS["info_get_peers"]
+
+    methods = [i["method"] for _, i in session.requests]
+    assert methods == [
+        "chain_get_state_root_hash",
+        "chain_get_block",
+        "chain_get_block",
+        "info_get_deploy",
+        "state_get_balance",
+        "state_get_auction_info",
+        "info_get_peers",
+    ]
+    assert session.requests[1][1]["params"] == {"block_identifier": {"Hash": "aa"}}
+    assert "params" not in session.requests[2][1]
+
+
+def test_06(session):
+    """Test chain queries: immutable results are cached, pending deploys & failed balance queries are not."""
+    network, node = _get_network_and_node()
+    chain.get_block(network, node, "aa")
+    chain.get_block(network, node, "aa")
+    chain.get_deploy(network, node, "cc")
+    chain.get_deploy(network, node, "cc")
+    assert [i["method"] for _, i in session.requests] == ["chain_get_block", "info_get_deploy", "info_get_deploy"]
+
+    session.errors["state_get_balance"] = {"code": -32001, "message": "purse not found"}
+    assert chain.get_account_balance(network, node, "uref-dd-007", "bb") is None
+
+
+def test_07(session):
+    """Test chain query: account - key derived from account key & state root hash pulled from node."""
+    network, node = _get_network_and_node()
+    account = factory.create_account("lrt1", AccountType.NETWORK_FAUCET)
+
+    assert chain.get_account(network, node, account.account_key) == _RESULTS["state_get_item"]
+    (_, srh), (_, query) = session.requests
+    assert srh["method"] == "chain_get_state_root_hash"
+    assert query["params"] == {
+        "state_root_hash": "bb",
+        "key": f"account-hash-{account.account_hash}",
+        "path": [],
+    }
@@ -0,0 +1,205 @@
+import asyncio
+import concurrent.futures
+import json
+import threading
+import types
+
+from stests.chain import rpc
+from stests.chain.stream_events_multiplexed import EnvVars
+from stests.chain.stream_events_multiplexed import EventStreamParser
+from stests.chain.stream_events_multiplexed import EventWatermark
+from stests.chain.stream_events_multiplexed import _stream_node
+from stests.chain.stream_events_multiplexed import _yield_events
+from stests.chain.stream_events_replay import ReplayServer
+from stests.core import factory
+from stests.core.types.infra import NodeGroup
+from stests.core.types.infra import NodeType
+from stests.events import EventType
+
+
+
+# Raw event stream as emitted by a node.
+_STREAM = \
+    b'data:{"ApiVersion":"1.0.0"}\n\n' + \
+    b':keep alive\n\n' + \
+    b'data:{"BlockAdded":{"block_hash":"aa"}}\nid:1\n\n' + \
+    b'data:{"DeployProcessed":{"block_hash":"aa","deploy_hash":"bb"}}\r\nid:2\r\n\r\n'
+
+
+def _get_node(port):
+    return factory.create_node(
+        NodeGroup.UNKNOWN, "127.0.0.1", 1, factory.create_network_id("lrt1"), port, port, port, NodeType.VALIDATOR
+        )
+
+
+def _get_events(chunks):
+    parser = EventStreamParser()
+
+    return [i for chunk in chunks for i in parser.feed(chunk)]
+
+
+def test_01():
+    """Test incremental event stream parsing irrespective of chunk boundaries."""
+    expected = _get_events([_STREAM])
+    assert [i[0] for i in expected] == [None, "1", "2"]
+    assert json.loads(expected[2][1])["DeployProcessed"]["deploy_hash"] == "bb"
+    assert _get_events([bytes([i]) for i in _STREAM]) == expected
+    assert _get_events([_STREAM[:30], _STREAM[30:71], _STREAM[71:]]) == expected
+
+
+def test_02():
+    """Test multiplexed streaming from a chunked http response."""
+    async def _serve(reader, writer):
+        await reader.readuntil(b"\r\n\r\n")
+        writer.write(b"HTTP/1.1 200 OK\r\nContent-Type: text/event-stream\r\nTransfer-Encoding: chunked\r\n\r\n")
+        for chunk in (_STREAM[:50], _STREAM[50:]):
+            writer.write(f"{len(chunk):x}\r\n".encode() + chunk + b"\r\n")
+            await writer.drain()
+        writer.write(b"0\r\n\r\n")
+        writer.close()
+
+    async def _stream():
+        server = await asyncio.start_server(_serve, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        node = factory.create_node(
+            NodeGroup.UNKNOWN, "127.0.0.1", 1, factory.create_network_id("lrt1"), 8888, 7777, port, NodeType.VALIDATOR
+            )
+        async with server:
+            return [i async for i in _yield_events(node, 0)]
+
+    events = asyncio.run(_stream())
+    assert [(i[0], i[1], i[3], i[4]) for i in events] == [
+        (EventType.MONIT_BLOCK_ADDED, 1, "aa", None),
+        (EventType.MONIT_DEPLOY_PROCESSED, 2, "aa", "bb"),
+    ]
+
+
+def test_03():
+    """Test replay of a recorded event stream & recorded JSON-RPC queries."""
+    events = [
+        {"offset": 0.0, "id": 1, "data": {"BlockAdded": {"block_hash": "aa", "block": {"hash": "aa"}}}},
+        {"offset": 0.1, "id": 2, "data": {"DeployProcessed": {"block_hash": "aa", "deploy_hash": "bb"}}},
+    ]
+    server = ReplayServer(events, speed=0)
+    node = _get_node(server.start())
+
+    async def _stream(event_id):
+        return [i async for i in _yield_events(node, event_id)]
+
+    try:
+        assert [i[1] for i in asyncio.run(_stream(0))] == [1, 2]
+        assert [i[1] for i in asyncio.run(_stream(2))] == [2]
+        assert rpc.invoke(node, "chain_get_block", {"block_identifier": {"Hash": "aa"}}) == {"block": {"hash": "aa"}}
+        assert rpc.invoke(node, "info_get_deploy", {"deploy_hash": "bb"})["execution_results"][0]["block_hash"] == "aa"
+    finally:
+        server.stop()
+
+
+def test_04():
+    """Test idle event stream raises a timeout error rather than hanging."""
+    async def _serve(reader, writer):
+        await reader.readuntil(b"\r\n\r\n")
+        writer.write(b"HTTP/1.1 200 OK\r\nContent-Type: text/event-stream\r\n\r\n" + _STREAM)
+        await writer.drain()
+        await asyncio.sleep(5)
+
+    async def _stream():
+        server = await asyncio.start_server(_serve, "127.0.0.1", 0)
+        events = []
+        async with server:
+            try:
+                async for event in _yield_events(_get_node(server.sockets[0].getsockname()[1]), 0):
+                    events.append(event)
+            except asyncio.TimeoutError:
+                return events
+
+    read_timeout = EnvVars.READ_TIMEOUT
+    EnvVars.READ_TIMEOUT = 0.2
+    try:
+        assert [i[1] for i in asyncio.run(_stream())] == [1, 2]
+    finally:
+        EnvVars.READ_TIMEOUT = read_timeout
+
+
+def test_05():
+    """Test stream reads pause whilst callback backlog is full."""
+    stream = b"".join(f'data:{{"BlockAdded":{{"block_hash":"{i}"}}}}\nid:{i}\n\n'.encode() for i in range(1, 11))
+    released = threading.Event()
+    invoked = []
+
+    def _callback(node, info, payload):
+        invoked.append(info.event_id)
+        released.wait()
+
+    async def _serve(reader, writer):
+        await reader.readuntil(b"\r\n\r\n")
+        writer.write(b"HTTP/1.1 200 OK\r\nContent-Type: text/event-stream\r\n\r\n" + stream)
+        await writer.drain()
+        await asyncio.sleep(5)
+
+    async def _stream():
+        server = await asyncio.start_server(_serve, "127.0.0.1", 0)
+        node = _get_node(server.sockets[0].getsockname()[1])
+        with concurrent.futures.ThreadPoolExecutor(8) as executor:
+            async with server:
+                task = asyncio.ensure_future(_stream_node(node, _callback, 0, executor, asyncio.Semaphore(2)))
+                await asyncio.sleep(0.3)
+                backlogged = list(invoked)
+                released.set()
+                await asyncio.sleep(0.3)
+                task.cancel()
+
+        return backlogged
+
+    assert len(asyncio.run(_stream())) == 2
+    assert sorted(invoked) == list(range(1, 11))
+
+
+def test_06():
+    """Test stream watermark advances over contiguously processed events only & stalls upon failure."""
+    async def _track():
+        marks = []
+        watermark = EventWatermark(lambda info: marks.append(info.event_id))
+        futures = [asyncio.get_running_loop().create_future() for _ in range(5)]
+        for event_id, future in enumerate(futures, 1):
+            watermark.on_dispatched(types.SimpleNamespace(event_id=event_id), future)
+
+        for idx, is_processed in ((1, True), (0, True), (3, True), (2, False), (4, True)):
+            futures[idx].set_result(is_processed)
+            await asyncio.sleep(0)
+
+        return marks, watermark.failed.event_id
+
+    assert asyncio.run(_track()) == ([2], 3)
+
+
+def test_07():
+    """Test stream resumes from a failed event under a fresh watermark such that checkpointing continues."""
+    events = [{"offset": i / 20, "id": i, "data": {"BlockAdded": {"block_hash": str(i)}}} for i in range(1, 6)]
+    server = ReplayServer(events, speed=1)
+    node = _get_node(server.start())
+    invoked, marks = [], []
+
+    def _callback(node, info, payload):
+        invoked.append(info.event_id)
+        if invoked.count(2) == 1 and info.event_id == 2:
+            raise IOError("transient error")
+
+    async def _stream():
+        with concurrent.futures.ThreadPoolExecutor(1) as executor:
+            task = asyncio.ensure_future(
+                _stream_node(node, _callback, 0, executor, asyncio.Semaphore(8), lambda info: marks.append(info.event_id))
+                )
+            await asyncio.sleep(1.6)
+            task.cancel()
+
+    try:
+        asyncio.run(_stream())
+    finally:
+        server.stop()
+
+    assert invoked.count(2) == 2
+    assert set(invoked) == {1, 2, 3, 4, 5}
+    assert marks[0] == 1
+    assert marks[-1] == 5
+    assert sorted(marks) == marks
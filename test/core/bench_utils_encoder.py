@@ -0,0 +1,36 @@
+import timeit
+
+from stests.core import types
+from stests.core.utils import encoder
+from test.core import utils_factory as factory
+
+
+
+# Number of round-trips per timing sample.
+ITERATIONS = 10000
+
+# Set of types over which round-trips are timed.
+TYPES = (
+    types.orchestration.ExecutionContext,
+    types.chain.Deploy,
+    types.infra.NodeEventInfo,
+)
+
+
+def main():
+    """Entry point - renders mean encode/decode round-trip time per type.
+    
+    """
+    for typeof in TYPES:
+        instance = factory.get_instance(typeof)
+        elapsed = min(timeit.repeat(
+            lambda: encoder.decode(encoder.encode(instance)),
+            number=ITERATIONS,
+            repeat=3,
+            ))
+        print(f"{typeof.__name__.ljust(20)} :: {format((elapsed / ITERATIONS) * 1e6, '.2f')} us / round-trip")
+
+
+# Entry point.
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,14 @@
+import fakeredis
+
+from stests.core.cache.model import BarrierKey
+from stests.core.cache.ops import utils
+
+
+
+def test_01():
+    """Test barrier arrival is idempotent."""
+    store = fakeredis.FakeStrictRedis(server=fakeredis.FakeServer())
+    key = lambda member: BarrierKey(["net", "WG-100", "R-001", "phase-barrier"], ["P-01"], member, 60)
+    assert utils._barrier_arrive(store, key("2")) == (True, ["2"])
+    assert utils._barrier_arrive(store, key("1")) == (True, ["1", "2"])
+    assert utils._barrier_arrive(store, key("2")) == (False, ["1", "2"])
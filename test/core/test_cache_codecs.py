@@ -0,0 +1,24 @@
+import json
+
+import pytest
+
+from stests.core.cache import codecs
+from stests.core.utils import encoder
+from test.core import utils_factory as factory
+
+
+
+@pytest.mark.parametrize("codec_type", list(codecs.CODECS))
+def test_01(codec_type, monkeypatch):
+    """Test round-trip over a tagged entry."""
+    monkeypatch.setattr(codecs.EnvVars, "TYPE", codec_type)
+    obj = encoder.encode(factory.create_execution_context())
+    as_bytes = codecs.encode(obj)
+    assert as_bytes[:2] == codecs.TAG_MARKER + codecs.CODECS[codec_type].TAG
+    assert codecs.decode(as_bytes) == obj
+
+
+def test_02():
+    """Test decoding of a legacy (untagged) JSON entry."""
+    obj = encoder.encode(factory.create_execution_context())
+    assert codecs.decode(json.dumps(obj, indent=4).encode("utf-8")) == obj
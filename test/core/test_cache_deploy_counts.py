@@ -0,0 +1,77 @@
+import dataclasses
+
+import fakeredis
+import pytest
+
+from stests.core import cache
+from stests.core.cache import stores
+from stests.core.cache.stores import stub
+from stests.core.types.orchestration import ExecutionAspect
+from stests.core.utils import encoder
+from test.core import utils_factory as factory
+
+
+
+@pytest.fixture
+def transactions(monkeypatch) -> list:
+    """Returns (is transactional, commands) of each pipeline executed against a stub store."""
+    monkeypatch.setattr(stores.EnvVars, "TYPE", "STUB")
+    monkeypatch.setattr(stub, "_SERVERS", dict())
+    monkeypatch.setattr(encoder, "IS_INITIALISED", True)
+
+    transactions = []
+    get_pipeline = fakeredis.FakeStrictRedis.pipeline
+    def _get_pipeline(self, *args, **kwargs):
+        pipeline = get_pipeline(self, *args, **kwargs)
+        execute = pipeline.execute
+        def _execute(*args, **kwargs):
+            transactions.append((pipeline.transaction, [i[0][0] for i in pipeline.command_stack]))
+            return execute(*args, **kwargs)
+        pipeline.execute = _execute
+        return pipeline
+    monkeypatch.setattr(fakeredis.FakeStrictRedis, "pipeline", _get_pipeline)
+
+    return transactions
+
+
+def _get_counts(ctx):
+    return tuple(
+        cache.orchestration.get_deploy_count(ctx, aspect)
+        for aspect in (ExecutionAspect.RUN, ExecutionAspect.PHASE, ExecutionAspect.STEP)
+    )
+
+
+def test_01(transactions):
+    """Test run, phase & step deploy counts are incremented within a single transaction & returned in order."""
+    ctx = factory.create_execution_context()
+    assert cache.orchestration.increment_deploy_counts(ctx, 2) == [2, 2, 2]
+    assert transactions == [(True, ["INCRBY", "INCRBY", "INCRBY"])]
+
+    ctx_next_step = dataclasses.replace(ctx, step_index=ctx.step_index + 1)
+    assert cache.orchestration.increment_deploy_counts(ctx_next_step) == [3, 3, 1]
+
+    ctx_next_phase = dataclasses.replace(ctx, phase_index=ctx.phase_index + 1)
+    assert cache.orchestration.increment_deploy_counts(ctx_next_phase, 4) == [7, 4, 4]
+    assert _get_counts(ctx) == (7, 3, 2)
+    assert len(transactions) == 3
+
+
+def test_02(transactions):
+    """Test bulk increments are applied within a single transaction & returned per increment."""
+    ctx = factory.create_execution_context()
+    ctx_next_step = dataclasses.replace(ctx, step_index=ctx.step_index + 1)
+    increments = [(ctx, 1)] * 4 + [(ctx_next_step, 3)]
+
+    assert cache.orchestration.increment_deploy_counts_bulk(increments) == [
+        (1, 1, 1),
+        (2, 2, 2),
+        (3, 3, 3),
+        (4, 4, 4),
+        (7, 7, 3),
+    ]
+    assert transactions == [(True, ["INCRBY"] * 15)]
+    assert _get_counts(ctx) == (7, 7, 4)
+    assert _get_counts(ctx_next_step) == (7, 7, 3)
+
+    assert cache.orchestration.increment_deploy_counts_bulk([]) == []
+    assert len(transactions) == 1
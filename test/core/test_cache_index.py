@@ -0,0 +1,73 @@
+import dataclasses
+import typing
+
+import fakeredis
+import pytest
+
+from stests.core import cache
+from stests.core.cache import stores
+from stests.core.cache.model import IndexKeyBatch
+from stests.core.cache.model import StorePartition
+from stests.core.cache.ops import utils
+from stests.core.cache.ops.state import COL_DEPLOY_INDEX
+from stests.core.cache.stores import stub
+from stests.core.utils import encoder
+from test.core import utils_factory as factory
+
+
+
+@pytest.fixture
+def store(monkeypatch):
+    """Returns state partition of a stub store."""
+    monkeypatch.setattr(stores.EnvVars, "TYPE", "STUB")
+    monkeypatch.setattr(stub, "_SERVERS", dict())
+    monkeypatch.setattr(encoder, "IS_INITIALISED", True)
+
+    return stores.get_store(StorePartition.STATE)
+
+
+def _get_index(store) -> typing.List[bytes]:
+    return sorted(i for key in store.scan_iter(match=f"*{COL_DEPLOY_INDEX}") for i in store.hkeys(key))
+
+
+def test_01():
+    """Test multi-get via a secondary index."""
+    store = fakeredis.FakeStrictRedis(server=fakeredis.FakeServer())
+    store.hset("net:deploy-index", mapping={"abc": "net:deploy:abc", "def": "net:deploy:def"})
+    store.set("net:deploy:abc", b'"abc"')
+    key = IndexKeyBatch(["net", "deploy-index"], ["abc", "def", "xyz"])
+    assert utils._get_many_from_index(store, key) == ["abc", None, None]
+    assert store.hkeys("net:deploy-index") == [b"abc"]
+
+
+def test_02(store):
+    """Test deploy is resolved by hash via index & filtered by run."""
+    deploy = factory.create_deploy()
+    ctx = factory.create_execution_context()
+    cache.state.set_deploy(deploy)
+    assert cache.state.get_deploy_on_finalisation(deploy.network, deploy.deploy_hash) == deploy
+    assert cache.state.get_deploy(ctx, deploy.deploy_hash) == deploy
+    assert cache.state.get_deploy(dataclasses.replace(ctx, run_index=2), deploy.deploy_hash) is None
+    assert cache.state.get_deploy(ctx, "ff" * 32) is None
+
+
+def test_03(store):
+    """Test index entries pointing to expired deploys are removed upon resolution."""
+    deploy = factory.create_deploy()
+    store.delete(cache.state.set_deploy(deploy))
+    assert _get_index(store) == [deploy.deploy_hash.encode()]
+    assert cache.state.get_deploy_on_finalisation(deploy.network, deploy.deploy_hash) is None
+    assert _get_index(store) == []
+
+
+def test_04(store):
+    """Test index entries of a run's deploys are pruned upon run completion."""
+    deploy = factory.create_deploy()
+    deploy_next_run = dataclasses.replace(deploy, deploy_hash="ff" * 32, run_index=2)
+    cache.state.set_deploy(deploy)
+    cache.state.set_deploy(deploy_next_run)
+
+    cache.state.prune_on_run_completion(factory.create_execution_context())
+    assert _get_index(store) == [deploy_next_run.deploy_hash.encode()]
+    assert cache.state.get_deploy_on_finalisation(deploy.network, deploy.deploy_hash) is None
+    assert cache.state.get_deploy_on_finalisation(deploy.network, deploy_next_run.deploy_hash) == deploy_next_run
@@ -0,0 +1,77 @@
+import fakeredis
+import pytest
+
+from stests.core.cache import stores
+from stests.core.cache.model import StorePartition
+from stests.core.cache.stores import redis as redis_store
+
+
+
+@pytest.fixture(autouse=True)
+def pools(monkeypatch) -> dict:
+    """Returns map of pools instantiated by test - each pool is backed by an in-memory server."""
+    pools = dict()
+    monkeypatch.setattr(redis_store, "_POOLS", pools)
+    monkeypatch.setattr(redis_store, "_metrics_hook", None)
+    monkeypatch.setattr(redis_store, "_metrics_ts", 0.0)
+
+    server = fakeredis.FakeServer()
+    get_pool = redis_store.get_pool
+    def _get_pool(partition_type):
+        pool = get_pool(partition_type)
+        pool.connection_class = fakeredis.FakeRedisConnection
+        pool.connection_kwargs["server"] = server
+        return pool
+    monkeypatch.setattr(redis_store, "get_pool", _get_pool)
+
+    return pools
+
+
+def test_01(monkeypatch):
+    """Test a single pool is instantiated per process & partition."""
+    pool = redis_store.get_pool(StorePartition.INFRA)
+    assert redis_store.get_pool(StorePartition.INFRA) is pool
+    assert redis_store.get_store(StorePartition.INFRA).connection_pool is pool
+    assert redis_store.get_pool(StorePartition.STATE) is not pool
+    assert pool.connection_kwargs["db"] == redis_store.EnvVars.DB
+    assert redis_store.get_pool(StorePartition.STATE).connection_kwargs["db"] == \
+        redis_store.EnvVars.DB + redis_store.PARTITION_OFFSETS[StorePartition.STATE]
+
+    # Forked process.
+    monkeypatch.setattr(redis_store.os, "getpid", lambda: -1)
+    assert redis_store.get_pool(StorePartition.INFRA) is not pool
+
+
+def test_02(monkeypatch, pools):
+    """Test pool metrics reflect utilisation of current process's pools only."""
+    store = redis_store.get_store(StorePartition.INFRA)
+    store.set("a", 1)
+    assert int(store.get("a")) == 1
+    with monkeypatch.context() as m:
+        m.setattr(redis_store.os, "getpid", lambda: -1)
+        redis_store.get_pool(StorePartition.STATE)
+
+    assert len(pools) == 2
+    assert stores.get_pool_metrics() == {
+        StorePartition.INFRA.name: {
+            "created": 1,
+            "in_use": 0,
+            "available": 1,
+            "max": redis_store.EnvVars.POOL_SIZE,
+        }
+    }
+
+
+def test_03(monkeypatch):
+    """Test metrics hook is invoked at most once per reporting interval."""
+    reported = []
+    stores.set_metrics_hook(reported.append)
+    for _ in range(3):
+        redis_store.get_store(StorePartition.INFRA).ping()
+    assert len(reported) == 1
+    assert reported[0] == dict()
+
+    monkeypatch.setattr(redis_store, "_METRICS_INTERVAL", 0.0)
+    redis_store.get_store(StorePartition.INFRA)
+    assert len(reported) == 2
+    assert reported[1][StorePartition.INFRA.name]["created"] == 1
@@ -0,0 +1,80 @@
+import fakeredis
+import pytest
+
+from stests.core.cache.model import TrackerKey
+from stests.core.cache.ops import utils
+
+
+
+@pytest.fixture
+def store():
+    return fakeredis.FakeStrictRedis(server=fakeredis.FakeServer())
+
+
+def _get_key(member: str = None, count: int = None, outcome: str = None) -> TrackerKey:
+    return TrackerKey(["net", "WG-100", "R-001", "step-tracker"], ["P-01", "S-01"], member=member, count=count, outcome=outcome)
+
+
+def test_01(store):
+    """Test untracked step."""
+    assert utils._tracker_get(store, _get_key()) == (None, [])
+    assert utils._tracker_get_count(store, _get_key()) == (None, 0)
+    assert utils._tracker_remove(store, _get_key("abc")) == (False, None, 0)
+    assert utils._tracker_set_member(store, _get_key("abc")) is False
+    assert utils._tracker_close(store, _get_key(outcome="timed-out")) is None
+    assert utils._tracker_get(store, _get_key()) == (None, [])
+
+
+def test_02(store):
+    """Test step completion once every dispatched deploy is removed."""
+    utils._tracker_set(store, _get_key(count=2))
+    utils._tracker_set_member(store, _get_key("abc"))
+    utils._tracker_set_member(store, _get_key("def"))
+    assert utils._tracker_get(store, _get_key()) == (0, ["abc", "def"])
+    assert utils._tracker_remove(store, _get_key("abc")) == (True, 0, 1)
+    assert utils._tracker_remove(store, _get_key("def")) == (True, 0, 0)
+
+
+def test_03(store):
+    """Test duplicate removal of a deploy."""
+    utils._tracker_set(store, _get_key(count=2))
+    utils._tracker_set_member(store, _get_key("abc"))
+    assert utils._tracker_remove(store, _get_key("abc")) == (True, 1, 0)
+    assert utils._tracker_remove(store, _get_key("abc")) == (False, 1, 0)
+    assert utils._tracker_get_count(store, _get_key()) == (1, 0)
+
+
+def test_04(store):
+    """Test batch removal of deploys."""
+    utils._tracker_set(store, _get_key(count=3))
+    for member in ("abc", "def", "ghi"):
+        utils._tracker_set_member(store, _get_key(member))
+    key = _get_key()
+    key.members = ["abc", "abc", "def", "xyz"]
+    assert utils._tracker_remove_many(store, key) == ([True, False, True, False], 0, 1)
+
+
+def test_05(store):
+    """Test closed tracker ignores late registrations & finalisations."""
+    utils._tracker_set(store, _get_key(count=3))
+    utils._tracker_set_member(store, _get_key("abc"))
+    utils._tracker_set_member(store, _get_key("def"))
+    assert utils._tracker_close(store, _get_key(outcome="timed-out")) == (1, ["abc", "def"])
+    assert utils._tracker_close(store, _get_key(outcome="complete")) is None
+    assert utils._tracker_get_count(store, _get_key()) == (0, 0)
+    assert utils._tracker_set_member(store, _get_key("ghi")) is False
+    assert utils._tracker_remove(store, _get_key("abc")) == (False, 0, 0)
+    key = _get_key()
+    key.members = ["def", "ghi"]
+    assert utils._tracker_remove_many(store, key) == ([False, False], 0, 0)
+    assert utils._tracker_get(store, _get_key()) == (0, [])
+
+
+def test_06(store):
+    """Test tracker is closed exactly once upon completion."""
+    utils._tracker_set(store, _get_key(count=1))
+    utils._tracker_set_member(store, _get_key("abc"))
+    assert utils._tracker_remove(store, _get_key("abc")) == (True, 0, 0)
+    assert utils._tracker_close(store, _get_key(outcome="complete")) == (0, [])
+    assert utils._tracker_close(store, _get_key(outcome="timed-out")) is None
+    assert utils._tracker_remove(store, _get_key("abc")) == (False, 0, 0)
@@ -18,6 +18,7 @@ FIXTURES = {
     'get_key_pair',
     'get_key_pair_from_pvk_pem_file',
     'get_pvk_pem_file_from_bytes',
+    'get_signature',
 }
 
 
@@ -71,3 +72,33 @@ def test_04(algo):
     account_key = crypto.get_account_key(algo, pbk)
     assert isinstance(account_key, str)
     assert len(account_key) == 64
+
+
+@pytest.mark.parametrize("algo", list(crypto.KeyAlgorithm))
+def test_05(algo):
+    """Test function: crypto.get_signature."""
+    pvk, _ = crypto.get_key_pair(algo, crypto.KeyEncoding.BYTES)
+    msg = crypto.get_hash(b"a message to be signed")
+
+    sig = crypto.get_signature(msg, pvk, algo)
+    assert isinstance(sig, bytes)
+    assert len(sig) == 64
+    assert sig == crypto.get_signature(msg, pvk, algo)
+
+
+@pytest.mark.parametrize("algo", list(crypto.KeyAlgorithm))
+def test_06(algo):
+    """Test function: crypto.get_pvk_pem_file_from_cache."""
+    pvk, pbk = crypto.get_key_pair(algo, crypto.KeyEncoding.BYTES)
+    account_hash = crypto.get_account_hash_from_public_key(algo, pbk.hex())
+    scope = crypto.get_key_scope("test-net", "WG-000", 1)
+
+    with crypto.get_pvk_pem_file_from_cache(account_hash, pvk, algo, scope) as fpath:
+        with crypto.get_pvk_pem_file_from_cache(account_hash, pvk, algo, scope) as fpath1:
+            assert fpath == fpath1
+        crypto.delete_pvk_pem_files(scope)
+        assert pathlib.Path(fpath).exists()
+        assert crypto.get_key_pair_from_pvk_pem_file(fpath, algo, crypto.KeyEncoding.BYTES) == (pvk, pbk)
+
+    crypto.delete_pvk_pem_files(scope)
+    assert not pathlib.Path(fpath).exists()
@@ -0,0 +1,116 @@
+import time
+
+import pytest
+
+from stests.core import cache
+from stests.core.mq import encoder
+from stests.core.types.orchestration import ExecutionStatus
+from test.core import utils_factory as factory
+
+
+
+@pytest.fixture(autouse=True)
+def refreshed(monkeypatch):
+    refreshed = []
+    monkeypatch.setattr(encoder, "_REFRESHED", dict())
+    monkeypatch.setattr(encoder, "_set_context_expiration", lambda *key: refreshed.append(key))
+
+    return refreshed
+
+
+def _get_message_data(ctx, options=None):
+    return {
+        "queue_name": "q",
+        "actor_name": "do_step",
+        "args": (ctx, 1),
+        "kwargs": {},
+        "options": options or {},
+    }
+
+
+def test_01(monkeypatch):
+    """Test round-trip of a context passed by value."""
+    monkeypatch.setattr(encoder.EnvVars, "CONTEXT_MODE", "VALUE")
+    ctx = factory.create_execution_context()
+    encoder.register_context(ctx)
+    assert encoder.decode(encoder.encode(_get_message_data(ctx)))["args"] == [ctx, 1]
+
+
+def test_02(monkeypatch):
+    """Test round-trip of a context passed by reference."""
+    monkeypatch.setattr(encoder.EnvVars, "CONTEXT_MODE", "REFERENCE")
+    ctx = factory.create_execution_context()
+    encoder.register_context(ctx)
+    ctx.phase_index, ctx.step_index, ctx.step_label, ctx.status = 2, 3, "transfer", ExecutionStatus.ERROR
+    as_bytes = encoder.encode(_get_message_data(ctx))
+    assert b"_ctx_ref" in as_bytes
+    assert encoder.decode(as_bytes)["args"] == [ctx, 1]
+
+
+def test_03(monkeypatch):
+    """Test reference is substantially smaller than value."""
+    ctx = factory.create_execution_context()
+    encoder.register_context(ctx)
+    monkeypatch.setattr(encoder.EnvVars, "CONTEXT_MODE", "VALUE")
+    by_value = encoder.encode(_get_message_data(ctx))
+    monkeypatch.setattr(encoder.EnvVars, "CONTEXT_MODE", "REFERENCE")
+    by_reference = encoder.encode(_get_message_data(ctx))
+    assert len(by_reference) * 2 < len(by_value)
+
+
+def test_04(monkeypatch):
+    """Test unregistered contexts, e.g. those of a next loop, are passed by value."""
+    monkeypatch.setattr(encoder.EnvVars, "CONTEXT_MODE", "REFERENCE")
+    ctx = factory.create_execution_context()
+    ctx.run_index = 999
+    as_bytes = encoder.encode(_get_message_data(ctx))
+    assert b"_ctx_ref" not in as_bytes
+    assert encoder.decode(as_bytes)["args"] == [ctx, 1]
+
+
+def test_05(monkeypatch):
+    """Test long delayed messages carry contexts by value."""
+    monkeypatch.setattr(encoder.EnvVars, "CONTEXT_MODE", "REFERENCE")
+    ctx = factory.create_execution_context()
+    encoder.register_context(ctx)
+    eta = int(time.time() * 1000)
+    assert b"_ctx_ref" in encoder.encode(_get_message_data(ctx, {"eta": eta + 60 * 1000}))
+    assert b"_ctx_ref" not in encoder.encode(_get_message_data(ctx, {"eta": eta + 7200 * 1000}))
+
+
+def test_06(monkeypatch, refreshed):
+    """Test cache expiration of a referenced context is periodically reset."""
+    monkeypatch.setattr(encoder.EnvVars, "CONTEXT_MODE", "REFERENCE")
+    ctx = factory.create_execution_context()
+    encoder.register_context(ctx)
+    for _ in range(3):
+        encoder.decode(encoder.encode(_get_message_data(ctx)))
+    assert refreshed == [(ctx.network, ctx.run_type, ctx.run_index)]
+    monkeypatch.setattr(encoder, "_REFRESH_INTERVAL", 0.0)
+    encoder.decode(encoder.encode(_get_message_data(ctx)))
+    assert len(refreshed) == 3
+
+
+def test_07(monkeypatch):
+    """Test references resolve to context of same run rather than that of a previous run with same index."""
+    monkeypatch.setattr(encoder.EnvVars, "CONTEXT_MODE", "REFERENCE")
+    ctx_previous = factory.create_execution_context()
+    ctx = factory.create_execution_context()
+    monkeypatch.setattr(cache.orchestration, "get_context", lambda network, run_index, run_type: ctx)
+
+    # Sender holds current run whilst receiver still holds previous run.
+    encoder.register_context(ctx)
+    as_bytes = encoder.encode(_get_message_data(ctx))
+    assert b"_ctx_ref" in as_bytes
+    encoder.register_context(ctx_previous)
+    assert encoder.decode(as_bytes)["args"] == [ctx, 1]
+
+    # Reference to a previous run no longer resolves.
+    encoder.register_context(ctx_previous)
+    as_bytes = encoder.encode(_get_message_data(ctx_previous))
+    encoder.register_context(ctx)
+    with pytest.raises(ValueError):
+        encoder.decode(as_bytes)
+
+    # Contexts not matching that registered are passed by value.
+    assert b"_ctx_ref" not in encoder.encode(_get_message_data(ctx_previous))
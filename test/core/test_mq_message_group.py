@@ -0,0 +1,80 @@
+import dramatiq
+from dramatiq.brokers.stub import StubBroker
+from dramatiq.middleware import GroupCallbacks
+from dramatiq.rate_limits.backends import StubBackend
+
+from stests.core.mq.extensions import MessageGroup
+
+
+
+def _get_broker():
+    broker = StubBroker(middleware=[GroupCallbacks(StubBackend())])
+    processed = []
+
+    @dramatiq.actor(broker=broker, queue_name="q")
+    def on_message(i):
+        processed.append(i)
+
+    @dramatiq.actor(broker=broker, queue_name="q")
+    def on_complete():
+        processed.append("complete")
+
+    return broker, on_message, on_complete, processed
+
+
+def _process(broker):
+    worker = dramatiq.Worker(broker, worker_timeout=50)
+    worker.start()
+    broker.join("q")
+    worker.join()
+    worker.stop()
+
+
+def test_01():
+    """Test group streams messages lazily & fires completion callback once."""
+    broker, on_message, on_complete, processed = _get_broker()
+    yielded = []
+    def _args():
+        for i in range(2500):
+            yielded.append(i)
+            yield (i, )
+
+    group = MessageGroup(on_message, _args(), 2500, broker=broker, chunk_size=100)
+    group.add_completion_callback(on_complete.message())
+    assert yielded == []
+    assert group.run() == 2500
+
+    _process(broker)
+    assert sorted(i for i in processed if i != "complete") == list(range(2500))
+    assert processed.count("complete") == 1
+
+
+def test_02():
+    """Test group releases completion barrier when fewer messages are yielded than expected."""
+    broker, on_message, on_complete, processed = _get_broker()
+    group = MessageGroup(on_message, iter([(1, ), (2, )]), 5, broker=broker)
+    group.add_completion_callback(on_complete.message())
+    assert group.run() == 2
+
+    _process(broker)
+    assert processed.count("complete") == 1
+
+
+def test_03():
+    """Test group schedules messages at evenly spaced intervals."""
+    broker, on_message, _, _ = _get_broker()
+    MessageGroup(on_message, ((i, ) for i in range(100)), 100, broker=broker).run(dispatch_interval=10)
+    etas = sorted(dramatiq.Message.decode(i).options["eta"] for i in broker.queues["q.DQ"].queue)
+    assert len(etas) == 99
+    assert 970 <= etas[-1] - etas[0] <= 1000
+
+
+def test_04():
+    """Test group completion barrier honours middleware barrier TTL where configured."""
+    broker, on_message, on_complete, _ = _get_broker()
+    middleware = broker.middleware[-1]
+    group = MessageGroup(on_message, iter([]), 1, broker=broker)
+    assert group._create_completion_barrier().ttl == 86400 * 1000
+
+    middleware.barrier_ttl = 5000
+    assert group._create_completion_barrier().ttl == 5000
@@ -0,0 +1,77 @@
+import types
+
+import pytest
+
+from stests.core.orchestration.model import Workflow
+from stests.core.orchestration.model import WORKFLOWS
+from test.core import utils_factory as factory
+
+
+
+def test_01():
+    """Test workflows are memoised per run type."""
+    ctx = factory.create_execution_context()
+    assert Workflow.create(ctx) is Workflow.create(ctx)
+    assert Workflow.get_phase_step(ctx, 1, 1) is Workflow.get_phase_step(ctx, 1, 1)
+
+
+def test_02():
+    """Test last phase & step flags."""
+    for run_type in WORKFLOWS:
+        ctx = factory.create_execution_context()
+        ctx.run_type = run_type
+        wflow = Workflow.create(ctx)
+        assert [i.is_last for i in wflow.phases] == [False] * (len(wflow.phases) - 1) + [True]
+        for phase in wflow.phases:
+            assert [i.is_last for i in phase.steps] == [False] * (len(phase.steps) - 1) + [True]
+
+
+def test_03():
+    """Test step execution state is held apart from shared step definition."""
+    ctx = factory.create_execution_context()
+    step = Workflow.get_phase_step(ctx, 1, 1)
+    outcome = step.execute(None)
+    assert outcome.step is step
+    assert outcome.error is not None
+    assert not hasattr(step, "error") and not hasattr(step, "result")
+
+
+def _get_meta(*phases):
+    return types.SimpleNamespace(PHASES=phases)
+
+
+def _get_step(label: str):
+    step = types.ModuleType(label)
+    step.LABEL = label
+    step.execute = lambda ctx: None
+
+    return step
+
+
+def test_04():
+    """Test sequential phase steps each depend upon prior step."""
+    s1, s2, s3 = _get_step("s1"), _get_step("s2"), _get_step("s3")
+    phase = Workflow(_get_meta((s1, s2, s3))).get_phase(1)
+    assert not phase.is_concurrent
+    assert [i.label for i in phase.get_ready_steps(set())] == ["s1"]
+    assert [i.label for i in phase.get_ready_steps({1})] == ["s2"]
+
+
+def test_05():
+    """Test concurrent phase steps are ready once declared dependencies are complete."""
+    s1, s2, s3, s4 = _get_step("s1"), _get_step("s2"), _get_step("s3"), _get_step("s4")
+    phase = Workflow(_get_meta({s1: (), s2: (), s3: (s1, ), s4: (s2, s3)})).get_phase(1)
+    assert phase.is_concurrent
+    assert not any(i.is_last for i in phase.steps)
+    assert [i.label for i in phase.get_ready_steps(set())] == ["s1", "s2"]
+    assert [i.label for i in phase.get_ready_steps({1})] == ["s2", "s3"]
+    assert [i.label for i in phase.get_ready_steps({1, 3})] == ["s2"]
+    assert [i.label for i in phase.get_ready_steps({1, 2, 3})] == ["s4"]
+    assert phase.get_ready_steps({1, 2, 3, 4}) == []
+
+
+def test_06():
+    """Test concurrent phase steps may only depend upon previously declared steps."""
+    s1, s2 = _get_step("s1"), _get_step("s2")
+    with pytest.raises(ValueError):
+        Workflow(_get_meta({s1: (s2, ), s2: ()}))
@@ -0,0 +1,87 @@
+import collections
+import dataclasses
+import types
+
+import pytest
+
+from stests.core.cache import stores
+from stests.core.cache.stores import stub
+from stests.core.orchestration import model
+from stests.core.orchestration import phase
+from stests.core.orchestration import step
+from stests.core.orchestration.model import Workflow
+from stests.core.utils import encoder
+from test.core import utils_factory as factory
+
+
+
+class _Broker():
+    """Delivers messages in order of dispatch, each passed a copy of its context as if sent over wire."""
+
+    def __init__(self, monkeypatch, redeliver: bool):
+        self.ended = []
+        self.messages = collections.deque()
+        self.redeliver = redeliver
+        for actor in (step.do_step, step.do_step_verification, step.on_step_end, phase.do_phase):
+            monkeypatch.setattr(actor, "send", self._get_send(actor))
+        monkeypatch.setattr(phase.on_phase_end, "send", self.ended.append)
+        monkeypatch.setattr(step.on_step_error, "send", lambda ctx, err: pytest.fail(err))
+
+    def _get_send(self, actor):
+        def _send(ctx):
+            for _ in range(2 if self.redeliver else 1):
+                self.messages.append((actor, dataclasses.replace(ctx)))
+        return _send
+
+    def run(self):
+        while self.messages:
+            actor, ctx = self.messages.popleft()
+            actor.fn(ctx)
+
+
+@pytest.fixture
+def executed(monkeypatch) -> list:
+    """Returns labels of executed steps - workflow is a single concurrent phase within a stub store."""
+    monkeypatch.setattr(stores.EnvVars, "TYPE", "STUB")
+    monkeypatch.setattr(stub, "_SERVERS", dict())
+    monkeypatch.setattr(encoder, "IS_INITIALISED", True)
+
+    executed = []
+    def _get_step(label: str):
+        module = types.ModuleType(label)
+        module.LABEL = label
+        module.execute = lambda ctx: executed.append(label)
+        return module
+
+    a, b, c, d = [_get_step(i) for i in ("a", "b", "c", "d")]
+    wflow = Workflow(types.SimpleNamespace(PHASES=({a: (), b: (), c: (a, ), d: (b, c)}, )))
+    monkeypatch.setitem(model._REGISTRY, factory.create_execution_context().run_type, wflow)
+
+    return executed
+
+
+def _run_phase(monkeypatch, redeliver: bool = False) -> _Broker:
+    broker = _Broker(monkeypatch, redeliver)
+    ctx = factory.create_execution_context()
+    ctx.phase_index, ctx.step_index = 0, 0
+    phase.do_phase.send(ctx)
+    broker.run()
+
+    return broker
+
+
+def test_01(monkeypatch, executed):
+    """Test steps start once their dependencies complete & phase ends once all steps complete."""
+    broker = _run_phase(monkeypatch)
+    assert sorted(executed[:2]) == ["a", "b"]
+    assert executed[2:] == ["c", "d"]
+    assert len(broker.ended) == 1
+    assert broker.ended[0].phase_index == 1
+
+
+def test_02(monkeypatch, executed):
+    """Test redelivered messages neither restart steps nor re-end phase."""
+    broker = _run_phase(monkeypatch, redeliver=True)
+    assert sorted(executed) == ["a", "b", "c", "d"]
+    assert executed[-1] == "d"
+    assert len(broker.ended) == 1
@@ -0,0 +1,24 @@
+from stests.core.utils import histogram
+
+
+
+def test_01():
+    """Test histogram bucketing precision."""
+    assert histogram.get_bucket(0.05) == 50
+    assert histogram.get_bucket(0.255) == 255
+    for value in (0.001, 1.5, 12.3456, 33.3, 600.0, 86400.0):
+        assert 0 <= value - histogram.get_bucket(value) / 1000 <= value * 0.01 + 0.001
+
+
+def test_02():
+    """Test histogram percentiles."""
+    buckets = {}
+    for value in range(1, 101):
+        bucket = histogram.get_bucket(float(value))
+        buckets[bucket] = buckets.get(bucket, 0) + 1
+    assert histogram.get_count(buckets) == 100
+
+    percentiles = histogram.get_percentiles(buckets)
+    for pct, expected in ((50, 50), (90, 90), (99, 99)):
+        assert 0 <= expected - percentiles[pct] <= expected * 0.01
+    assert histogram.get_percentiles({}) == {50: None, 90: None, 99: None}
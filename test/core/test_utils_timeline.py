@@ -0,0 +1,19 @@
+from stests.core.utils import timeline
+
+
+
+def test_01():
+    """Test timeline slotting."""
+    assert timeline.get_slot(100.0) == 1000
+    assert timeline.get_slot(100.09) == 1000
+    assert timeline.get_slot(100.1) == 1001
+
+
+def test_02():
+    """Test timeline rate."""
+    slots = {}
+    for i in range(500):
+        slot = timeline.get_slot(1000.0 + i / 50)
+        slots[slot] = slots.get(slot, 0) + 1
+    assert abs(timeline.get_rate(slots) - 50) <= 50 * 0.02
+    assert timeline.get_rate({}) is None
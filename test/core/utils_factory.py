@@ -44,20 +44,20 @@ def create_block() -> types.chain.Block:
 def create_block_statistics() -> types.chain.BlockStatistics:
     return factory.create_block_statistics_on_addition(
         block_hash="9dbc064574aafcba8cadbd20aa6ef5b396e64ba970d829c188734ac09ae34f64",
+        block_hash_parent="5dd3b5e1d3c2ad1ee6c2ec1c6ef0f4bc2dbe3f21ff02d24dd9b74c8cbcbe2e73",
         chain_name="main",
         deploy_cost_total=int(1e7),
         deploy_count=1,
         deploy_gas_price_avg=10,
         era_id=42,
-        j_rank=1,
-        m_rank=1,
-        magic_bit=1,
-        message_role="a-role",
+        height=1,
+        is_switch_block=False,
         network="lrt1",
-        round_id=12,
         size_bytes=int(1e8),
+        state_root_hash="2b3b8d9a3c5b2bb1a1ce8ee8b4c2f0d9b3ebf6ec4e7f30d3d0ac4fd3b8d2a1ef",
+        status=types.chain.BlockStatus.FINALIZED,
         timestamp=dt.utcnow().timestamp(),
-        validator_id="dca0025bfb03f7be74c47371ca74883b47587f3630becb0e7b46b7c9ae6e8500",
+        proposer="dca0025bfb03f7be74c47371ca74883b47587f3630becb0e7b46b7c9ae6e8500",
     )
 
 
@@ -84,10 +84,7 @@ def create_named_key() -> types.chain.NamedKey:
 
 
 def create_network() -> types.infra.Network:
-    return factory.create_network(
-        f"{types.infra.NetworkType.LOC.name}-{str(1).zfill(2)}",
-        types.infra.NetworkType.LOC.name
-    )
+    return factory.create_network("lrt1", "casper-lrt1")
 
 
 def create_network_id() -> types.infra.NetworkIdentifier:
@@ -96,6 +93,7 @@ def create_network_id() -> types.infra.NetworkIdentifier:
 
 def create_node() -> types.infra.Node:
     return factory.create_node(
+        group=random.choice(list(types.infra.NodeGroup)),
         host="localhost",
         index=1,
         network_id=create_network_id(),
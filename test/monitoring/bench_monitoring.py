@@ -0,0 +1,226 @@
+import argparse
+import contextlib
+import os
+import statistics
+import tempfile
+import threading
+import time
+from datetime import datetime
+
+# N.B. benchmark runs against in-memory cache & broker - set prior to importing stests.
+os.environ.setdefault("STESTS_CACHE_TYPE", "STUB")
+os.environ.setdefault("STESTS_BROKER_TYPE", "STUB")
+
+from stests import chain
+from stests.chain import stream_events_replay
+from stests.core import cache
+from stests.core import factory
+from stests.core import mq
+from stests.core.types.infra import NodeGroup
+from stests.core.types.infra import NodeType
+
+
+
+# CLI argument parser.
+ARGS = argparse.ArgumentParser("Benchmarks monitoring throughput by replaying a recorded (or synthetic) event stream.")
+
+# CLI argument: recording.
+ARGS.add_argument(
+    "--in",
+    default=None,
+    dest="fpath",
+    help="Path to a recorded event stream - if omitted a synthetic stream is generated.",
+    type=str,
+    )
+
+# CLI argument: number of monitored nodes.
+ARGS.add_argument(
+    "--nodes",
+    default=5,
+    dest="nodes",
+    help="Number of monitored nodes, each of which streams the full recording.",
+    type=int,
+    )
+
+# CLI argument: replay speed.
+ARGS.add_argument(
+    "--speed",
+    default=0.0,
+    dest="speed",
+    help="Replay speed multiplier, e.g. 1 | 10 - 0 replays at maximum speed.",
+    type=float,
+    )
+
+# CLI argument: synthetic stream - number of blocks.
+ARGS.add_argument(
+    "--blocks",
+    default=50,
+    dest="blocks",
+    help="Synthetic stream: number of blocks.",
+    type=int,
+    )
+
+# CLI argument: synthetic stream - number of deploys per block.
+ARGS.add_argument(
+    "--deploys",
+    default=100,
+    dest="deploys",
+    help="Synthetic stream: number of deploys per block.",
+    type=int,
+    )
+
+# CLI argument: synthetic stream - number of validators.
+ARGS.add_argument(
+    "--validators",
+    default=10,
+    dest="validators",
+    help="Synthetic stream: number of finality signatures per block.",
+    type=int,
+    )
+
+# CLI argument: timeout.
+ARGS.add_argument(
+    "--timeout",
+    default=300.0,
+    dest="timeout",
+    help="Time (seconds) after which benchmark is abandoned.",
+    type=float,
+    )
+
+
+class _Correlator():
+    """Stands in for correlation actor dispatch - processes inline & times processing.
+
+    """
+    def __init__(self, actor, latencies):
+        self.actor = actor
+        self.latencies = latencies
+
+    def send(self, info, *args):
+        self.actor.fn(info, *args)
+        self.latencies.append((datetime.utcnow() - info.event_timestamp).total_seconds())
+
+
+def main(args):
+    """Entry point - renders monitoring throughput & correlation latency.
+
+    """
+    with tempfile.TemporaryDirectory() as dpath:
+        fpath = args.fpath
+        if fpath is None:
+            fpath = os.path.join(dpath, "events.jsonl.gz")
+            stream_events_replay.write(fpath, _get_synthetic_events(args.blocks, args.deploys, args.validators))
+        events = stream_events_replay.read(fpath)
+
+    # Start replay server.
+    server = stream_events_replay.ReplayServer(events, args.speed)
+    port = server.start()
+
+    # Register network & nodes.
+    mq.initialise()
+    network = factory.create_network("lrt1", "casper-lrt1")
+    cache.infra.set_network(network)
+    network_id = factory.create_network_id(network.name_raw)
+    nodes = [
+        factory.create_node(NodeGroup.UNKNOWN, "127.0.0.1", i, network_id, port, port, port, NodeType.VALIDATOR)
+        for i in range(1, args.nodes + 1)
+    ]
+    for node in nodes:
+        cache.infra.set_node(node)
+
+    # JIT import listener - requires initialised broker.
+    # N.B. correlation mode is set via MONITORING_CORRELATION_MODE.
+    from stests.monitoring import listener
+    latencies = []
+    for event_type, actor in listener._ACTORS.items():
+        listener._ACTORS[event_type] = _Correlator(actor, latencies)
+
+    # Count events flowing through listener.
+    expected = args.nodes * len([i for i in events if "ApiVersion" not in i["data"]])
+    delivered = []
+    def _on_node_event(node, info, payload):
+        listener._on_node_event(node, info, payload)
+        delivered.append(1)
+
+    # Replay - stream client & server run until process exit.
+    started = time.monotonic()
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        threading.Thread(
+            target=chain.stream_events_multiplexed,
+            args=(nodes, _on_node_event),
+            daemon=True,
+            ).start()
+        while len(delivered) < expected and time.monotonic() - started < args.timeout:
+            time.sleep(0.01)
+    elapsed = time.monotonic() - started
+
+    print(f"{'events'.ljust(20)} :: {len(delivered)} / {expected}")
+    print(f"{'elapsed'.ljust(20)} :: {format(elapsed, '.2f')} s")
+    print(f"{'throughput'.ljust(20)} :: {format(len(delivered) / elapsed, '.0f')} events / s")
+    print(f"{'events correlated'.ljust(20)} :: {len(latencies)}")
+    if latencies:
+        latencies = sorted(latencies)
+        for label, pct in (("p50", 0.5), ("p90", 0.9), ("p99", 0.99)):
+            latency = latencies[min(len(latencies) - 1, int(len(latencies) * pct))]
+            print(f"{f'latency {label}'.ljust(20)} :: {format(latency * 1000, '.1f')} ms")
+        print(f"{'latency mean'.ljust(20)} :: {format(statistics.mean(latencies) * 1000, '.1f')} ms")
+
+
+def _get_synthetic_events(blocks: int, deploys: int, validators: int) -> list:
+    """Returns a synthetic event stream: per block - block added, deploys processed & finality signatures.
+
+    """
+    events = []
+    for height in range(1, blocks + 1):
+        block_hash = f"{height:064x}"
+        deploy_hashes = [f"{height:032x}{i:032x}" for i in range(deploys)]
+        offset = float(height)
+        timestamp = datetime.utcnow().isoformat(timespec="milliseconds") + "Z"
+        for data in [
+            {"BlockAdded": {
+                "block_hash": block_hash,
+                "block": {
+                    "hash": block_hash,
+                    "header": {
+                        "parent_hash": f"{height - 1:064x}",
+                        "state_root_hash": f"{height:064x}",
+                        "era_id": 1,
+                        "height": height,
+                        "era_end": None,
+                        "timestamp": timestamp,
+                    },
+                    "body": {
+                        "proposer": f"01{1:064x}",
+                        "deploy_hashes": deploy_hashes,
+                        "transfer_hashes": [],
+                    },
+                },
+            }},
+        ] + [
+            {"DeployProcessed": {
+                "deploy_hash": i,
+                "account": f"01{1:064x}",
+                "timestamp": timestamp,
+                "ttl": "1h",
+                "dependencies": [],
+                "block_hash": block_hash,
+                "execution_result": {"Success": {"cost": "10000"}},
+            }}
+            for i in deploy_hashes
+        ] + [
+            {"FinalitySignature": {
+                "block_hash": block_hash,
+                "era_id": 1,
+                "signature": f"01{i:0128x}",
+                "public_key": f"01{i:064x}",
+            }}
+            for i in range(validators)
+        ]:
+            events.append({"offset": offset, "id": len(events) + 1, "data": data})
+
+    return events
+
+
+# Entry point.
+if __name__ == '__main__':
+    main(ARGS.parse_args())
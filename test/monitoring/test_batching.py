@@ -0,0 +1,56 @@
+import pytest
+
+from stests.monitoring import batching
+from test.core import utils_factory as factory
+
+
+
+def _patch(monkeypatch, batch_size: int) -> list:
+    dispatched = []
+    monkeypatch.setattr(batching.EnvVars, "BATCH_SIZE", batch_size)
+    monkeypatch.setattr(batching, "_dispatch_one", lambda *args: dispatched.append([args[1:]]))
+    monkeypatch.setattr(batching, "_dispatch_many", lambda ctx, finalized: dispatched.append(finalized))
+
+    return dispatched
+
+
+def test_01(monkeypatch):
+    """Test correlated deploys are dispatched singly when batching is disabled."""
+    dispatched = _patch(monkeypatch, 1)
+    ctx, node_id = factory.create_execution_context(), factory.create_node_id()
+    with batching.batch():
+        for i in range(3):
+            batching.enqueue(ctx, node_id, "aa", str(i))
+        assert len(dispatched) == 3
+
+
+def test_02(monkeypatch):
+    """Test correlated deploys are dispatched per step in chunks upon exiting batch scope."""
+    dispatched = _patch(monkeypatch, 2)
+    ctx, node_id = factory.create_execution_context(), factory.create_node_id()
+    ctx_next_step = factory.create_execution_context()
+    ctx_next_step.step_index += 1
+    with batching.batch():
+        batching.enqueue(ctx, node_id, "aa", "1")
+        batching.enqueue(ctx_next_step, node_id, "aa", "2")
+        batching.enqueue(ctx, node_id, "aa", "3")
+        batching.enqueue(ctx, node_id, "aa", "4")
+        assert dispatched == []
+    assert dispatched == [
+        [(node_id, "aa", "1"), (node_id, "aa", "3")],
+        [(node_id, "aa", "4")],
+        [(node_id, "aa", "2")],
+    ]
+
+
+def test_03(monkeypatch):
+    """Test correlated deploys are dispatched upon error within, and singly outside of, batch scope."""
+    dispatched = _patch(monkeypatch, 2)
+    ctx, node_id = factory.create_execution_context(), factory.create_node_id()
+    with pytest.raises(ValueError):
+        with batching.batch():
+            batching.enqueue(ctx, node_id, "aa", "1")
+            raise ValueError()
+    assert dispatched == [[(node_id, "aa", "1")]]
+    batching.enqueue(ctx, node_id, "aa", "2")
+    assert dispatched[1:] == [[(node_id, "aa", "2")]]
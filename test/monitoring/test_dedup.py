@@ -0,0 +1,31 @@
+from stests.core import factory
+from stests.core.types.infra import NodeGroup
+from stests.core.types.infra import NodeType
+from stests.events import EventType
+from stests.monitoring import dedup
+
+
+
+def _get_event_info(node_index: int, block_hash: str):
+    node = factory.create_node(
+        NodeGroup.UNKNOWN, "localhost", node_index, factory.create_network_id("lrt1"), 8888, 7777, 9999, NodeType.VALIDATOR
+        )
+
+    return factory.create_node_event_info(node, 1, EventType.MONIT_CONSENSUS_FINALITY_SIGNATURE, block_hash)
+
+
+def test_01():
+    """Test in-process dedup of equivalent events streamed from different nodes."""
+    assert dedup.is_duplicate(_get_event_info(1, "aa")) == False
+    assert dedup.is_duplicate(_get_event_info(2, "aa")) == True
+    assert dedup.is_duplicate(_get_event_info(2, "bb")) == False
+
+
+def test_02():
+    """Test in-process dedup window rotation."""
+    dedup.is_duplicate(_get_event_info(1, "cc"))
+    dedup._current_ts -= dedup._WINDOW
+    assert dedup.is_duplicate(_get_event_info(2, "cc")) == True
+    dedup._current_ts -= dedup._WINDOW
+    dedup.is_duplicate(_get_event_info(1, "dd"))
+    assert dedup.is_duplicate(_get_event_info(2, "cc")) == False
@@ -0,0 +1,116 @@
+import pytest
+
+from stests.core import cache
+from stests.core import factory
+from stests.core.cache import stores
+from stests.core.cache.stores import stub
+from stests.core.types.chain import DeployStatus
+from stests.events import EventType
+from stests.monitoring import batching
+from stests.monitoring.on_deploy_processed import on_block_added
+from stests.monitoring.on_deploy_processed import on_deploy_processed
+from stests.core.utils import encoder
+from test.core import utils_factory
+
+
+
+# Hash of finalised block.
+_BLOCK_HASH = "9dbc064574aafcba8cadbd20aa6ef5b396e64ba970d829c188734ac09ae34f64"
+
+# Execution result carried by a DeployProcessed event.
+_EXECUTION_RESULT = {"Success": {"cost": "0"}}
+
+
+@pytest.fixture
+def correlated(monkeypatch) -> list:
+    """Returns deploys enqueued for orchestration - node, deploy & cache state are encached in a stub store."""
+    monkeypatch.setattr(stores.EnvVars, "TYPE", "STUB")
+    monkeypatch.setattr(stub, "_SERVERS", dict())
+    monkeypatch.setattr(encoder, "IS_INITIALISED", True)
+    correlated = []
+    monkeypatch.setattr(batching.EnvVars, "BATCH_SIZE", 1)
+    monkeypatch.setattr(batching, "_dispatch_one", lambda ctx, node_id, block_hash, deploy_hash: correlated.append(deploy_hash))
+
+    cache.infra.set_network(utils_factory.create_network())
+    cache.infra.set_node(utils_factory.create_node())
+    cache.state.set_deploy(utils_factory.create_deploy())
+
+    return correlated
+
+
+def _get_info(event_type: EventType, deploy_hash: str = None):
+    return factory.create_node_event_info(utils_factory.create_node(), 1, event_type, _BLOCK_HASH, deploy_hash)
+
+
+def _get_block(*deploy_hashes: str) -> dict:
+    return {
+        "hash": _BLOCK_HASH,
+        "header": {
+            "era_end": None,
+            "era_id": 42,
+            "height": 1,
+            "parent_hash": "5dd3b5e1d3c2ad1ee6c2ec1c6ef0f4bc2dbe3f21ff02d24dd9b74c8cbcbe2e73",
+            "state_root_hash": "2b3b8d9a3c5b2bb1a1ce8ee8b4c2f0d9b3ebf6ec4e7f30d3d0ac4fd3b8d2a1ef",
+            "timestamp": "2021-01-01T00:00:00.000Z",
+        },
+        "body": {
+            "deploy_hashes": [],
+            "proposer": "dca0025bfb03f7be74c47371ca74883b47587f3630becb0e7b46b7c9ae6e8500",
+            "transfer_hashes": list(deploy_hashes),
+        },
+    }
+
+
+def _process_deploy(deploy_hash: str):
+    on_deploy_processed.fn(_get_info(EventType.MONIT_DEPLOY_PROCESSED, deploy_hash), _EXECUTION_RESULT)
+
+
+def _add_block(*deploy_hashes: str):
+    on_block_added.fn(_get_info(EventType.MONIT_BLOCK_ADDED), _get_block(*deploy_hashes))
+
+
+def _assert_finalised(deploy_hash: str):
+    deploy = cache.state.get_deploy_on_finalisation(utils_factory.create_network().name, deploy_hash)
+    assert deploy.status == DeployStatus.ADDED
+    assert deploy.block_hash == _BLOCK_HASH
+
+
+def test_01(correlated):
+    """Test deploy processed prior to block addition is correlated upon block addition."""
+    deploy_hash = utils_factory.create_deploy().deploy_hash
+    _process_deploy(deploy_hash)
+    assert correlated == []
+    _add_block(deploy_hash)
+    assert correlated == [deploy_hash]
+    _assert_finalised(deploy_hash)
+
+
+def test_02(correlated):
+    """Test deploy processed subsequent to block addition is correlated upon processing."""
+    deploy_hash = utils_factory.create_deploy().deploy_hash
+    _add_block(deploy_hash)
+    assert correlated == []
+    _process_deploy(deploy_hash)
+    assert correlated == [deploy_hash]
+    _assert_finalised(deploy_hash)
+
+
+def test_03(correlated, monkeypatch):
+    """Test deploy is correlated exactly once when block addition races deploy processing."""
+    deploy_hash = utils_factory.create_deploy().deploy_hash
+    get_block_added = cache.monitoring.get_block_added
+
+    # Block is added whilst deploy processing is in flight, i.e. after it is encached but before block is read.
+    def _get_block_added_after_addition(*args):
+        _add_block(deploy_hash)
+        return get_block_added(*args)
+
+    monkeypatch.setattr(cache.monitoring, "get_block_added", _get_block_added_after_addition)
+    _process_deploy(deploy_hash)
+    assert correlated == [deploy_hash]
+
+    # Duplicate events are ignored.
+    monkeypatch.setattr(cache.monitoring, "get_block_added", get_block_added)
+    _process_deploy(deploy_hash)
+    _add_block(deploy_hash)
+    assert correlated == [deploy_hash]
@@ -0,0 +1,36 @@
+from stests.core import factory
+from stests.core.types.infra import NodeGroup
+from stests.core.types.infra import NodeType
+from stests.monitoring import sharding
+
+
+
+def _get_assignments(shard_ids):
+    network_id = factory.create_network_id("lrt1")
+    nodes = [
+        factory.create_node(NodeGroup.UNKNOWN, "localhost", i, network_id, 8888, 7777, 9999, NodeType.VALIDATOR)
+        for i in range(1, 201)
+    ]
+
+    return {
+        node.index: shard_id
+        for shard_id in shard_ids
+        for node in sharding.get_assigned_nodes(nodes, shard_ids, shard_id)
+    }
+
+
+def test_01():
+    """Test every node is assigned to exactly one shard."""
+    assignments = _get_assignments(["A", "B", "C"])
+    assert len(assignments) == 200
+    assert set(assignments.values()) == {"A", "B", "C"}
+
+
+def test_02():
+    """Test only nodes of a departed or joining shard are rebalanced."""
+    before = _get_assignments(["A", "B", "C"])
+    after = _get_assignments(["A", "B"])
+    assert all(after[i] == before[i] for i in before if before[i] != "C")
+
+    after = _get_assignments(["A", "B", "C", "D"])
+    assert all(after[i] == before[i] for i in before if after[i] != "D")
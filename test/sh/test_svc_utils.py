@@ -0,0 +1,63 @@
+import subprocess
+import time
+import types
+
+from sh.scripts import svc_utils
+
+
+
+def _get_nodes(count):
+    return [types.SimpleNamespace(index=i, host=f"127.0.0.{i}") for i in range(1, count + 1)]
+
+
+def _invoke(node):
+    subprocess.run(["sh", "-c", f"sleep 0.2; test {node.index} -ne 3"], check=True)
+
+
+def test_01():
+    """Test fan-out executes concurrently & collects per node results."""
+    started = time.monotonic()
+    results = svc_utils.run_on_nodes(_get_nodes(8), _invoke, parallelism=8)
+    assert time.monotonic() - started < 1.0
+    assert [i.node.index for i in results] == list(range(1, 9))
+    assert [i.index for i in (j.node for j in results if not j.ok)] == [3]
+    assert "CalledProcessError" in results[2].error
+    assert all(i.elapsed >= 0.2 for i in results)
+
+
+def test_02():
+    """Test fan-out respects parallelism limit."""
+    started = time.monotonic()
+    results = svc_utils.run_on_nodes(_get_nodes(4), lambda node: subprocess.run(["sleep", "0.2"], check=True), parallelism=2)
+    assert time.monotonic() - started >= 0.4
+    assert all(i.ok for i in results)
+
+
+def test_03():
+    """Test rolling mode halts upon a failed batch."""
+    results = svc_utils.run_on_nodes(_get_nodes(6), _invoke, batch_size=2)
+    assert [i.ok for i in results] == [True, True, False, True, False, False]
+    assert [i.error for i in results[4:]] == ["skipped", "skipped"]
+
+
+def test_04():
+    """Test rolling mode health gate."""
+    checks = []
+    def _health_check(node):
+        checks.append(node.index)
+        return node.index != 2 or checks.count(2) > 1
+
+    results = svc_utils.run_on_nodes(_get_nodes(4), lambda node: None, batch_size=2, health_check=_health_check, health_interval=0.01)
+    assert all(i.ok for i in results)
+    assert checks.count(2) == 2
+
+    results = svc_utils.run_on_nodes(_get_nodes(4), lambda node: None, batch_size=2, health_check=lambda node: node.index != 1, health_timeout=0.05, health_interval=0.01)
+    assert [i.ok for i in results] == [False, True, False, False]
+    assert results[0].error.startswith("unhealthy")
+
+
+def test_05():
+    """Test ssh invocations are multiplexed."""
+    args = list(svc_utils.yield_ssh_mux_args())
+    assert "ControlMaster=auto" in args
+    assert any(i.startswith("ControlPath=") for i in args)